@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Integrity manifest of the issue archive (content/issues).
+
+Records the size, modification time and sha256 of every file in the archive
+(scans, born-digital PDFs, PostScript/XPS sources, transcripts, issue.md and
+the current issues' sources) in content/issues/.manifest.json, or
+$BANKS_MANIFEST. Updates only re-hash files whose size or mtime changed;
+hashing runs on a thread pool with large chunked reads (hashlib releases the
+GIL while it digests a chunk, so threads hash several files at once).
+
+The manifest is also the change-detection source for the other incremental
+stages: file_digests() returns the digests of any set of files, re-hashing
+only the ones that changed since they were last recorded, so build.py's
+cache key, the preview renderer and the PDF optimizer no longer read every
+input in full on every run.
+
+Usage:
+    python3 archive_manifest.py update       # record changes; report duplicates and missing references
+    python3 archive_manifest.py verify       # re-hash everything and report files that changed unnoticed
+    python3 archive_manifest.py duplicates   # files stored more than once
+    python3 archive_manifest.py missing      # issue.md files naming a PDF or source that is not there
+"""
+
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from export_website import hash_file
+from generate_articles import read_article_header
+from generate_newspaper import write_text_atomic
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ISSUES_DIR = SCRIPT_DIR.parents[1]
+DEFAULT_MANIFEST = Path(os.environ.get('BANKS_MANIFEST', ISSUES_DIR / '.manifest.json'))
+
+# Bump when the file format changes so every file is re-hashed
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 1 << 20
+
+# Coarsest file timestamp granularity to allow for (FAT keeps 2 seconds). A
+# file whose mtime is this close to when it was hashed could be rewritten in
+# the same tick without its size or mtime changing, so like git's "racily
+# clean" index entries it is marked racy and re-hashed on the next refresh.
+RACY_WINDOW_NS = 2 * 10 ** 9
+
+SKIP_DIRS = {'__pycache__', '.git', 'node_modules', '.build-cache', '.asset-store'}
+SKIP_SUFFIXES = {'.pyc', '.tmp'}
+
+# Keys under print: in issue.md front matter that name a file next to it
+REFERENCE_KEYS = ('pdf', 'pdf_scan', 'source')
+
+
+def iter_files(root):
+    """Yield every file under root that belongs in the manifest"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            # Manifests (and their temporary files) never describe themselves
+            if name.startswith('.manifest') or path.suffix in SKIP_SUFFIXES or path.is_symlink():
+                continue
+            yield path
+
+
+def hash_paths(paths, jobs=None):
+    """{path: sha256} for paths, hashed on a thread pool"""
+    paths = list(paths)
+    if len(paths) <= 1:
+        return {path: hash_file(path, CHUNK_SIZE) for path in paths}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return dict(zip(paths, executor.map(lambda path: hash_file(path, CHUNK_SIZE), paths)))
+
+
+class Manifest:
+    """{path relative to root: {'size', 'mtime_ns', 'sha256'[, 'racy']}} for the files under root"""
+
+    def __init__(self, path=DEFAULT_MANIFEST, root=ISSUES_DIR):
+        self.path = Path(path)
+        self.root = Path(root).resolve()
+        self.files = {}
+        self.dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == MANIFEST_VERSION:
+                self.files = data.get('files', {})
+
+    def save(self):
+        if self.dirty:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            data = {'version': MANIFEST_VERSION, 'files': dict(sorted(self.files.items()))}
+            write_text_atomic(self.path, json.dumps(data, indent=1) + '\n')
+            self.dirty = False
+
+    def relative(self, path):
+        """path relative to the root, or None if it is outside it"""
+        try:
+            return Path(path).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def refresh(self, paths=None, jobs=None):
+        """Re-hash the files among paths whose size or mtime changed; returns (added, changed, removed)
+
+        With paths None every file under the root is checked, and entries
+        for files that no longer exist are dropped. Files outside the root
+        are ignored.
+        """
+        if paths is None:
+            paths = iter_files(self.root)
+            removed = set(self.files)
+        else:
+            removed = set()
+        # Files are hashed after this; any mtime not older than it (less the window) is racy
+        started_ns = time.time_ns()
+        stats, to_hash = {}, []
+        for path in paths:
+            rel = self.relative(path)
+            if rel is None:
+                continue
+            removed.discard(rel)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                if rel in self.files:
+                    removed.add(rel)
+                continue
+            stats[rel] = (st.st_size, st.st_mtime_ns)
+            entry = self.files.get(rel)
+            if entry is None or entry.get('racy') or (entry['size'], entry['mtime_ns']) != stats[rel]:
+                to_hash.append(Path(path))
+
+        added, changed = [], []
+        for path, digest in hash_paths(to_hash, jobs).items():
+            rel = self.relative(path)
+            size, mtime_ns = stats[rel]
+            previous = self.files.get(rel)
+            if previous is None:
+                added.append(rel)
+            elif previous['sha256'] != digest:
+                changed.append(rel)
+            self.files[rel] = {'size': size, 'mtime_ns': mtime_ns, 'sha256': digest}
+            if mtime_ns >= started_ns - RACY_WINDOW_NS:
+                self.files[rel]['racy'] = True
+            self.dirty = True
+
+        for rel in removed:
+            if self.files.pop(rel, None) is not None:
+                self.dirty = True
+        return sorted(added), sorted(changed), sorted(removed)
+
+    def digest(self, path):
+        """Recorded sha256 of a file under the root (call refresh first), or None"""
+        entry = self.files.get(self.relative(path))
+        return entry['sha256'] if entry else None
+
+    def verify(self, jobs=None):
+        """Re-hash every recorded file; returns (corrupted, modified, missing)
+
+        corrupted files still have their recorded size and mtime but not
+        their recorded content, which an edit would not leave behind.
+        """
+        present, missing = {}, []
+        for rel, entry in self.files.items():
+            path = self.root / rel
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                missing.append(rel)
+                continue
+            present[path] = (rel, entry, (st.st_size, st.st_mtime_ns))
+
+        corrupted, modified = [], []
+        for path, digest in hash_paths(present, jobs).items():
+            rel, entry, stat_key = present[path]
+            if digest == entry['sha256']:
+                continue
+            if stat_key == (entry['size'], entry['mtime_ns']) and not entry.get('racy'):
+                corrupted.append(rel)
+            else:
+                modified.append(rel)
+        return sorted(corrupted), sorted(modified), sorted(missing)
+
+    def duplicates(self):
+        """{sha256: [paths]} for non-empty content recorded under more than one path"""
+        by_digest = defaultdict(list)
+        for rel, entry in self.files.items():
+            if entry['size']:
+                by_digest[entry['sha256']].append(rel)
+        return {digest: sorted(paths) for digest, paths in by_digest.items() if len(paths) > 1}
+
+    def missing_references(self):
+        """[(issue.md path, key, file name)] for print files named in issue.md front matter but not recorded"""
+        missing = []
+        for rel in sorted(self.files):
+            if Path(rel).name != 'issue.md':
+                continue
+            try:
+                header = read_article_header(self.root / rel)
+            except Exception as e:
+                missing.append((rel, 'front matter', str(e)))
+                continue
+            print_info = header.get('print') or {}
+            if not isinstance(print_info, dict):
+                continue
+            for key in REFERENCE_KEYS:
+                name = print_info.get(key)
+                if name and (Path(rel).parent / str(name)).as_posix() not in self.files:
+                    missing.append((rel, key, str(name)))
+        return missing
+
+
+def file_digests(paths, manifest_path=DEFAULT_MANIFEST, root=ISSUES_DIR, jobs=None):
+    """{path: sha256} for paths, re-hashing only files changed since the manifest recorded them
+
+    Files outside root are hashed every time. The manifest is updated with
+    whatever was re-hashed.
+    """
+    paths = [Path(p) for p in paths]
+    manifest = Manifest(manifest_path, root)
+    manifest.refresh(paths, jobs)
+    try:
+        manifest.save()
+    except OSError:
+        # A read-only checkout still gets correct digests, just without the cache
+        pass
+    digests = {path: manifest.digest(path) for path in paths}
+    outside = [path for path, digest in digests.items() if digest is None]
+    digests.update(hash_paths(outside, jobs))
+    return digests
+
+
+def format_size(num_bytes):
+    for unit in ('B', 'K', 'M', 'G'):
+        if num_bytes < 1024 or unit == 'G':
+            return f'{num_bytes:.0f}{unit}' if unit == 'B' else f'{num_bytes:.1f}{unit}'
+        num_bytes /= 1024
+
+
+def print_duplicates(manifest):
+    duplicates = manifest.duplicates()
+    for digest, paths in sorted(duplicates.items(), key=lambda item: -len(item[1])):
+        print(f"{digest[:12]}  {len(paths)} copies, {format_size(manifest.files[paths[0]]['size'])} each")
+        for path in paths:
+            print(f"    {path}")
+    print(f"{len(duplicates)} file(s) stored more than once")
+    return duplicates
+
+
+def print_missing(manifest):
+    missing = manifest.missing_references()
+    for issue_md, key, name in missing:
+        print(f"✗ {issue_md}: print.{key} names {name}, which is not in the archive")
+    return missing
+
+
+def main():
+    """Main function to maintain the archive manifest."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Hash the issue archive and check it for damage and gaps')
+    parser.add_argument('--manifest', default=str(DEFAULT_MANIFEST),
+                        help='Manifest file (default: $BANKS_MANIFEST or content/issues/.manifest.json)')
+    parser.add_argument('--root', default=str(ISSUES_DIR), help='Archive root (default: content/issues)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Hashing threads (default: Python\'s default)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('update', help='Record new and changed files, then report duplicates and missing files')
+    subparsers.add_parser('verify', help='Re-hash every recorded file and report unexpected changes')
+    subparsers.add_parser('duplicates', help='List files stored more than once')
+    subparsers.add_parser('missing', help='List files named in issue.md that are not in the archive')
+
+    args = parser.parse_args()
+    manifest = Manifest(args.manifest, args.root)
+
+    if args.command == 'update':
+        start = time.perf_counter()
+        known = len(manifest.files)
+        added, changed, removed = manifest.refresh(jobs=args.jobs)
+        manifest.save()
+        elapsed = time.perf_counter() - start
+        for label, paths in (('+', added), ('~', changed), ('-', removed)):
+            for path in paths:
+                print(f"  {label} {path}")
+        total = sum(entry['size'] for entry in manifest.files.values())
+        print(f"✓ {len(manifest.files)} files ({format_size(total)}) in {elapsed:.2f}s: "
+              f"{len(added)} added, {len(changed)} changed, {len(removed)} removed"
+              f"{'' if known else ' (first run, everything hashed)'}\n")
+        print_duplicates(manifest)
+        print_missing(manifest)
+
+    elif args.command == 'verify':
+        if not manifest.files:
+            print(f"✗ No manifest at {args.manifest}; run update first")
+            sys.exit(1)
+        corrupted, modified, missing = manifest.verify(args.jobs)
+        for path in corrupted:
+            print(f"✗ {path} changed without its size or mtime changing (corrupted?)")
+        for path in modified:
+            print(f"  ~ {path} was modified since the manifest was updated")
+        for path in missing:
+            print(f"  - {path} is gone")
+        if corrupted:
+            sys.exit(1)
+        print(f"✓ {len(manifest.files) - len(missing)} files checked, none corrupted")
+
+    elif args.command == 'duplicates':
+        manifest.refresh(jobs=args.jobs)
+        manifest.save()
+        print_duplicates(manifest)
+
+    elif args.command == 'missing':
+        manifest.refresh(jobs=args.jobs)
+        manifest.save()
+        missing = print_missing(manifest)
+        if missing:
+            sys.exit(1)
+        print("✓ Every file named in issue.md is present")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Shared on-disk artifact cache for the Banks generator.
+
+Artifacts (rendered article fragments, compiled PDFs, ...) are stored by
+namespace and key, where the key is a hash of everything that produced the
+artifact. The local-directory backend can point at a shared mount so several
+editors and CI reuse each other's work:
+
+    BANKS_CACHE_DIR=/mnt/shared/banks-cache make online
+
+Writes are published atomically (temp file + rename), every entry carries a
+checksum that is verified on read (corrupt entries are dropped and count as
+misses), and the store is trimmed least-recently-used first when it grows
+past BANKS_CACHE_MAX_SIZE (e.g. "2G"). Pruning also compacts the hit/miss
+log into per-namespace totals once it grows past a megabyte.
+
+Usage:
+    python3 artifact_store.py stats
+    python3 artifact_store.py prune --max-size 500M
+"""
+
+import abc
+import hashlib
+import os
+import socket
+import time
+from collections import defaultdict
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = SCRIPT_DIR / '.build-cache'
+
+MAGIC = b'BANKSART1'
+HEADER_SIZE = len(MAGIC) + 1 + 64 + 1  # magic, space, sha256 hex, newline
+CHUNK_SIZE = 1 << 16
+
+# With a size limit, puts keep a running total of the store's size and only
+# prune once it passes the limit, down to this fraction of it so the next few
+# puts do not prune again. Other writers sharing the directory make the total
+# drift, so it is recounted from disk every RESCAN_INTERVAL puts.
+PRUNE_LOW_WATER = 0.9
+RESCAN_INTERVAL = 256
+
+# prune() folds stats.log into one total per namespace and event past this size
+STATS_LOG_MAX_BYTES = 1 << 20
+
+SIZE_UNITS = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+
+def parse_size(value):
+    """Parse sizes such as "500M" or "2G" into bytes"""
+    value = str(value).strip().upper().rstrip('B')
+    unit = value[-1] if value and value[-1] in SIZE_UNITS else ''
+    number = value[:-1] if unit else value
+    return int(float(number) * SIZE_UNITS[unit])
+
+
+def format_size(num_bytes):
+    for unit in ('B', 'K', 'M', 'G'):
+        if num_bytes < 1024 or unit == 'G':
+            return f'{num_bytes:.0f}{unit}' if unit == 'B' else f'{num_bytes:.1f}{unit}'
+        num_bytes /= 1024
+
+
+class ArtifactStore(abc.ABC):
+    """Interface every cache backend implements"""
+
+    @abc.abstractmethod
+    def get_bytes(self, namespace, key):
+        """Return the stored bytes, or None on a miss"""
+
+    @abc.abstractmethod
+    def get_file(self, namespace, key, dest):
+        """Copy the artifact to dest; returns True on a hit"""
+
+    @abc.abstractmethod
+    def put_bytes(self, namespace, key, data):
+        """Store data under namespace/key, replacing any previous artifact"""
+
+    @abc.abstractmethod
+    def put_file(self, namespace, key, path):
+        """Store the file's contents under namespace/key"""
+
+    def get_text(self, namespace, key):
+        data = self.get_bytes(namespace, key)
+        return None if data is None else data.decode('utf-8')
+
+    def put_text(self, namespace, key, text):
+        self.put_bytes(namespace, key, text.encode('utf-8'))
+
+
+class LocalStore(ArtifactStore):
+    """Artifact store in a local directory (which may be a shared mount)
+
+    Layout: <root>/objects/<namespace>/<key[:2]>/<key>, each file holding a
+    one-line header with the payload's sha256 followed by the payload.
+    Hits bump the file's mtime, which eviction uses as the LRU clock.
+    Hits, misses and writes are appended to <root>/stats.log.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        # Running size of the store for max_bytes (None until counted) and puts since it was counted
+        self._size = None
+        self._puts = 0
+
+    def __getstate__(self):
+        return {'root': self.root, 'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state['root'], state['max_bytes'])
+
+    def path_for(self, namespace, key):
+        return self.root / 'objects' / namespace / key[:2] / key
+
+    # -- reading -----------------------------------------------------------
+
+    def _open_verified(self, path):
+        """Yield payload chunks of a stored file, raising ValueError if it is corrupt"""
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE or not header.startswith(MAGIC + b' '):
+                raise ValueError('bad header')
+            expected = header[len(MAGIC) + 1:-1].decode('ascii')
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+                yield chunk
+            if digest.hexdigest() != expected:
+                raise ValueError('checksum mismatch')
+
+    def _hit(self, namespace, path, size):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._record(namespace, 'hit', size)
+
+    def _drop_corrupt(self, namespace, path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        self._record(namespace, 'corrupt', 0)
+
+    def _read(self, namespace, path, consume):
+        """Pass the verified payload of path to consume chunk by chunk; returns its size, or None on a miss
+
+        Only a bad header or checksum means the entry is damaged and drops it.
+        Any other error reading it (permissions, I/O on a shared mount) is a
+        miss that leaves it in place, and errors raised by consume propagate.
+        """
+        chunks = self._open_verified(path)
+        size = 0
+        while True:
+            try:
+                chunk = next(chunks, None)
+            except ValueError:
+                self._drop_corrupt(namespace, path)
+                self._record(namespace, 'miss', 0)
+                return None
+            except OSError:
+                self._record(namespace, 'miss', 0)
+                return None
+            if chunk is None:
+                return size
+            consume(chunk)
+            size += len(chunk)
+
+    def get_bytes(self, namespace, key):
+        path = self.path_for(namespace, key)
+        parts = []
+        size = self._read(namespace, path, parts.append)
+        if size is None:
+            return None
+        self._hit(namespace, path, size)
+        return b''.join(parts)
+
+    def get_file(self, namespace, key, dest):
+        path = self.path_for(namespace, key)
+        dest = Path(dest)
+        tmp = dest.with_name(f'.{dest.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as out:
+                size = self._read(namespace, path, out.write)
+            if size is not None:
+                os.replace(tmp, dest)
+        finally:
+            tmp.unlink(missing_ok=True)
+        if size is None:
+            return False
+        self._hit(namespace, path, size)
+        return True
+
+    # -- writing -----------------------------------------------------------
+
+    def _publish(self, namespace, key, chunks):
+        path = self.path_for(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'.{key}.{socket.gethostname()}.{os.getpid()}.tmp')
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            with open(tmp, 'wb') as f:
+                f.write(b'\0' * HEADER_SIZE)
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+                f.seek(0)
+                f.write(MAGIC + b' ' + digest.hexdigest().encode('ascii') + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._record(namespace, 'put', size)
+        if self.max_bytes:
+            self._grow(HEADER_SIZE + size - replaced)
+
+    def _grow(self, delta):
+        """Add a put to the running size and prune once the store is over max_bytes"""
+        self._puts += 1
+        if self._size is None or self._puts >= RESCAN_INTERVAL:
+            self._size = sum(e[2] for e in self.entries())
+            self._puts = 0
+        else:
+            self._size += delta
+        if self._size > self.max_bytes:
+            self.prune(int(self.max_bytes * PRUNE_LOW_WATER))
+
+    def put_bytes(self, namespace, key, data):
+        self._publish(namespace, key, [data])
+
+    def put_file(self, namespace, key, path):
+        with open(path, 'rb') as f:
+            self._publish(namespace, key, iter(lambda: f.read(CHUNK_SIZE), b''))
+
+    # -- maintenance -------------------------------------------------------
+
+    def entries(self):
+        """(namespace, path, size, mtime) for every stored artifact"""
+        objects = self.root / 'objects'
+        if not objects.is_dir():
+            return []
+        result = []
+        for namespace_dir in objects.iterdir():
+            for path in namespace_dir.glob('*/*'):
+                if path.name.startswith('.'):
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                result.append((namespace_dir.name, path, st.st_size, st.st_mtime))
+        return result
+
+    def prune(self, max_bytes):
+        """Delete least recently used artifacts until the store fits in max_bytes; returns (removed, size)
+
+        Also compacts the stats log once it is over STATS_LOG_MAX_BYTES.
+        """
+        entries = sorted(self.entries(), key=lambda e: e[3])
+        total = sum(e[2] for e in entries)
+        removed = 0
+        for namespace, path, size, _ in entries:
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            self._record(namespace, 'evict', size)
+        self._size = total
+        self._puts = 0
+        if self.stats_offset()[1] > STATS_LOG_MAX_BYTES:
+            self.compact_stats()
+        return removed, total
+
+    def _record(self, namespace, event, size):
+        """Append one event to the shared stats log (best effort)"""
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            line = f'{time.time():.0f} {namespace} {event} {size}\n'.encode()
+            fd = os.open(self.root / 'stats.log', os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o664)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    def compact_stats(self):
+        """Replace the stats log with one '<time> <namespace> <event> <bytes> <count>' total per event"""
+        log_path = self.root / 'stats.log'
+        totals = defaultdict(lambda: [0, 0])
+        try:
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) in (4, 5) and all(p.isdigit() for p in parts[3:]):
+                        total = totals[parts[1], parts[2]]
+                        total[0] += int(parts[3])
+                        total[1] += int(parts[4]) if len(parts) == 5 else 1
+            now = f'{time.time():.0f}'
+            lines = ''.join(f'{now} {namespace} {event} {size} {count}\n'
+                            for (namespace, event), (size, count) in sorted(totals.items()))
+            tmp = log_path.with_name(f'.stats.log.{socket.gethostname()}.{os.getpid()}.tmp')
+            tmp.write_text(lines, encoding='utf-8')
+            # Events appended by other processes while this ran are lost; the log is best effort
+            os.replace(tmp, log_path)
+        except OSError:
+            pass
+
+    def stats_offset(self):
+        """Current position in the stats log; pass to read_stats to count only later events"""
+        try:
+            st = (self.root / 'stats.log').stat()
+        except OSError:
+            return (None, 0)
+        return (st.st_ino, st.st_size)
+
+    def read_stats(self, offset=None):
+        """Per-namespace event counts from the stats log (only events after stats_offset's offset)
+
+        If the log was compacted since the offset was taken, the events folded
+        into its totals cannot be told apart and only later ones are counted.
+        """
+        counts = defaultdict(lambda: defaultdict(int))
+        log_path = self.root / 'stats.log'
+        try:
+            f = open(log_path, 'r', encoding='utf-8', errors='replace')
+        except OSError:
+            return counts
+        with f:
+            inode, position = offset or (None, 0)
+            compacted = inode is not None and os.fstat(f.fileno()).st_ino != inode
+            if offset and not compacted:
+                f.seek(position)
+            for line in f:
+                parts = line.split()
+                if len(parts) == 4:
+                    counts[parts[1]][parts[2]] += 1
+                elif len(parts) == 5 and not offset and parts[4].isdigit():
+                    counts[parts[1]][parts[2]] += int(parts[4])
+        return counts
+
+
+STORE_BACKENDS = {
+    'local': LocalStore,
+}
+
+
+def open_store(location=None, backend=None, max_bytes=None):
+    """Open the configured store (BANKS_CACHE_BACKEND, BANKS_CACHE_DIR, BANKS_CACHE_MAX_SIZE)"""
+    backend = backend or os.environ.get('BANKS_CACHE_BACKEND', 'local')
+    location = location or os.environ.get('BANKS_CACHE_DIR') or DEFAULT_CACHE_DIR
+    if max_bytes is None and os.environ.get('BANKS_CACHE_MAX_SIZE'):
+        max_bytes = parse_size(os.environ['BANKS_CACHE_MAX_SIZE'])
+    if backend not in STORE_BACKENDS:
+        raise ValueError(f"Unknown cache backend '{backend}' (available: {', '.join(STORE_BACKENDS)})")
+    return STORE_BACKENDS[backend](location, max_bytes=max_bytes)
+
+
+def print_stats(store):
+    counts = store.read_stats()
+    sizes = defaultdict(lambda: [0, 0])
+    for namespace, _, size, _ in store.entries():
+        sizes[namespace][0] += 1
+        sizes[namespace][1] += size
+
+    print(f"Cache: {store.root}")
+    print(f"{'namespace':<12} {'entries':>8} {'size':>8} {'hits':>7} {'misses':>7} {'hit rate':>9} {'evicted':>8}")
+    total_entries = total_size = 0
+    for namespace in sorted(set(counts) | set(sizes)):
+        c = counts[namespace]
+        n, size = sizes[namespace]
+        total_entries += n
+        total_size += size
+        lookups = c['hit'] + c['miss']
+        rate = f"{100 * c['hit'] / lookups:.1f}%" if lookups else '-'
+        print(f"{namespace:<12} {n:>8} {format_size(size):>8} {c['hit']:>7} {c['miss']:>7} {rate:>9} {c['evict']:>8}")
+    print(f"{'total':<12} {total_entries:>8} {format_size(total_size):>8}")
+
+
+def main():
+    """Main function to inspect and prune the artifact cache."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Inspect and prune the Banks artifact cache')
+    parser.add_argument('--cache-dir', help='Cache directory (default: $BANKS_CACHE_DIR or .build-cache)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('stats', help='Show entries, size and hit rate per namespace')
+
+    prune = subparsers.add_parser('prune', help='Evict least recently used artifacts')
+    prune.add_argument('--max-size', required=True, help='Target size, e.g. 500M or 2G (0 empties the cache)')
+
+    subparsers.add_parser('reset-stats', help='Clear the hit/miss log')
+
+    args = parser.parse_args()
+    store = open_store(args.cache_dir)
+
+    if args.command == 'stats':
+        print_stats(store)
+    elif args.command == 'prune':
+        removed, total = store.prune(parse_size(args.max_size))
+        print(f"✓ Evicted {removed} artifact(s); cache is now {format_size(total)}")
+    elif args.command == 'reset-stats':
+        (store.root / 'stats.log').unlink(missing_ok=True)
+        print("✓ Cache statistics cleared")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for images and logos shared across issues.
+
+Every issue carries its own logo/, articles/images/ and template images, and
+the website keeps another copy of each issue's article images. This module
+keeps one copy of every distinct file under {store}/objects/<sha256[:2]>/
+and materializes it wherever it is needed as a reflink (copy-on-write clone,
+where the filesystem supports it), a hardlink, or as a last resort a plain
+copy. Objects are always stored as their own reflink or copy, never as a
+link to the file they came from, and are read-only, so a file hardlinked
+from the store cannot be edited in place by accident; tools that save by
+writing a new file are unaffected.
+
+Processed variants (resized copies, thumbnails, ...) are stored the same way,
+keyed by the source hash, the variant name and its parameters, so each one
+is produced once no matter how many issues use it.
+
+Usage:
+    python3 asset_store.py scan                  # report duplicate files and reclaimable space
+    python3 asset_store.py dedupe [ROOT ...]     # replace duplicates with links into the store
+    python3 asset_store.py verify                # re-hash every stored object
+    python3 asset_store.py gc [ROOT ...]         # drop objects no file under the roots still uses
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from export_website import hash_file
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[3]
+DEFAULT_STORE = Path(os.environ.get('BANKS_ASSET_STORE', REPO_ROOT / '.asset-store'))
+
+# Directories scanned by default: issue sources, website article copies and shared logos
+DEFAULT_ROOTS = (
+    REPO_ROOT / 'content',
+    REPO_ROOT / 'logo',
+    REPO_ROOT / 'website' / 'public',
+    REPO_ROOT / 'website' / 'src',
+)
+
+ASSET_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.pdf', '.eps', '.af'}
+
+# Linux ioctl that clones a file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+LINK_MODES = ('auto', 'reflink', 'hardlink', 'copy')
+
+
+def reflink(src, dest):
+    """Clone src to dest copy-on-write; raises OSError where unsupported"""
+    import fcntl
+
+    with open(src, 'rb') as s, open(dest, 'wb') as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.unlink(dest)
+            raise
+
+
+def place(src, dest, mode='auto'):
+    """Create dest from src by reflink, hardlink or copy; returns the method used"""
+    if mode in ('auto', 'reflink'):
+        try:
+            reflink(src, dest)
+            return 'reflink'
+        except (OSError, ImportError):
+            if mode == 'reflink':
+                raise
+    if mode in ('auto', 'hardlink'):
+        try:
+            os.link(src, dest)
+            return 'hardlink'
+        except OSError as e:
+            if mode == 'hardlink' or e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+    shutil.copyfile(src, dest)
+    return 'copy'
+
+
+def iter_assets(roots):
+    """Yield every asset file under roots (skipping the store and node_modules)"""
+    for root in roots:
+        root = Path(root)
+        if root.is_file():
+            yield root
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in ('node_modules', '.git', '.asset-store')]
+            for name in filenames:
+                path = Path(dirpath) / name
+                if path.suffix.lower() in ASSET_EXTENSIONS and not path.is_symlink():
+                    yield path
+
+
+class AssetStore:
+    """Deduplicated files stored by sha256, materialized by link"""
+
+    def __init__(self, root=DEFAULT_STORE):
+        self.root = Path(root)
+
+    def object_path(self, digest):
+        return self.root / 'objects' / digest[:2] / digest
+
+    def add(self, path, digest=None):
+        """Store a copy of path (if not already stored); returns its digest"""
+        digest = digest or hash_file(path)
+        target = self.object_path(digest)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f'.{digest}.{os.getpid()}.tmp')
+            # Never hardlink: the object must not share an inode (or permissions) with the source
+            try:
+                place(path, tmp, 'reflink')
+            except (OSError, ImportError):
+                shutil.copyfile(path, tmp)
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp, target)
+        return digest
+
+    def materialize(self, digest, dest, mode='auto'):
+        """Make dest a link to (or copy of) the stored object; returns the method used"""
+        dest = Path(dest)
+        source = self.object_path(digest)
+        if mode in ('auto', 'hardlink') and dest.exists() and os.path.samefile(source, dest):
+            return 'hardlink'
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f'.{dest.name}.{os.getpid()}.tmp')
+        tmp.unlink(missing_ok=True)
+        method = place(source, tmp, mode)
+        os.replace(tmp, dest)
+        return method
+
+    def variant(self, source, name, produce, params=None, suffix=''):
+        """Digest of a processed variant of source, producing and storing it on first use
+
+        produce(source_path, output_path) writes the variant; the result is
+        keyed by the source hash, name and params, so every issue shares it.
+        """
+        source_digest = hash_file(source)
+        key_data = json.dumps({'source': source_digest, 'name': name, 'params': params}, sort_keys=True)
+        key = hashlib.sha256(key_data.encode()).hexdigest()
+        index = self.root / 'variants' / key[:2] / key
+        if index.exists():
+            digest = index.read_text().strip()
+            if self.object_path(digest).exists():
+                return digest
+
+        index.parent.mkdir(parents=True, exist_ok=True)
+        tmp_out = index.with_name(f'.{key}.{os.getpid()}{suffix}')
+        try:
+            produce(source, tmp_out)
+            digest = self.add(tmp_out)
+        finally:
+            tmp_out.unlink(missing_ok=True)
+        tmp_index = index.with_name(f'.{key}.{os.getpid()}.idx')
+        tmp_index.write_text(digest + '\n')
+        os.replace(tmp_index, index)
+        return digest
+
+    def objects(self):
+        objects_dir = self.root / 'objects'
+        if not objects_dir.is_dir():
+            return []
+        return [p for p in objects_dir.glob('*/*') if not p.name.startswith('.')]
+
+    def dedupe(self, roots, mode='auto', dry_run=False):
+        """Replace every asset under roots with a link to its stored copy
+
+        Returns {method: count} and the number of bytes no longer duplicated.
+        """
+        counts = defaultdict(int)
+        saved = 0
+        seen = set()
+        for path in iter_assets(roots):
+            digest = hash_file(path)
+            target = self.object_path(digest)
+            if mode in ('auto', 'hardlink') and target.exists() and os.path.samefile(target, path):
+                counts['already linked'] += 1
+                seen.add(digest)
+                continue
+            if digest in seen or target.exists():
+                saved += path.stat().st_size
+            seen.add(digest)
+            if dry_run:
+                counts['would link'] += 1
+                continue
+            self.add(path, digest)
+            counts[self.materialize(digest, path, mode)] += 1
+        return counts, saved
+
+    def verify(self):
+        """Return the stored objects whose content no longer matches their name"""
+        return [p for p in self.objects() if hash_file(p) != p.name]
+
+    def referenced(self, roots):
+        """Digests of the stored objects that some asset under roots has the content of
+
+        Reflinked and copied files look like any other file, so references
+        are found by content: files sharing an object's inode count without
+        being read, and the rest are hashed only when their size matches an
+        object not yet known to be in use.
+        """
+        stats = {path.name: path.stat() for path in self.objects()}
+        by_inode = {(st.st_dev, st.st_ino): digest for digest, st in stats.items()}
+        referenced = set()
+        others = []
+        for path in iter_assets(roots):
+            st = path.stat()
+            digest = by_inode.get((st.st_dev, st.st_ino))
+            if digest:
+                referenced.add(digest)
+            else:
+                others.append((path, st.st_size))
+
+        by_size = defaultdict(set)
+        for digest, st in stats.items():
+            if digest not in referenced:
+                by_size[st.st_size].add(digest)
+        for path, size in others:
+            if by_size.get(size):
+                digest = hash_file(path)
+                if digest in by_size[size]:
+                    referenced.add(digest)
+                    by_size[size].discard(digest)
+        return referenced
+
+    def gc(self, roots):
+        """Delete objects that no asset under roots uses any more; returns bytes freed"""
+        if not roots:
+            raise ValueError('gc needs the directories that use the store')
+        referenced = self.referenced(roots)
+        freed = 0
+        for path in self.objects():
+            if path.name not in referenced:
+                size = path.stat().st_size
+                path.unlink()
+                freed += size
+        return freed
+
+
+def scan(roots):
+    """Group asset files by content; returns (groups of duplicate paths, wasted bytes)"""
+    by_digest = defaultdict(list)
+    sizes = {}
+    for path in iter_assets(roots):
+        digest = hash_file(path)
+        by_digest[digest].append(path)
+        sizes[digest] = path.stat().st_size
+
+    duplicates = {}
+    wasted = 0
+    for digest, paths in by_digest.items():
+        inodes = {(p.stat().st_dev, p.stat().st_ino) for p in paths}
+        if len(paths) > 1:
+            duplicates[digest] = paths
+            wasted += sizes[digest] * (len(inodes) - 1)
+    return duplicates, wasted
+
+
+def format_size(num_bytes):
+    for unit in ('B', 'K', 'M', 'G'):
+        if num_bytes < 1024 or unit == 'G':
+            return f'{num_bytes:.0f}{unit}' if unit == 'B' else f'{num_bytes:.1f}{unit}'
+        num_bytes /= 1024
+
+
+def main():
+    """Main function to manage the shared asset store."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Deduplicate images and logos across issues')
+    parser.add_argument('--store', default=str(DEFAULT_STORE),
+                        help='Store directory (default: $BANKS_ASSET_STORE or .asset-store at the repo root)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scan_cmd = subparsers.add_parser('scan', help='Report duplicate asset files')
+    scan_cmd.add_argument('roots', nargs='*', help='Directories to scan (default: content, logo, website)')
+
+    dedupe_cmd = subparsers.add_parser('dedupe', help='Replace assets with links into the store')
+    dedupe_cmd.add_argument('roots', nargs='*', help='Directories to deduplicate (default: content, logo, website)')
+    dedupe_cmd.add_argument('--mode', choices=LINK_MODES, default='auto',
+                            help='How files are materialized (default: reflink, else hardlink, else copy)')
+    dedupe_cmd.add_argument('--dry-run', action='store_true', help='Only report what would be linked')
+
+    subparsers.add_parser('verify', help='Re-hash every stored object')
+    gc_cmd = subparsers.add_parser('gc', help='Delete objects no asset uses any more')
+    gc_cmd.add_argument('roots', nargs='*', help='Directories that use the store (default: content, logo, website)')
+
+    args = parser.parse_args()
+    store = AssetStore(args.store)
+    roots = [Path(r) for r in getattr(args, 'roots', None) or DEFAULT_ROOTS if Path(r).exists()]
+
+    if args.command == 'scan':
+        duplicates, wasted = scan(roots)
+        for digest, paths in sorted(duplicates.items(), key=lambda item: -len(item[1])):
+            print(f"{digest[:12]}  {len(paths)} copies")
+            for path in paths:
+                print(f"    {path}")
+        print(f"\n{len(duplicates)} files stored more than once; {format_size(wasted)} reclaimable.")
+
+    elif args.command == 'dedupe':
+        counts, saved = store.dedupe(roots, args.mode, args.dry_run)
+        summary = ', '.join(f'{n} {method}' for method, n in sorted(counts.items())) or 'nothing to do'
+        print(f"✓ {summary}; {format_size(saved)} of duplicates {'would be ' if args.dry_run else ''}shared")
+
+    elif args.command == 'verify':
+        bad = store.verify()
+        for path in bad:
+            print(f"✗ {path} does not match its hash")
+        if bad:
+            sys.exit(1)
+        print(f"✓ {len(store.objects())} objects OK")
+
+    elif args.command == 'gc':
+        if not roots:
+            print("✗ None of the directories exist; refusing to delete every object")
+            sys.exit(1)
+        print(f"✓ Freed {format_size(store.gc(roots))}")
+
+
+if __name__ == '__main__':
+    main()
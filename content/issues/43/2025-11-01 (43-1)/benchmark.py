@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Banks of the Boneyard generator.
+
+Builds a synthetic issue (by default 300 organizations and 100 articles,
+recycled from the sources in vol43is1) in a temporary directory and times
+the generator against it.
+
+Usage:
+    python3 benchmark.py generate --orgs 300 --articles 100 --jobs 1,2,4,8
+    python3 benchmark.py search --docs 2000 --queries 200
+    python3 benchmark.py templates --orgs 2000
+    python3 benchmark.py markdown --size 1M
+    python3 benchmark.py compile --issue vol43is1
+    python3 benchmark.py sources --orgs 300
+    python3 benchmark.py order --articles 50
+    python3 benchmark.py manifest --jobs 1,4,8
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from contextlib import redirect_stdout
+from io import StringIO
+from itertools import cycle
+from pathlib import Path
+
+import pikepdf
+import yaml
+
+import build_search_index
+from archive_manifest import ISSUES_DIR, Manifest, hash_paths, iter_files
+from artifact_store import LocalStore
+from build import compile_pdf, generate, source_date_epoch
+from generate_articles import process_markdown_file
+from generate_newspaper import (TEMPLATE_DIR, NewspaperGenerator, StoreBytecodeCache,
+                                make_template_environment)
+from issue_source import MemorySource, ZipSource
+from markdown_corpus import ADVERSARIAL_MARKDOWN, MAX_GROWTH, SAMPLE_ARTICLES, SAMPLE_ISSUE, adversarial_markdown
+from optimize_order import estimate_layout, optimize_order
+from split_compile import SPLIT_DIR, compare_navigation, compile_split
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+
+def build_synthetic_issue(target, num_orgs, num_articles, sample=SAMPLE_ISSUE):
+    """Create an issue directory with num_orgs directory entries and num_articles articles"""
+    target = Path(target)
+    articles_out = target / 'content' / 'articles'
+    blurbs_out = target / 'content' / 'blurb'
+    articles_out.mkdir(parents=True)
+    blurbs_out.mkdir(parents=True)
+
+    for name in ('events.yaml', 'horoscope.yaml'):
+        if (sample / name).exists():
+            shutil.copy(sample / name, target / name)
+
+    # Articles: convert the sample markdown once, then recycle it
+    with redirect_stdout(StringIO()):
+        sample_yamls = [process_markdown_file(md, articles_out)
+                        for md in sorted((sample / 'articles').glob('*.md'))]
+    article_order = []
+    for i, source in zip(range(num_articles), cycle(sample_yamls)):
+        name = f'article{i:04d}'
+        shutil.copy(source, articles_out / f'{name}.yaml')
+        article_order.append(name)
+
+    # Directory: blurbs from the sample YAML, with a representative set of chairs and links
+    sample_blurbs = []
+    for blurb_path in sorted((sample / 'blurb').glob('*.yaml')):
+        with open(blurb_path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        if (data.get('blurb') or '').strip():
+            sample_blurbs.append(data)
+    directory_order = []
+    for i, data in zip(range(num_orgs), cycle(sample_blurbs)):
+        name = f'org{i:04d}'
+        info = {
+            'name': f'SIG{i:04d}',
+            'chairs': [
+                {'name': 'Alex Example', 'title': 'Chair', 'email': 'alex'},
+                {'name': 'Sam Example', 'title': 'Co-Chair', 'email': 'sam'},
+                {'name': 'Jo Example', 'title': 'Treasurer', 'email': 'jo'},
+                {'name': 'Kim Example', 'title': 'Webmaster', 'email': 'kim'},
+            ],
+            'website': f'https://{name}.acm.illinois.edu/#about_us',
+            'links': {'discord': f'https://discord.gg/{name}_invite', 'instagram': f'https://instagram.com/{name}'},
+            'blurb': data['blurb'].strip(),
+            'status': 'active',
+        }
+        if isinstance(data.get('meeting_times'), list):
+            info['meeting_times'] = data['meeting_times']
+        with open(blurbs_out / f'{name}.json', 'w', encoding='utf-8') as f:
+            json.dump(info, f, indent=2)
+        directory_order.append(name)
+
+    config = {
+        'volume': 99,
+        'issue': 1,
+        'letter_from_the_chair': article_order[0] if article_order else None,
+        'article_order': article_order,
+        'directory_order': directory_order,
+    }
+    with open(target / 'config.yaml', 'w', encoding='utf-8') as f:
+        yaml.safe_dump(config, f)
+    return target
+
+
+def time_call(fn, repeat):
+    """Best wall-clock time of fn over repeat runs, with its output suppressed"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with redirect_stdout(StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_generate(args):
+    """Time generate_all on a synthetic issue for each worker count"""
+    jobs_list = [int(j) for j in args.jobs.split(',')]
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        issue = build_synthetic_issue(Path(tmp) / 'issue', args.orgs, args.articles)
+        generator = NewspaperGenerator(issue, print_mode=args.print_mode)
+
+        print(f"generate_all: {args.orgs} orgs, {args.articles} articles, "
+              f"{os.cpu_count()} cores, best of {args.repeat}")
+        print(f"{'jobs':>6}  {'seconds':>9}  {'speedup':>8}")
+        baseline = None
+        for jobs in jobs_list:
+            elapsed = time_call(lambda: generator.generate_all(issue / 'content', jobs=jobs), args.repeat)
+            baseline = baseline or elapsed
+            print(f"{jobs:>6}  {elapsed:>9.3f}  {baseline / elapsed:>7.2f}x")
+
+
+def build_synthetic_corpus(target, num_docs, sample=SAMPLE_ARTICLES, seed=0):
+    """Write num_docs website articles recycled from the sample articles, with extra vocabulary mixed in"""
+    rng = random.Random(seed)
+    bodies = [build_search_index.read_markdown(path)[1] for path in sorted(Path(sample).rglob('*.md'))]
+    vocabulary = sorted({word for body in bodies for word in body.split()})
+    articles_dir = Path(target) / 'articles' / 'synthetic'
+    articles_dir.mkdir(parents=True)
+    for i in range(num_docs):
+        body = bodies[i % len(bodies)]
+        # A few made-up words per document give the index a realistic long tail of rare terms
+        extra = rng.sample(vocabulary, min(40, len(vocabulary))) + [f'term{rng.randrange(num_docs * 5)}' for _ in range(10)]
+        text = (f'---\ntitle: "Synthetic article {i:05d}"\ndate: 2025-10-{1 + i % 28:02d}\n'
+                f'authors: ["Author {i % 50}"]\n---\n\n{body}\n\n{" ".join(extra)}\n')
+        (articles_dir / f'doc{i:05d}.md').write_text(text, encoding='utf-8')
+    return vocabulary
+
+
+def bench_search(args):
+    """Time building and querying the sharded search index on a synthetic corpus"""
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        content = Path(tmp) / 'content'
+        issues = content / 'issues'
+        issues.mkdir(parents=True)
+        out = Path(tmp) / 'search'
+        vocabulary = build_synthetic_corpus(content, args.docs)
+
+        start = time.perf_counter()
+        documents, _, _ = build_search_index.build_index(out, content, issues)
+        full_build = time.perf_counter() - start
+
+        with open(out / 'index.json', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        shards = [out / name for name in index['shards'].values()]
+        compressed = [p.stat().st_size for p in shards]
+        raw = sum(len(json.dumps(build_search_index.load_gzip_json(out, p.name), separators=(',', ':')))
+                  for p in shards)
+        doc_chunks = sum((out / name).stat().st_size for name in index['doc_chunks'])
+        index_size = (out / 'index.json').stat().st_size
+
+        # Incremental rebuild after editing one article
+        edited = next((content / 'articles' / 'synthetic').glob('*.md'))
+        edited.write_text(edited.read_text(encoding='utf-8') + '\nfreshly edited paragraph\n', encoding='utf-8')
+        start = time.perf_counter()
+        _, retokenized, rewritten = build_search_index.build_index(out, content, issues)
+        incremental = time.perf_counter() - start
+        with open(out / 'index.json', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+
+        words = [t for t in build_search_index.tokenize(' '.join(vocabulary)) if len(t) > 3]
+        queries = [' '.join(rng.sample(words, 2)) for _ in range(args.queries // 2)]
+        queries += [f'{rng.choice(words)} {rng.choice(words)[:3]}' for _ in range(args.queries - len(queries))]
+
+        cold, warm, fetched = [], [], []
+        file_cache = {}
+        for query in queries:
+            start = time.perf_counter()
+            build_search_index.search(out, query, index=index, file_cache={})
+            cold.append(time.perf_counter() - start)
+            needed = {index['shards'].get(t[:index['prefix_length']]) for t in build_search_index.tokenize(query)}
+            fetched.append(sum((out / name).stat().st_size for name in needed if name))
+            start = time.perf_counter()
+            build_search_index.search(out, query, index=index, file_cache=file_cache)
+            warm.append(time.perf_counter() - start)
+
+    def pct(values, q):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    print(f"search index: {documents} documents, {len(shards)} shards, {args.queries} queries")
+    print(f"  full build         {full_build:8.2f}s")
+    print(f"  incremental build  {incremental:8.2f}s  ({retokenized} re-tokenized, {rewritten} files rewritten)")
+    print(f"  index.json         {index_size / 1024:8.1f}K")
+    print(f"  shards             {sum(compressed) / 1024:8.1f}K gzip / {raw / 1024:.1f}K raw "
+          f"(largest {max(compressed) / 1024:.1f}K)")
+    print(f"  document chunks    {doc_chunks / 1024:8.1f}K gzip ({len(index['doc_chunks'])} files)")
+    print(f"  shard bytes/query  {sum(fetched) / len(fetched) / 1024:8.1f}K average")
+    print(f"  query (cold)       p50 {pct(cold, 0.5):6.2f}ms  p95 {pct(cold, 0.95):6.2f}ms")
+    print(f"  query (warm)       p50 {pct(warm, 0.5):6.2f}ms  p95 {pct(warm, 0.95):6.2f}ms")
+
+
+def fstring_directory_entry(name, logo, roles, meetings, links, blurb, print_mode):
+    """directory_entry.tex.j2 written as the f-strings it replaced, to time emission against"""
+    content = ['\\noindent', '\\begin{minipage}{\\columnwidth}']
+    if logo:
+        content += ['\\begin{center}', f'\\includegraphics[width=0.35\\columnwidth]{{{logo}}}', '\\end{center}',
+                    '\\vspace{0.05cm}']
+    content.append(f'\\subsection*{{{name}}}')
+    for label, names in roles:
+        content.append(f'\\noindent\\textbf{{{label}:}} {", ".join(names)}\\\\')
+    for i, meeting in enumerate(meetings):
+        prefix = '\\textbf{Meetings:} ' if i == 0 else '\\phantom{\\textbf{Meetings:} }'
+        content.append(f'\\noindent{prefix}{meeting}\\\\')
+    for label, url, text in links:
+        shown = text if print_mode else f'\\href{{{url}}}{{{text}}}'
+        content.append(f'\\noindent\\textbf{{{label}:}} {shown}\\\\')
+    content.append('')
+    if blurb:
+        content.append(f'{{\\setlength{{\\parindent}}{{1.5em}}\n{blurb}\n}}')
+    content.append('\\end{minipage}\n\n\\vspace{0.3cm}\n')
+    return '\n'.join(content)
+
+
+def bench_templates(args):
+    """Time loading the section templates (cold vs. bytecode cache) and rendering large sections"""
+    names = sorted(p.name for p in TEMPLATE_DIR.glob('*.tex.j2'))
+
+    def load_all(bytecode_cache):
+        env = make_template_environment(bytecode_cache)
+        for name in names:
+            env.get_template(name)
+
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        store = LocalStore(Path(tmp) / 'cache')
+        load_all(StoreBytecodeCache(store))
+        cold = time_call(lambda: load_all(None), args.repeat)
+        warm = time_call(lambda: load_all(StoreBytecodeCache(store)), args.repeat)
+        print(f"Loading {len(names)} templates in a fresh process environment, best of {args.repeat}")
+        print(f"  parse + compile    {cold * 1000:8.2f}ms")
+        print(f"  bytecode cache     {warm * 1000:8.2f}ms  ({cold / warm:.1f}x)")
+
+        issue = build_synthetic_issue(Path(tmp) / 'issue', args.orgs, args.articles)
+        # No store: article fragments are rendered, not read back from the cache
+        generator = NewspaperGenerator(issue, print_mode=args.print_mode)
+        print(f"\nRendering sections: {args.orgs} orgs, {args.articles} articles, best of {args.repeat}")
+        for label, method in (('directory', generator.generate_directory_tex),
+                              ('articles', generator.generate_articles_tex),
+                              ('events', generator.generate_events_tex),
+                              ('horoscope', generator.generate_horoscope_tex),
+                              ('toc', generator.generate_toc_tex)):
+            elapsed = time_call(method, args.repeat)
+            print(f"  {label:<17}  {elapsed * 1000:8.2f}ms")
+
+        # Emission alone, on data already prepared (chairs grouped, markdown converted)
+        contexts = []
+        for org_name in generator.config.get('directory_order', []):
+            blurb_data = generator.load_blurb(org_name)
+            if blurb_data and blurb_data.get('blurb', '').strip():
+                contexts.append(generator.directory_entry_context(org_name, blurb_data))
+        template = generator.template('directory_entry.tex.j2')
+        rendered = [template.render(**context) for context in contexts]
+        if rendered != [fstring_directory_entry(**context) for context in contexts]:
+            sys.exit("✗ f-string reference no longer matches directory_entry.tex.j2")
+        jinja = time_call(lambda: [template.render(**context) for context in contexts], args.repeat)
+        fstrings = time_call(lambda: [fstring_directory_entry(**context) for context in contexts], args.repeat)
+        print(f"\nEmitting {len(contexts)} directory entries from prepared data, best of {args.repeat}")
+        print(f"  template           {jinja * 1000:8.2f}ms")
+        print(f"  f-strings          {fstrings * 1000:8.2f}ms  ({jinja / fstrings:.1f}x faster)")
+
+
+def bench_sources(args):
+    """Time rendering a whole issue from a directory, a zip archive and memory"""
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        issue = build_synthetic_issue(Path(tmp) / 'issue', args.orgs, args.articles)
+        archive = Path(tmp) / 'issue.zip'
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            for path in sorted(issue.rglob('*')):
+                if path.is_file():
+                    zf.write(path, path.relative_to(issue).as_posix())
+        out_dir = Path(tmp) / 'out'
+        out_dir.mkdir()
+
+        print(f"Rendering every section: {args.orgs} orgs, {args.articles} articles, "
+              f"in-process, best of {args.repeat}")
+        cases = (
+            ('directory -> files', lambda: NewspaperGenerator(issue, print_mode=args.print_mode)
+                .generate_all(out_dir, jobs=1)),
+            ('directory -> strings', lambda: NewspaperGenerator(issue, print_mode=args.print_mode)
+                .render_sections()),
+            ('zip -> strings', lambda: NewspaperGenerator(ZipSource(archive), print_mode=args.print_mode)
+                .render_sections()),
+            ('memory -> strings', lambda: NewspaperGenerator(MemorySource.from_directory(issue),
+                                                             print_mode=args.print_mode).render_sections()),
+        )
+        for label, fn in cases:
+            print(f"  {label:<22} {time_call(fn, args.repeat) * 1000:8.1f}ms")
+
+
+def bench_order(args):
+    """Time estimating article heights and searching for a shorter article order"""
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        issue = build_synthetic_issue(Path(tmp) / 'issue', 0, args.articles)
+        generator = NewspaperGenerator(issue, print_mode=args.print_mode)
+        order = generator.config['article_order']
+        # Shuffle so the search starts from an order nobody tuned
+        random.Random(0).shuffle(order)
+        pinned = set(order[:args.pinned])
+
+        layouts = []
+        estimate = time_call(lambda: layouts.append(estimate_layout(generator, order)), args.repeat)
+        layout = layouts[-1]
+        suggested = []
+        search = time_call(lambda: suggested.append(optimize_order(layout, order, pinned)), args.repeat)
+
+        print(f"optimize_order: {args.articles} articles, {args.pinned} pinned, best of {args.repeat}")
+        print(f"  estimate heights   {estimate * 1000:8.1f}ms")
+        print(f"  search             {search * 1000:8.1f}ms")
+        for label, candidate in (('current', order), ('suggested', suggested[-1])):
+            pages, waste = layout.score(candidate)
+            print(f"  {label:<18} {pages} page(s), {waste:.0f}pt empty at column bottoms")
+    if estimate + search >= args.budget:
+        print(f"\n✗ Took {estimate + search:.2f}s, over the {args.budget:.2f}s budget")
+        sys.exit(1)
+
+
+def bench_manifest(args):
+    """Time hashing the archive for each thread count, and an update where nothing changed"""
+    jobs_list = [int(j) for j in args.jobs.split(',')]
+    paths = list(iter_files(args.issues_dir))
+    total = sum(path.stat().st_size for path in paths)
+    print(f"Hashing {len(paths)} files ({total / 1024 ** 2:.1f}M) under {args.issues_dir}, "
+          f"{os.cpu_count()} cores, best of {args.repeat} (page cache warm after the first run)")
+    print(f"{'jobs':>6}  {'seconds':>9}  {'MB/s':>8}  {'speedup':>8}")
+    baseline = None
+    for jobs in jobs_list:
+        elapsed = time_call(lambda: hash_paths(paths, jobs), args.repeat)
+        baseline = baseline or elapsed
+        print(f"{jobs:>6}  {elapsed:9.3f}  {total / 1024 ** 2 / elapsed:8.0f}  {baseline / elapsed:7.2f}x")
+
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        manifest_path = Path(tmp) / 'manifest.json'
+        first = Manifest(manifest_path, args.issues_dir)
+        first.refresh()
+        first.save()
+
+        def update():
+            manifest = Manifest(manifest_path, args.issues_dir)
+            manifest.refresh()
+            manifest.save()
+        print(f"\nUnchanged update (stat only): {time_call(update, args.repeat) * 1000:.1f}ms")
+
+
+def parse_count(value):
+    """'64K' / '1M' / '1000' -> number of characters"""
+    value = value.strip().upper()
+    scale = {'K': 1024, 'M': 1024 ** 2}.get(value[-1:], 1)
+    return int(float(value.rstrip('KM')) * scale)
+
+
+def bench_markdown(args):
+    """Check markdown_to_latex stays linear on adversarial input; exits 1 if any case grows faster"""
+    generator = NewspaperGenerator(SAMPLE_ISSUE, print_mode=args.print_mode)
+    sizes = [args.size // 4, args.size // 2, args.size]
+
+    print(f"markdown_to_latex on adversarial input, best of {args.repeat} "
+          f"(time should double with the size; {args.max_growth:g}x or more fails)")
+    print(f"{'case':<22}" + ''.join(f"{format_count(n):>10}" for n in sizes) + f"{'growth':>9}")
+    failed = []
+    for name, unit in ADVERSARIAL_MARKDOWN.items():
+        times = []
+        for size in sizes:
+            text = adversarial_markdown(unit, size)
+            times.append(time_call(lambda: generator.markdown_to_latex(text, is_article=True), args.repeat))
+        # Worst growth per doubling; tiny timings are dominated by noise, so floor them at 1ms
+        growth = max(max(b, 1e-3) / max(a, 1e-3) for a, b in zip(times, times[1:]))
+        mark = '✓' if growth < args.max_growth else '✗'
+        if mark == '✗':
+            failed.append(name)
+        print(f"{name:<22}" + ''.join(f"{t * 1000:>8.1f}ms" for t in times) + f"{growth:>8.1f}x {mark}")
+
+    sample = '\n\n'.join(p.read_text(encoding='utf-8') for p in sorted((SAMPLE_ISSUE / 'articles').glob('*.md')))
+    text = adversarial_markdown(sample, args.size)
+    elapsed = time_call(lambda: generator.markdown_to_latex(text, is_article=True), args.repeat)
+    print(f"{'vol43is1 articles':<22}{'':>20}{elapsed * 1000:>8.1f}ms  ({args.size / elapsed / 1024 ** 2:.1f}M chars/s)")
+
+    if failed:
+        print(f"\n✗ Superlinear growth: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✓ All cases linear")
+
+
+def bench_compile(args):
+    """Time one pdflatex job against split compilation on a copy of a generated issue"""
+    if shutil.which('pdflatex') is None:
+        print("✗ pdflatex not found")
+        sys.exit(1)
+    with tempfile.TemporaryDirectory(prefix='banks-bench-') as tmp:
+        # The issue's main.tex loads ../templates/newspaper
+        shutil.copytree(SCRIPT_DIR / 'templates', Path(tmp) / 'templates')
+        issue = Path(tmp) / 'issue'
+        shutil.copytree(args.issue, issue, ignore=shutil.ignore_patterns('*.pdf'))
+        with redirect_stdout(StringIO()):
+            generate(issue, args.print_mode)
+        epoch = source_date_epoch(issue)
+
+        single = time_call(lambda: compile_pdf(issue, 'single', epoch=epoch), args.repeat)
+        # The first split build does not know the page counts yet and needs an extra round
+        first = time_call(lambda: compile_split(issue, 'split', epoch=epoch), 1)
+        split = time_call(lambda: compile_split(issue, 'split', epoch=epoch), args.repeat)
+        counts = json.loads((issue / SPLIT_DIR / 'split-pages.json').read_text(encoding='utf-8'))
+
+        pdfs = {}
+        for name in ('single', 'split'):
+            with pikepdf.open(issue / f'{name}.pdf') as pdf:
+                pdfs[name] = (len(pdf.pages), (issue / f'{name}.pdf').stat().st_size)
+        differences = compare_navigation(issue / 'single.pdf', issue / 'split.pdf')
+
+    print(f"pdflatex on {args.issue}: {pdfs['single'][0]} pages, {os.cpu_count()} cores, best of {args.repeat}")
+    print(f"  one job (2 passes)   {single:8.2f}s  {pdfs['single'][1] / 1024:8.1f}K")
+    print(f"  split, first build   {first:8.2f}s")
+    print(f"  split                {split:8.2f}s  {pdfs['split'][1] / 1024:8.1f}K  ({single / split:.2f}x)")
+    print(f"  parts                {', '.join(f'{part} {count}p' for part, count in counts.items())}")
+    if pdfs['split'][0] != pdfs['single'][0]:
+        print(f"\n✗ Split build has {pdfs['split'][0]} pages, one job has {pdfs['single'][0]}")
+        sys.exit(1)
+    for difference in differences:
+        print(f"✗ {difference}")
+    if differences:
+        sys.exit(1)
+    print("\n✓ Page labels, bookmarks and links match the single-job build")
+
+
+def format_count(n):
+    return f'{n // 1024 ** 2}M' if n % 1024 ** 2 == 0 else f'{n // 1024}K'
+
+
+def main():
+    """Main function to run the benchmarks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmarks for the Banks of the Boneyard generator')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    generate = subparsers.add_parser('generate', help='Time NewspaperGenerator.generate_all')
+    generate.add_argument('--orgs', type=int, default=300, help='Directory entries (default: 300)')
+    generate.add_argument('--articles', type=int, default=100, help='Articles (default: 100)')
+    generate.add_argument('--jobs', default=','.join(str(j) for j in (1, 2, 4, 8) if j <= (os.cpu_count() or 1)),
+                          help='Comma-separated worker counts to compare (default: 1,2,4,8 up to the core count)')
+    generate.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is reported')
+    generate.add_argument('--print-mode', action='store_true', help='Benchmark print mode')
+    generate.set_defaults(func=bench_generate)
+
+    search = subparsers.add_parser('search', help='Time building and querying the search index')
+    search.add_argument('--docs', type=int, default=2000, help='Synthetic articles to index (default: 2000)')
+    search.add_argument('--queries', type=int, default=200, help='Queries to time (default: 200)')
+    search.set_defaults(func=bench_search)
+
+    templates = subparsers.add_parser('templates', help='Time template loading and section rendering')
+    templates.add_argument('--orgs', type=int, default=2000, help='Directory entries (default: 2000)')
+    templates.add_argument('--articles', type=int, default=100, help='Articles (default: 100)')
+    templates.add_argument('--repeat', type=int, default=5, help='Runs per measurement; the best is reported')
+    templates.add_argument('--print-mode', action='store_true', help='Benchmark print mode')
+    templates.set_defaults(func=bench_templates)
+
+    markdown = subparsers.add_parser('markdown', help='Check markdown_to_latex stays linear on adversarial input')
+    markdown.add_argument('--size', type=parse_count, default=parse_count('1M'),
+                          help='Largest input in characters, e.g. 256K or 4M (default: 1M)')
+    markdown.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is reported')
+    markdown.add_argument('--max-growth', type=float, default=MAX_GROWTH,
+                          help=f'Fail if doubling the input multiplies the time by this much (default: {MAX_GROWTH:g})')
+    markdown.add_argument('--print-mode', action='store_true', help='Convert links to QR codes as in print mode')
+    markdown.set_defaults(func=bench_markdown)
+
+    compile_parser = subparsers.add_parser('compile', help='Time a single pdflatex job against split compilation')
+    compile_parser.add_argument('--issue', default=str(SAMPLE_ISSUE),
+                                help='Issue directory, with blurb JSON already generated (default: vol43is1)')
+    compile_parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is reported')
+    compile_parser.add_argument('--print-mode', action='store_true', help='Benchmark print mode')
+    compile_parser.set_defaults(func=bench_compile)
+
+    sources = subparsers.add_parser('sources', help='Time rendering from a directory, a zip and memory')
+    sources.add_argument('--orgs', type=int, default=300, help='Directory entries (default: 300)')
+    sources.add_argument('--articles', type=int, default=100, help='Articles (default: 100)')
+    sources.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is reported')
+    sources.add_argument('--print-mode', action='store_true', help='Benchmark print mode')
+    sources.set_defaults(func=bench_sources)
+
+    order = subparsers.add_parser('order', help='Time the article order optimizer')
+    order.add_argument('--articles', type=int, default=50, help='Articles (default: 50)')
+    order.add_argument('--pinned', type=int, default=2, help='Articles to pin in place (default: 2)')
+    order.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is reported')
+    order.add_argument('--budget', type=float, default=1.0,
+                       help='Fail if estimating and searching take this many seconds (default: 1)')
+    order.add_argument('--print-mode', action='store_true', help='Estimate the print version')
+    order.set_defaults(func=bench_order)
+
+    manifest = subparsers.add_parser('manifest', help='Time hashing the archive into the manifest')
+    manifest.add_argument('--issues-dir', default=str(ISSUES_DIR), help='Archive root (default: content/issues)')
+    manifest.add_argument('--jobs', default=','.join(str(j) for j in (1, 2, 4, 8) if j <= (os.cpu_count() or 1)),
+                          help='Comma-separated thread counts to compare (default: 1,2,4,8 up to the core count)')
+    manifest.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the best is reported')
+    manifest.set_defaults(func=bench_manifest)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Build an issue PDF, skipping generation and pdflatex when nothing changed.
+
+The cache key is a hash of every build input: article sources and images,
+blurb YAML and the generated blurb JSON, config/events/horoscope, logos,
+templates, main.tex, the generator scripts, the pdflatex version and the
+mode (online or print). Input digests come from the archive manifest (see
+archive_manifest.py), so only files changed since they were last hashed are
+read again. On a hit the stored PDF is copied into place; on a
+miss the issue is generated and compiled (two passes) and the PDF is stored.
+With --split the front matter and articles, the horoscope and the directory
+are typeset as separate pdflatex jobs in parallel and merged (see
+split_compile.py).
+
+pdflatex runs with SOURCE_DATE_EPOCH/FORCE_SOURCE_DATE set from the issue
+date, so timestamps and the trailer /ID are fixed and identical inputs give
+byte-identical PDFs.
+
+Finished PDFs and rendered article fragments live in the shared artifact
+store (see artifact_store.py), so editors and CI pointing BANKS_CACHE_DIR at
+the same directory reuse each other's builds.
+
+Every build's stage timings, pdflatex passes, PDF size, input counts and
+cache hits are appended to the build history (see build_metrics.py).
+
+Usage: python3 build.py vol43is1 [--print-mode] [--split] [--no-metrics]
+"""
+
+import hashlib
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+
+from archive_manifest import file_digests
+from artifact_store import open_store
+from build_metrics import DEFAULT_DB, BuildMetrics, record_build
+from export_website import load_issue_meta
+from generate_articles import process_markdown_file
+from generate_newspaper import NewspaperGenerator
+from split_compile import can_split, compile_split
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Bump to invalidate every cached build
+BUILD_CACHE_VERSION = 1
+
+GENERATOR_SCRIPTS = ('generate_articles.py', 'generate_json.py', 'generate_newspaper.py', 'build.py',
+                     'split_compile.py', 'issue_source.py', 'artifact_store.py')
+PDF_NAMESPACE = 'pdf'
+AUX_EXTENSIONS = ('.aux', '.log', '.out', '.toc')
+
+
+def input_files(base_dir):
+    """Every file that feeds a build, as (label, path) pairs in a stable order"""
+    base_dir = Path(base_dir)
+    groups = [
+        ('articles', sorted((base_dir / 'articles').glob('*.md'))),
+        ('images', sorted(p for p in (base_dir / 'articles' / 'images').glob('*') if p.is_file())),
+        ('blurb', sorted((base_dir / 'blurb').glob('*.yaml'))),
+        ('blurb-json', sorted((base_dir / 'content' / 'blurb').glob('*.json'))),
+        ('logo', sorted(p for p in (base_dir / 'logo').glob('*') if p.is_file())),
+        ('templates', sorted(p for p in (base_dir.parent / 'templates').glob('*') if p.is_file())),
+        ('generator', [SCRIPT_DIR / name for name in GENERATOR_SCRIPTS]),
+    ]
+    files = []
+    for label, paths in groups:
+        files.extend((f'{label}/{p.name}', p) for p in paths)
+    for name in ('config.yaml', 'events.yaml', 'horoscope.yaml', 'main.tex'):
+        if (base_dir / name).exists():
+            files.append((name, base_dir / name))
+    return files
+
+
+def pdflatex_version():
+    try:
+        result = subprocess.run(['pdflatex', '--version'], capture_output=True, text=True)
+        return result.stdout.splitlines()[0] if result.stdout else ''
+    except OSError:
+        return ''
+
+
+def build_key(base_dir, print_mode, split=False):
+    """Content hash of all build inputs plus the mode and toolchain"""
+    digest = hashlib.sha256()
+    digest.update(f'banks-build-v{BUILD_CACHE_VERSION}\0'.encode())
+    digest.update(f'mode={"print" if print_mode else "online"}\0'.encode())
+    if split:
+        # A merged PDF is laid out the same but is not byte-identical to a single-job one
+        digest.update(b'split\0')
+    digest.update(f'pdflatex={pdflatex_version()}\0'.encode())
+    # Only inputs whose size or mtime changed since the archive manifest saw them are re-read
+    files = input_files(base_dir)
+    digests = file_digests(path for _, path in files)
+    for label, path in files:
+        digest.update(f'{label}\0{digests[path]}\0'.encode())
+    return digest.hexdigest()
+
+
+def source_date_epoch(base_dir):
+    """Fixed timestamp for the PDF metadata: the issue date, or the Unix epoch"""
+    issue_date = load_issue_meta(Path(base_dir)).get('date')
+    if issue_date is None:
+        return 0
+    return int(datetime(issue_date.year, issue_date.month, issue_date.day, tzinfo=timezone.utc).timestamp())
+
+
+def generate(base_dir, print_mode, store=None, metrics=None):
+    """Run the article conversion and LaTeX generation steps"""
+    base_dir = Path(base_dir)
+    metrics = metrics or BuildMetrics(base_dir, print_mode)
+    with metrics.stage('convert articles'), redirect_stdout(StringIO()):
+        for md in sorted((base_dir / 'articles').glob('*.md')):
+            process_markdown_file(md, base_dir / 'content' / 'articles')
+    with metrics.stage('generate'):
+        generator = NewspaperGenerator(base_dir, print_mode=print_mode, store=store)
+        generator.generate_all(base_dir / 'content')
+
+
+def compile_pdf(base_dir, jobname, passes=2, epoch=0, metrics=None):
+    """Run pdflatex on main.tex with fixed timestamps; returns the PDF path or None
+
+    In nonstopmode pdflatex carries on past errors and still writes a PDF, so
+    a last pass that exits non-zero counts as a failure: its PDF is removed
+    (it must not be cached) and the log is kept.
+    """
+    base_dir = Path(base_dir)
+    pdf_path = base_dir / f'{jobname}.pdf'
+    pdf_path.unlink(missing_ok=True)
+
+    env = dict(os.environ, SOURCE_DATE_EPOCH=str(epoch), FORCE_SOURCE_DATE='1')
+    for i in range(passes):
+        print(f"Compiling {jobname}.pdf (pass {i + 1})...")
+        start = time.perf_counter()
+        result = subprocess.run(['pdflatex', '-interaction=nonstopmode', f'-jobname={jobname}', 'main.tex'],
+                                cwd=base_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if metrics:
+            metrics.record_pdflatex_pass(time.perf_counter() - start)
+
+    if result.returncode != 0:
+        pdf_path.unlink(missing_ok=True)
+        print(f"✗ pdflatex reported errors (see {base_dir / f'{jobname}.log'})")
+        return None
+    for ext in AUX_EXTENSIONS:
+        (base_dir / f'{jobname}{ext}').unlink(missing_ok=True)
+    return pdf_path if pdf_path.exists() else None
+
+
+def build(base_dir, print_mode=False, store=None, force=False, metrics=None, split=False):
+    """Build the issue PDF, using the artifact store when possible; returns (pdf_path, hit)
+
+    With split, sections are compiled in parallel and merged (see
+    split_compile.py) when main.tex allows it. Timings and counts are collected in metrics (a build_metrics.BuildMetrics)
+    if one is given; recording them is up to the caller.
+    """
+    base_dir = Path(base_dir)
+    store = store or open_store()
+    metrics = metrics or BuildMetrics(base_dir, print_mode)
+    metrics.track_store(store)
+    jobname = 'main-print' if print_mode else 'main'
+    if split and not can_split(base_dir):
+        print(f"Warning: {base_dir}/main.tex has no page breaks to split at, compiling it as one job")
+        split = False
+    with metrics.stage('hash inputs'):
+        metrics.record_inputs(input_files(base_dir))
+        key = build_key(base_dir, print_mode, split)
+
+    target = base_dir / f'{jobname}.pdf'
+    if not force:
+        with metrics.stage('restore'):
+            hit = store.get_file(PDF_NAMESPACE, key, target)
+        if hit:
+            metrics.finish(target, cache_hit=True)
+            return target, True
+
+    generate(base_dir, print_mode, store, metrics)
+    compile_fn = compile_split if split else compile_pdf
+    pdf_path = compile_fn(base_dir, jobname, epoch=source_date_epoch(base_dir), metrics=metrics)
+    if pdf_path:
+        with metrics.stage('store'):
+            store.put_file(PDF_NAMESPACE, key, pdf_path)
+    metrics.finish(pdf_path, cache_hit=False)
+    return pdf_path, False
+
+
+def main():
+    """Main function to build an issue PDF through the cache."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build a Banks of the Boneyard issue PDF, reusing cached builds')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1")')
+    parser.add_argument('--print-mode', action='store_true', help='Build the print version')
+    parser.add_argument('--cache-dir', help='Artifact cache directory (default: $BANKS_CACHE_DIR or .build-cache)')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if a cached PDF exists')
+    parser.add_argument('--split', action='store_true',
+                        help='Typeset the articles, horoscope and directory in parallel and merge them')
+    parser.add_argument('--metrics-db', default=str(DEFAULT_DB),
+                        help='Build history database (default: $BANKS_METRICS_DB or .build-history.sqlite)')
+    parser.add_argument('--no-metrics', action='store_true', help='Do not record this build in the history')
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    metrics = BuildMetrics(args.base_dir, args.print_mode)
+    try:
+        pdf_path, hit = build(args.base_dir, args.print_mode, open_store(args.cache_dir), args.force, metrics,
+                              args.split)
+    finally:
+        if not args.no_metrics:
+            try:
+                record_build(metrics, args.metrics_db)
+            except sqlite3.Error as e:
+                print(f"Warning: could not record build metrics in {args.metrics_db}: {e}")
+    elapsed = time.perf_counter() - start
+
+    mode = 'Print' if args.print_mode else 'Online'
+    if pdf_path is None:
+        print(f"✗ PDF compilation failed for {args.base_dir}")
+        sys.exit(1)
+    if hit:
+        print(f"✓ {mode} PDF unchanged, restored from cache in {elapsed:.2f}s: {pdf_path}")
+    else:
+        print(f"✓ {mode} PDF compiled successfully in {elapsed:.1f}s: {pdf_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Build history: metrics for every build in a local SQLite database, with trend reports.
+
+build.py records one row per build (issue, mode, cache hit, total time,
+pdflatex pass count and time, output PDF size, input counts, artifact cache
+hits and misses, git commit) plus the duration of each stage. The report
+lists recent builds and a summary per issue; regressions compares each
+issue's latest full build with the median of its previous ones and flags
+times or PDF sizes that grew past a threshold.
+
+The database is .build-history.sqlite next to this script, or
+$BANKS_METRICS_DB (point several checkouts at one file to share history).
+
+Usage:
+    python3 build_metrics.py report [--issue vol43is1] [--mode online] [--last 20]
+    python3 build_metrics.py regressions [--threshold 20] [--window 5]
+"""
+
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_DB = Path(os.environ.get('BANKS_METRICS_DB', SCRIPT_DIR / '.build-history.sqlite'))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    issue TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    status TEXT NOT NULL,
+    cache_hit INTEGER NOT NULL,
+    total_seconds REAL,
+    pdflatex_passes INTEGER,
+    pdflatex_seconds REAL,
+    pdf_bytes INTEGER,
+    input_files INTEGER,
+    input_bytes INTEGER,
+    articles INTEGER,
+    images INTEGER,
+    image_bytes INTEGER,
+    fragment_hits INTEGER,
+    fragment_misses INTEGER,
+    git_commit TEXT,
+    host TEXT
+);
+CREATE INDEX IF NOT EXISTS builds_by_issue ON builds (issue, mode, started_at);
+CREATE TABLE IF NOT EXISTS stages (
+    build_id INTEGER NOT NULL REFERENCES builds (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (build_id, stage)
+);
+"""
+
+# (column, label, minimum absolute change worth flagging) checked by find_regressions
+TRACKED_METRICS = (
+    ('total_seconds', 'total time', 0.5),
+    ('pdflatex_seconds', 'pdflatex time', 0.5),
+    ('generate_seconds', 'generate time', 0.2),
+    ('pdf_bytes', 'PDF size', 10 * 1024),
+)
+
+
+def git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class BuildMetrics:
+    """Measurements for one build, filled in by build.py as it runs"""
+
+    def __init__(self, base_dir, print_mode=False):
+        self.issue = Path(base_dir).resolve().name
+        self.mode = 'print' if print_mode else 'online'
+        self.started_at = datetime.now(timezone.utc)
+        self.start = time.perf_counter()
+        self.stages = {}
+        # Stays 'error' unless finish() is reached
+        self.values = {'status': 'error', 'cache_hit': 0}
+        self.store = None
+        self.stats_offset = None
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block of the build; repeated stages add up"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def record_inputs(self, files):
+        """Count the build inputs, as listed by build.input_files"""
+        sizes = defaultdict(list)
+        for label, path in files:
+            try:
+                sizes[label.split('/', 1)[0]].append(path.stat().st_size)
+            except OSError:
+                pass
+        self.values.update(
+            input_files=sum(len(s) for s in sizes.values()),
+            input_bytes=sum(sum(s) for s in sizes.values()),
+            articles=len(sizes['articles']),
+            images=len(sizes['images']),
+            image_bytes=sum(sizes['images']),
+        )
+
+    def track_store(self, store):
+        """Count artifact cache hits and misses from here until finish()"""
+        if hasattr(store, 'stats_offset'):
+            self.store = store
+            self.stats_offset = store.stats_offset()
+
+    def record_pdflatex_pass(self, seconds):
+        self.values['pdflatex_passes'] = self.values.get('pdflatex_passes', 0) + 1
+        self.values['pdflatex_seconds'] = self.values.get('pdflatex_seconds', 0.0) + seconds
+        self.stages[f"pdflatex pass {self.values['pdflatex_passes']}"] = seconds
+
+    def finish(self, pdf_path, cache_hit):
+        self.values['status'] = 'ok' if pdf_path else 'failed'
+        self.values['cache_hit'] = int(cache_hit)
+        if pdf_path and Path(pdf_path).exists():
+            self.values['pdf_bytes'] = Path(pdf_path).stat().st_size
+        if self.store is not None:
+            counts = self.store.read_stats(self.stats_offset)
+            self.values['fragment_hits'] = counts['fragment']['hit']
+            self.values['fragment_misses'] = counts['fragment']['miss']
+
+    def row(self):
+        return dict(self.values,
+                    started_at=self.started_at.isoformat(timespec='seconds'),
+                    issue=self.issue,
+                    mode=self.mode,
+                    total_seconds=time.perf_counter() - self.start,
+                    git_commit=git_commit(),
+                    host=socket.gethostname())
+
+
+def open_db(path=DEFAULT_DB):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA foreign_keys=ON')
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_build(metrics, path=DEFAULT_DB):
+    """Append a finished build to the history; returns its id"""
+    row = metrics.row()
+    with open_db(path) as conn:
+        columns = ', '.join(row)
+        placeholders = ', '.join(f':{name}' for name in row)
+        build_id = conn.execute(f'INSERT INTO builds ({columns}) VALUES ({placeholders})', row).lastrowid
+        conn.executemany('INSERT INTO stages (build_id, position, stage, seconds) VALUES (?, ?, ?, ?)',
+                         [(build_id, i, name, seconds) for i, (name, seconds) in enumerate(metrics.stages.items())])
+    conn.close()
+    return build_id
+
+
+def load_builds(conn, issue=None, mode=None, limit=None):
+    """Builds (newest last) as dicts, each with its stages and generate_seconds"""
+    query = 'SELECT * FROM builds'
+    clauses, params = [], []
+    if issue:
+        clauses.append('issue = ?')
+        params.append(issue)
+    if mode:
+        clauses.append('mode = ?')
+        params.append(mode)
+    if clauses:
+        query += ' WHERE ' + ' AND '.join(clauses)
+    query += ' ORDER BY started_at DESC, id DESC'
+    if limit:
+        query += f' LIMIT {int(limit)}'
+    builds = [dict(row) for row in conn.execute(query, params)][::-1]
+
+    stages = defaultdict(dict)
+    for row in conn.execute('SELECT build_id, stage, seconds FROM stages ORDER BY build_id, position'):
+        stages[row['build_id']][row['stage']] = row['seconds']
+    for build in builds:
+        build['stages'] = stages[build['id']]
+        build['generate_seconds'] = build['stages'].get('generate')
+    return builds
+
+
+def find_regressions(builds, window=5, threshold=0.2):
+    """Compare each issue/mode's latest full build with the median of its previous ones
+
+    Only successful builds that ran pdflatex are compared (cache hits say
+    nothing about build cost). Returns (build, label, value, baseline) tuples
+    for metrics that grew by more than threshold and a minimum absolute step.
+    """
+    history = defaultdict(list)
+    for build in builds:
+        if build['status'] == 'ok' and not build['cache_hit']:
+            history[(build['issue'], build['mode'])].append(build)
+
+    regressions = []
+    for runs in history.values():
+        latest, previous = runs[-1], runs[-1 - window:-1]
+        if not previous:
+            continue
+        for column, label, min_step in TRACKED_METRICS:
+            values = [b[column] for b in previous if b[column] is not None]
+            value = latest[column]
+            if value is None or not values:
+                continue
+            baseline = median(values)
+            if value > baseline * (1 + threshold) and value - baseline >= min_step:
+                regressions.append((latest, label, value, baseline))
+    return regressions
+
+
+def format_size(num_bytes):
+    if num_bytes is None:
+        return '-'
+    for unit in ('B', 'K', 'M', 'G'):
+        if num_bytes < 1024 or unit == 'G':
+            return f'{num_bytes:.0f}{unit}' if unit == 'B' else f'{num_bytes:.1f}{unit}'
+        num_bytes /= 1024
+
+
+def format_seconds(seconds):
+    return '-' if seconds is None else f'{seconds:.1f}s'
+
+
+def format_metric(label, value):
+    return format_size(value) if label == 'PDF size' else format_seconds(value)
+
+
+def change(value, baseline):
+    if value is None or not baseline:
+        return ''
+    delta = 100 * (value - baseline) / baseline
+    return f'{delta:+.0f}%'
+
+
+def print_report(builds, history, threshold):
+    """List builds, then the latest full build of each issue in history"""
+    print(f"{'started (UTC)':<20} {'issue':<12} {'mode':<7} {'result':<7} {'total':>7} {'generate':>9} "
+          f"{'pdflatex':>9} {'passes':>6} {'pdf':>8} {'inputs':>7} {'fragments':>10}  commit")
+    for b in builds:
+        result = 'cached' if b['cache_hit'] else b['status']
+        hits, misses = b['fragment_hits'], b['fragment_misses']
+        fragments = f'{hits}/{hits + misses}' if hits is not None and hits + misses else '-'
+        print(f"{b['started_at'][:19].replace('T', ' '):<20} {b['issue']:<12} {b['mode']:<7} {result:<7} "
+              f"{format_seconds(b['total_seconds']):>7} {format_seconds(b['generate_seconds']):>9} "
+              f"{format_seconds(b['pdflatex_seconds']):>9} {b['pdflatex_passes'] or '-':>6} "
+              f"{format_size(b['pdf_bytes']):>8} {b['input_files'] or '-':>7} {fragments:>10}  {b['git_commit'] or ''}")
+
+    # Latest full build of each issue, in the order the issues were first built,
+    # with the change from the issue before it
+    latest = {}
+    counts = defaultdict(int)
+    for b in history:
+        counts[(b['issue'], b['mode'])] += 1
+        if b['status'] == 'ok' and not b['cache_hit']:
+            latest[(b['issue'], b['mode'])] = b
+    if not latest:
+        return
+    print(f"\n{'issue':<12} {'mode':<7} {'pdflatex':>9} {'':>6} {'pdf':>8} {'':>6} {'images':>8} {'builds':>7}")
+    previous = {}
+    for (issue, mode), b in latest.items():
+        before = previous.get(mode)
+        marks = []
+        for column in ('pdflatex_seconds', 'pdf_bytes'):
+            delta = change(b[column], before[column]) if before else ''
+            grew = before and b[column] and before[column] and b[column] > before[column] * (1 + threshold)
+            marks.append(f"{delta}{'▲' if grew else ''}")
+        print(f"{issue:<12} {mode:<7} {format_seconds(b['pdflatex_seconds']):>9} {marks[0]:>6} "
+              f"{format_size(b['pdf_bytes']):>8} {marks[1]:>6} {format_size(b['image_bytes']):>8} "
+              f"{counts[(issue, mode)]:>7}")
+        previous[mode] = b
+
+
+def main():
+    """Main function to report on the build history."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Report build times and PDF sizes over time')
+    parser.add_argument('--db', default=str(DEFAULT_DB),
+                        help='History database (default: $BANKS_METRICS_DB or .build-history.sqlite)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    report = subparsers.add_parser('report', help='List recent builds and the latest build of each issue')
+    report.add_argument('--issue', help='Only this issue directory (e.g., "vol43is1")')
+    report.add_argument('--mode', choices=('online', 'print'), help='Only online or print builds')
+    report.add_argument('--last', type=int, default=20, help='Number of builds to list (default: 20)')
+    report.add_argument('--threshold', type=float, default=20, help='Percent growth marked with ▲ (default: 20)')
+
+    regressions = subparsers.add_parser('regressions', help='Flag builds slower or larger than their history')
+    regressions.add_argument('--issue', help='Only this issue directory')
+    regressions.add_argument('--window', type=int, default=5, help='Previous builds in the baseline (default: 5)')
+    regressions.add_argument('--threshold', type=float, default=20, help='Percent growth flagged (default: 20)')
+
+    args = parser.parse_args()
+    if not Path(args.db).exists():
+        print(f"No build history yet ({args.db}); it is recorded by build.py (make online / make print).")
+        return
+
+    conn = open_db(args.db)
+    if args.command == 'report':
+        builds = load_builds(conn, args.issue, args.mode, args.last)
+        if not builds:
+            print("No matching builds.")
+            return
+        print_report(builds, load_builds(conn, args.issue, args.mode), args.threshold / 100)
+
+    elif args.command == 'regressions':
+        found = find_regressions(load_builds(conn, args.issue), args.window, args.threshold / 100)
+        for build, label, value, baseline in found:
+            print(f"✗ {build['issue']} ({build['mode']}, {build['started_at'][:10]}, {build['git_commit'] or 'no commit'}): "
+                  f"{label} {format_metric(label, value)} vs. median {format_metric(label, baseline)} "
+                  f"({change(value, baseline)})")
+        if found:
+            sys.exit(1)
+        print("✓ No regressions")
+
+
+if __name__ == '__main__':
+    main()
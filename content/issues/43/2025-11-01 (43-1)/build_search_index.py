@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Build the website's static search index, sharded by term prefix.
+
+Indexes the website articles (content/articles/**/*.md, and the markdown
+export_website.py writes beside each issue's JSON in
+content/articles-json/<issue>/markdown/), the articles of every issue
+directory (content/issues/**/articles/*.md, skipped when the website
+already has the same article) and the issue metadata
+(content/issues/**/issue.md), and writes to website/public/search/:
+
+    index.json                 shard file for each prefix, document chunk files
+    <prefix>-<hash>.json.gz    {term: [doc delta, tf, doc delta, tf, ...]}
+    docs<n>-<hash>.json.gz     title, URL, date and snippet of DOC_CHUNK_SIZE documents
+
+Every term lives in the shard named by its first SHARD_PREFIX_LENGTH
+characters, so a query only fetches the shards of its own terms and the
+document chunks of its top results. Postings
+are delta-encoded and every shard is gzip-compressed; shard names carry a
+content hash so unchanged shards keep their name (and their HTTP cache).
+
+Rebuilds are incremental: documents are re-tokenized only when their source
+changes (cached in .index-cache.json), and only the shards and document
+chunks those documents touch are rebuilt.
+website/src/lib/search.ts is the client side; search() below is the same
+query in Python, used by benchmark.py.
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+
+from generate_articles import parse_article_header
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ISSUES_DIR = SCRIPT_DIR.parents[1]
+CONTENT_DIR = SCRIPT_DIR.parents[2]
+DEFAULT_OUT = SCRIPT_DIR.parents[3] / 'website' / 'public' / 'search'
+
+# Bump when tokenization or the file format changes so everything is rebuilt
+INDEX_VERSION = 1
+SHARD_PREFIX_LENGTH = 2
+TITLE_WEIGHT = 3
+SNIPPET_LENGTH = 160
+DOC_CHUNK_SIZE = 256
+CACHE_NAME = '.index-cache.json'
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+MARKDOWN_SYNTAX_PATTERN = re.compile(r'[#*_>`|~]+')
+
+STOPWORDS = frozenset('''
+a an and are as at be but by for from has have he her his i if in into is it its of on or our she so
+that the their them they this to was we were what when which who will with you your
+'''.split())
+
+
+def tokenize(text):
+    """Lowercase, accent-folded search terms of a piece of text"""
+    folded = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+    return [t for t in TOKEN_PATTERN.findall(folded) if len(t) > 1 and t not in STOPWORDS]
+
+
+def plain_text(markdown_body):
+    """Article text without images, link targets and markdown markup"""
+    text = MARKDOWN_IMAGE_PATTERN.sub(' ', markdown_body)
+    text = MARKDOWN_LINK_PATTERN.sub(r'\1', text)
+    return ' '.join(MARKDOWN_SYNTAX_PATTERN.sub(' ', text).split())
+
+
+def slugify(text):
+    """Same as slugify() in website/src/lib/collections.ts"""
+    return re.sub(r'^-+|-+$', '', re.sub(r'[^a-z0-9]+', '-', str(text).strip().lower()))
+
+
+def iso_date(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10] if value else None
+
+
+def read_markdown(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        header, pending = parse_article_header(f)
+        body = ''.join(pending) + f.read()
+    return header, body
+
+
+def issue_url(header, issue_md):
+    volume = header.get('volume')
+    slug = slugify(header.get('slug') or header.get('issue') or issue_md.parent.name)
+    return f'/issues/{volume}/{slug}'
+
+
+def article_doc(header, body, url, kind, extra=None):
+    text = plain_text(body)
+    return {
+        'doc': {
+            'title': header.get('title') or 'Untitled',
+            'url': url,
+            'kind': kind,
+            'date': iso_date(header.get('date')),
+            'volume': header.get('volume'),
+            'issue': str(header['issue']) if header.get('issue') is not None else None,
+            'snippet': text[:SNIPPET_LENGTH],
+            **(extra or {}),
+        },
+        'text': f"{' '.join(header.get('authors') or [])} {header.get('subtitle') or ''} {text}",
+    }
+
+
+def collect_sources(content_dir=CONTENT_DIR, issues_dir=ISSUES_DIR):
+    """Every indexable file as (source id, path, loader) in a stable order"""
+    content_dir, issues_dir = Path(content_dir), Path(issues_dir)
+    sources = []
+    for path in sorted((content_dir / 'articles').rglob('*.md')):
+        sources.append((f'articles/{path.relative_to(content_dir / "articles").as_posix()}', path, 'article'))
+    # Pre-rendered articles: the markdown export has the same front matter as the JSON the website renders
+    for path in sorted((content_dir / 'articles-json').glob('*/markdown/*.md')):
+        sources.append((f'articles-json/{path.relative_to(content_dir / "articles-json").as_posix()}', path,
+                        'article'))
+    for path in sorted(issues_dir.rglob('issue.md')):
+        sources.append((f'issues/{path.relative_to(issues_dir).as_posix()}', path, 'issue'))
+        for article in sorted(path.parent.glob('*/articles/*.md')):
+            sources.append((f'issues/{article.relative_to(issues_dir).as_posix()}', article, 'issue-article'))
+    return sources
+
+
+def load_source(path, kind):
+    """Parse one source into {'doc': metadata, 'text': body text}"""
+    header, body = read_markdown(path)
+    if kind == 'article':
+        slug = slugify(header.get('slug') or f"{iso_date(header.get('date'))}-{header.get('title')}")
+        return article_doc(header, body, f'/articles/{slug}', 'article')
+
+    if kind == 'issue':
+        credits = ' '.join(' '.join([c.get('title', '')] + list(c.get('names', [])))
+                           for c in header.get('credits') or [])
+        title = f"Volume {header.get('volume')}, Issue {header.get('issue')}"
+        return {
+            'doc': {'title': title, 'url': issue_url(header, path), 'kind': 'issue',
+                    'date': iso_date(header.get('date')), 'volume': header.get('volume'),
+                    'issue': str(header.get('issue')), 'snippet': plain_text(body)[:SNIPPET_LENGTH]},
+            'text': f'{credits} {plain_text(body)}',
+        }
+
+    # Issue-directory article: volume/issue/date come from the issue it belongs to
+    issue_md = path.parents[2] / 'issue.md'
+    issue_header, _ = read_markdown(issue_md) if issue_md.exists() else ({}, '')
+    for key in ('volume', 'issue', 'date'):
+        if header.get(key) is None:
+            header[key] = issue_header.get(key)
+    slug = slugify(f"{iso_date(header.get('date'))}-{header.get('title')}")
+    return article_doc(header, body, issue_url(issue_header, issue_md), 'issue-article',
+                       {'article_slug': f'/articles/{slug}'})
+
+
+def source_hash(path):
+    digest = hashlib.sha256(f'search-v{INDEX_VERSION}\0'.encode())
+    digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cache(out_dir):
+    cache_path = out_dir / CACHE_NAME
+    if cache_path.exists():
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == INDEX_VERSION:
+            return cache
+    return {'version': INDEX_VERSION, 'ids': {}, 'next_id': 0, 'sources': {}}
+
+
+def term_counts(entry):
+    counts = Counter(tokenize(entry['text']))
+    for term in tokenize(entry['doc']['title']):
+        counts[term] += TITLE_WEIGHT
+    return dict(counts)
+
+
+def encode_postings(postings):
+    """[(doc id, tf), ...] sorted by id -> flat delta-encoded list"""
+    flat, previous = [], 0
+    for doc_id, tf in postings:
+        flat.extend((doc_id - previous, tf))
+        previous = doc_id
+    return flat
+
+
+def decode_postings(flat):
+    postings, doc_id = [], 0
+    for i in range(0, len(flat), 2):
+        doc_id += flat[i]
+        postings.append((doc_id, flat[i + 1]))
+    return postings
+
+
+def shard_prefix(term):
+    return term[:SHARD_PREFIX_LENGTH]
+
+
+def write_gzip_json(out_dir, stem, value, existing):
+    """Write value as <stem>-<hash>.json.gz unless that exact file exists; returns (name, written)"""
+    data = gzip.compress(json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8'), mtime=0)
+    name = f'{stem}-{hashlib.sha256(data).hexdigest()[:10]}.json.gz'
+    if name in existing:
+        return name, False
+    (out_dir / name).write_bytes(data)
+    return name, True
+
+
+def build_index(out_dir=DEFAULT_OUT, content_dir=CONTENT_DIR, issues_dir=ISSUES_DIR, force=False):
+    """Build or update the index in out_dir; returns (documents, retokenized, files written)"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cache = {'version': INDEX_VERSION, 'ids': {}, 'next_id': 0, 'sources': {}} if force else load_cache(out_dir)
+    old_sources = cache['sources']
+
+    entries = {}
+    retokenized = 0
+    for source_id, path, kind in collect_sources(content_dir, issues_dir):
+        digest = source_hash(path)
+        cached = old_sources.get(source_id)
+        if cached and cached['hash'] == digest:
+            entries[source_id] = cached
+            continue
+        entry = load_source(path, kind)
+        entries[source_id] = {'hash': digest, 'doc': entry['doc'], 'terms': term_counts(entry)}
+        retokenized += 1
+
+    # Issue articles already published as website articles are indexed once, under the website URL
+    article_urls = {e['doc']['url'] for e in entries.values() if e['doc']['kind'] == 'article'}
+    live = {sid: e for sid, e in entries.items()
+            if e['doc'].get('article_slug') not in article_urls}
+
+    # Stable document ids, so one changed article does not renumber (and rewrite) every shard
+    old_ids = cache['ids']
+    ids = {sid: doc_id for sid, doc_id in old_ids.items() if sid in live}
+    next_id = cache['next_id']
+    if len(ids) < next_id // 2:
+        ids, next_id = {}, 0
+    for sid in sorted(live):
+        if sid not in ids:
+            ids[sid] = next_id
+            next_id += 1
+
+    # Only shards and document chunks touched by added, changed or removed documents are rebuilt
+    dirty_prefixes, dirty_chunks = set(), set()
+    for sid in live.keys() | old_ids.keys():
+        old, new = old_sources.get(sid), live.get(sid)
+        unchanged = (old is not None and new is not None and old['hash'] == new['hash']
+                     and sid in old_ids and old_ids[sid] == ids.get(sid))
+        if unchanged:
+            continue
+        for entry in (old, new):
+            if entry:
+                dirty_prefixes.update(shard_prefix(term) for term in entry['terms'])
+        for doc_id in (old_ids.get(sid), ids.get(sid)):
+            if doc_id is not None:
+                dirty_chunks.add(doc_id // DOC_CHUNK_SIZE)
+
+    existing = {p.name for p in out_dir.glob('*.json.gz')}
+    old_shards = cache.get('shards', {})
+    old_chunks = cache.get('doc_chunks', [])
+
+    postings = {}
+    for sid, entry in live.items():
+        doc_id = ids[sid]
+        for term, tf in entry['terms'].items():
+            prefix = shard_prefix(term)
+            if prefix in dirty_prefixes or old_shards.get(prefix) not in existing:
+                postings.setdefault(prefix, {}).setdefault(term, []).append((doc_id, tf))
+
+    written = 0
+    all_prefixes = {shard_prefix(term) for entry in live.values() for term in entry['terms']}
+    shard_files = {}
+    for prefix in sorted(all_prefixes):
+        if prefix not in postings:
+            shard_files[prefix] = old_shards[prefix]
+            continue
+        terms = {term: encode_postings(sorted(p)) for term, p in sorted(postings[prefix].items())}
+        shard_files[prefix], was_written = write_gzip_json(out_dir, prefix, terms, existing)
+        written += was_written
+
+    docs = [None] * next_id
+    for sid, entry in live.items():
+        docs[ids[sid]] = {k: v for k, v in entry['doc'].items() if k != 'article_slug'}
+    doc_chunks = []
+    for chunk in range(-(-next_id // DOC_CHUNK_SIZE)):
+        previous = old_chunks[chunk] if chunk < len(old_chunks) else None
+        if chunk not in dirty_chunks and previous in existing:
+            doc_chunks.append(previous)
+            continue
+        name, was_written = write_gzip_json(
+            out_dir, f'docs{chunk}', docs[chunk * DOC_CHUNK_SIZE:(chunk + 1) * DOC_CHUNK_SIZE], existing)
+        doc_chunks.append(name)
+        written += was_written
+
+    for name in existing - set(shard_files.values()) - set(doc_chunks):
+        (out_dir / name).unlink()
+
+    index = {
+        'version': INDEX_VERSION,
+        'prefix_length': SHARD_PREFIX_LENGTH,
+        'stopwords': sorted(STOPWORDS),
+        'document_count': len(live),
+        'doc_chunk_size': DOC_CHUNK_SIZE,
+        'doc_chunks': doc_chunks,
+        'shards': shard_files,
+    }
+    with open(out_dir / 'index.json', 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'), ensure_ascii=False)
+
+    cache = {'version': INDEX_VERSION, 'ids': ids, 'next_id': next_id, 'sources': entries,
+             'shards': shard_files, 'doc_chunks': doc_chunks}
+    with open(out_dir / CACHE_NAME, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, separators=(',', ':'))
+
+    return len(live), retokenized, written
+
+
+def load_gzip_json(out_dir, name):
+    with gzip.open(Path(out_dir) / name, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def search(out_dir, query, limit=10, index=None, file_cache=None):
+    """Rank documents for query, loading only the shards its terms need
+
+    The last query term also matches as a prefix (search as you type).
+    Returns [(score, document)] best first.
+    """
+    if index is None:
+        with open(Path(out_dir) / 'index.json', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    file_cache = {} if file_cache is None else file_cache
+
+    def load(name):
+        if name not in file_cache:
+            file_cache[name] = load_gzip_json(out_dir, name)
+        return file_cache[name]
+
+    terms = tokenize(query)
+    total = index['document_count'] or 1
+    scores = Counter()
+    for position, term in enumerate(terms):
+        name = index['shards'].get(term[:index['prefix_length']])
+        if not name:
+            continue
+        shard = load(name)
+        is_last = position == len(terms) - 1
+        matches = [t for t in shard if t.startswith(term)] if is_last else [term]
+        for match in matches:
+            postings = decode_postings(shard.get(match, []))
+            if not postings:
+                continue
+            idf = math.log(1 + total / len(postings))
+            for doc_id, tf in postings:
+                scores[doc_id] += (1 + math.log(tf)) * idf
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    chunk_size = index['doc_chunk_size']
+    return [(score, load(index['doc_chunks'][doc_id // chunk_size])[doc_id % chunk_size])
+            for doc_id, score in ranked]
+
+
+def main():
+    """Main function to build the search index."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build the sharded static search index for the website')
+    parser.add_argument('--out', default=str(DEFAULT_OUT), help='Output directory (default: website/public/search)')
+    parser.add_argument('--force', action='store_true', help='Re-tokenize every document')
+    parser.add_argument('--query', help='Run a query against the built index and print the results')
+
+    args = parser.parse_args()
+
+    if args.query:
+        for score, doc in search(args.out, args.query):
+            print(f"{score:7.2f}  {doc['title']}  ({doc['url']})")
+        return
+
+    documents, retokenized, written = build_index(args.out, force=args.force)
+    files = list(Path(args.out).glob('*.json.gz'))
+    size = sum(p.stat().st_size for p in files)
+    print(f"✓ Indexed {documents} documents ({retokenized} re-tokenized) into {len(files)} files "
+          f"({size / 1024:.1f}K compressed, {written} rewritten)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Compile every article on its own to find LaTeX errors before the full build.
+
+Each article (the letter from the chair included) is rendered with
+NewspaperGenerator and wrapped in a standalone document that reuses the
+preamble of main.tex, then compiled with pdflatex -halt-on-error in parallel,
+one process per article with a timeout. Missing images are caught before
+pdflatex runs. For every failure the report names the article, the error,
+the offending line of the generated LaTeX and the closest line of the
+article's markdown source.
+
+Scratch files go to {base_dir}/content/check/ (kept only for failures).
+Exits with status 1 if any article fails.
+
+Usage: python3 check_articles.py vol43is1 [--print-mode] [--jobs 8] [--timeout 60]
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from generate_newspaper import NewspaperGenerator
+
+CHECK_DIR = Path('content') / 'check'
+
+INCLUDEGRAPHICS_PATTERN = re.compile(r'\\includegraphics(?:\[[^\]]*\])?\{([^}]+)\}')
+# -file-line-error messages: ./content/check/<name>.tex:<line>: <message>
+FILE_LINE_ERROR_PATTERN = re.compile(r'^(\S+\.(?:tex|sty|cls)):(\d+): (.*)$')
+LATEX_COMMAND_PATTERN = re.compile(r'\\[a-zA-Z]+\*?|[{}\[\]\\$&%#_^~]')
+WORD_PATTERN = re.compile(r'\w{3,}')
+
+
+def standalone_document(preamble, fragment_path, full_width):
+    """A document containing just one article, with the issue's preamble"""
+    body = f'\\input{{./{fragment_path.as_posix()}}}'
+    if not full_width:
+        body = f'\\begin{{multicols}}{{2}}\n{body}\n\\end{{multicols}}'
+    return f'{preamble}\\begin{{document}}\n\n{body}\n\n\\end{{document}}\n'
+
+
+def missing_images(base_dir, tex):
+    """Image paths referenced by the LaTeX that do not exist"""
+    return [path for path in INCLUDEGRAPHICS_PATTERN.findall(tex) if not (base_dir / path).exists()]
+
+
+def first_error(log_text, fragment_name):
+    """(message, line in the fragment or None) of the first error in a pdflatex log"""
+    lines = log_text.splitlines()
+    for i, line in enumerate(lines):
+        match = FILE_LINE_ERROR_PATTERN.match(line)
+        if match:
+            path, lineno, message = match.groups()
+            # Undefined control sequences name the command on the next line
+            detail = lines[i + 1].strip() if i + 1 < len(lines) and lines[i + 1].startswith('l.') else ''
+            in_fragment = Path(path).name == fragment_name
+            return f'{message} {detail}'.strip(), int(lineno) if in_fragment else None
+        if line.startswith('! '):
+            return line[2:].strip(), None
+    return 'pdflatex failed without an error message', None
+
+
+def source_line(markdown_lines, tex_line, needle=None):
+    """Best guess at the markdown line a generated LaTeX line came from (1-based), or None"""
+    if needle:
+        return next((i for i, line in enumerate(markdown_lines, 1) if needle in line), None)
+    words = set(WORD_PATTERN.findall(LATEX_COMMAND_PATTERN.sub(' ', tex_line).lower()))
+    if not words:
+        return None
+    best, best_score = None, 0
+    for i, line in enumerate(markdown_lines, 1):
+        score = len(words & set(WORD_PATTERN.findall(line.lower())))
+        if score > best_score:
+            best, best_score = i, score
+    return best
+
+
+def compile_article(base_dir, name, tex_path, timeout):
+    """Run pdflatex on one standalone article; returns (ok, log text)"""
+    out_dir = tex_path.parent / name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cmd = ['pdflatex', '-interaction=nonstopmode', '-halt-on-error', '-file-line-error',
+           f'-output-directory={out_dir.relative_to(base_dir).as_posix()}',
+           f'-jobname={name}', tex_path.relative_to(base_dir).as_posix()]
+    try:
+        result = subprocess.run(cmd, cwd=base_dir, capture_output=True, text=True,
+                                errors='replace', timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False, f'! Timed out after {timeout:g}s (runaway macro or missing \\end?)'
+    log_path = out_dir / f'{name}.log'
+    log_text = log_path.read_text(encoding='utf-8', errors='replace') if log_path.exists() else result.stdout
+    return result.returncode == 0, log_text
+
+
+def check_article(base_dir, name, tex, full_width, preamble, timeout):
+    """Compile one rendered article; returns None if it is fine, else a failure dict"""
+    if not tex:
+        return {'article': name, 'error': 'Article could not be loaded (run generate_articles.py?)', 'tex_line': None}
+    check_dir = base_dir / CHECK_DIR
+    fragment_path = check_dir / f'{name}-body.tex'
+    fragment_path.write_text(tex, encoding='utf-8')
+
+    missing = missing_images(base_dir, tex)
+    if missing:
+        return {'article': name, 'error': f"Missing image(s): {', '.join(missing)}",
+                'tex_line': next(i for i, line in enumerate(tex.splitlines(), 1) if missing[0] in line),
+                'needle': Path(missing[0]).name}
+
+    tex_path = check_dir / f'{name}.tex'
+    tex_path.write_text(standalone_document(preamble, fragment_path.relative_to(base_dir), full_width),
+                        encoding='utf-8')
+    ok, log_text = compile_article(base_dir, name, tex_path, timeout)
+    if ok:
+        return None
+    message, tex_line = first_error(log_text, fragment_path.name)
+    return {'article': name, 'error': message, 'tex_line': tex_line,
+            'log': (CHECK_DIR / name / f'{name}.log').as_posix()}
+
+
+def check_articles(base_dir, print_mode=False, jobs=None, timeout=60.0, only=None):
+    """Compile every article standalone in parallel; returns (checked names, failures)"""
+    base_dir = Path(base_dir).resolve()
+    generator = NewspaperGenerator(base_dir, print_mode=print_mode)
+    letter = generator.config.get('letter_from_the_chair')
+    names = ([letter] if letter else []) + [n for n in generator.config.get('article_order', []) if n != letter]
+    if only:
+        names = [n for n in names if n in only]
+
+    check_dir = base_dir / CHECK_DIR
+    shutil.rmtree(check_dir, ignore_errors=True)
+    check_dir.mkdir(parents=True)
+
+    main_tex = (base_dir / 'main.tex').read_text(encoding='utf-8')
+    preamble = main_tex.split('\\begin{document}', 1)[0]
+
+    # Rendering is quick and prints warnings, so it stays on this thread; only pdflatex runs in parallel
+    with redirect_stdout(StringIO()):
+        rendered = {name: generator.generate_letter_tex() if name == letter else generator.generate_article_tex(name)
+                    for name in names}
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+        results = list(executor.map(
+            lambda name: check_article(base_dir, name, rendered[name], name == letter, preamble, timeout), names))
+    failures = [r for r in results if r]
+
+    for failure in failures:
+        fragment = check_dir / f"{failure['article']}-body.tex"
+        md_path = base_dir / 'articles' / f"{failure['article']}.md"
+        failure['tex_text'] = failure['md_line'] = None
+        if failure['tex_line'] and fragment.exists():
+            failure['tex_text'] = fragment.read_text(encoding='utf-8').splitlines()[failure['tex_line'] - 1]
+            if md_path.exists():
+                md_lines = md_path.read_text(encoding='utf-8').splitlines()
+                failure['md_line'] = source_line(md_lines, failure['tex_text'], failure.get('needle'))
+
+    failed = {f['article'] for f in failures}
+    for name in names:
+        if name not in failed:
+            shutil.rmtree(check_dir / name, ignore_errors=True)
+            for suffix in ('.tex', '-body.tex'):
+                (check_dir / f'{name}{suffix}').unlink(missing_ok=True)
+    if not failures:
+        shutil.rmtree(check_dir, ignore_errors=True)
+    return names, failures
+
+
+def main():
+    """Main function to check each article compiles on its own."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compile each article standalone to isolate LaTeX errors')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1"); run generate_articles.py first')
+    parser.add_argument('--print-mode', action='store_true', help='Check the print rendering (QR codes)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Parallel pdflatex runs (default: one per core)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Seconds allowed per article (default: 60)')
+    parser.add_argument('--only', type=lambda v: [name.strip() for name in v.split(',') if name.strip()],
+                        help='Comma-separated article names to check (default: all)')
+
+    args = parser.parse_args()
+
+    if shutil.which('pdflatex') is None:
+        print("Error: pdflatex not found on PATH")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    names, failures = check_articles(args.base_dir, args.print_mode, args.jobs, args.timeout, args.only)
+    elapsed = time.perf_counter() - start
+
+    for failure in failures:
+        name = failure['article']
+        location = f"articles/{name}.md:{failure['md_line']}" if failure['md_line'] else f"articles/{name}.md"
+        print(f"✗ {location}: {failure['error']}")
+        if failure['tex_line']:
+            print(f"    generated LaTeX line {failure['tex_line']}: {failure['tex_text'].strip()[:120]}")
+        if failure.get('log'):
+            print(f"    see {failure['log']}")
+
+    if failures:
+        print(f"\n✗ {len(failures)} of {len(names)} article(s) failed to compile ({elapsed:.1f}s)")
+        sys.exit(1)
+    print(f"✓ All {len(names)} articles compile on their own ({elapsed:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Check every URL that will be printed in an issue.
+
+Collects links from the parsed articles ({base_dir}/content/articles/*.yaml)
+and the directory blurb JSON ({base_dir}/content/blurb/*.json: website,
+links and URLs inside the blurb text), then checks them concurrently with a
+shared aiohttp connection pool. Each URL is tried with HEAD first and falls
+back to GET when the server rejects HEAD. A 429 response with a Retry-After
+of at most --max-retry-after seconds is retried once after waiting. Working
+links are cached in {base_dir}/content/.linkcheck-cache.json for --ttl
+seconds. tests/test_check_links.py runs the checker against a local stub
+server.
+
+Exits with status 1 if any link is broken.
+"""
+
+import asyncio
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import aiohttp
+import yaml
+
+CACHE_NAME = '.linkcheck-cache.json'
+
+# Markdown links (not images) and bare URLs in running text
+MARKDOWN_LINK_PATTERN = re.compile(r'(?<!!)\[[^\]]*\]\(([^\)\s]+)\)')
+BARE_URL_PATTERN = re.compile(r'https?://[^\s<>()\[\]"\']+')
+
+# Statuses for which a HEAD result is not trusted and GET is tried instead
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 429, 500, 501, 503}
+
+# Longest Retry-After (seconds) worth waiting for before reporting a rate-limited link
+MAX_RETRY_AFTER = 30.0
+
+USER_AGENT = 'Mozilla/5.0 (compatible; banks-link-check/1.0; +https://banks.acm.illinois.edu)'
+
+
+def urls_in_text(text):
+    """Return the http(s) URLs in a piece of markdown"""
+    urls = [m.group(1) for m in MARKDOWN_LINK_PATTERN.finditer(text)]
+    urls += [m.group(0).rstrip('.,;:!?') for m in BARE_URL_PATTERN.finditer(text)]
+    return [u for u in urls if u.startswith(('http://', 'https://'))]
+
+
+def collect_urls(base_dir):
+    """Map each URL in the issue to the sources that reference it"""
+    base_dir = Path(base_dir)
+    sources = defaultdict(set)
+
+    for article_path in sorted((base_dir / 'content' / 'articles').glob('*.yaml')):
+        with open(article_path, 'r', encoding='utf-8') as f:
+            article = yaml.safe_load(f) or {}
+        for url in urls_in_text(article.get('content') or ''):
+            sources[url].add(f'articles/{article_path.stem}')
+
+    for blurb_path in sorted((base_dir / 'content' / 'blurb').glob('*.json')):
+        with open(blurb_path, 'r', encoding='utf-8') as f:
+            blurb = json.load(f)
+        source = f'blurb/{blurb_path.stem}'
+        if blurb.get('website'):
+            sources[blurb['website']].add(source)
+        for url in (blurb.get('links') or {}).values():
+            if url:
+                sources[url].add(source)
+        for url in urls_in_text(blurb.get('blurb') or ''):
+            sources[url].add(source)
+
+    return {url: sorted(srcs) for url, srcs in sources.items()}
+
+
+def load_cache(cache_path, ttl):
+    """Load cached results that are younger than ttl seconds"""
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Only successes are reused; broken links are re-checked every run
+    now = time.time()
+    return {url: r for url, r in cache.items()
+            if r.get('ok') and now - r.get('checked_at', 0) < ttl}
+
+
+def save_cache(cache_path, results):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def retry_after_seconds(value):
+    """Seconds a Retry-After header (delay or HTTP date) asks to wait, or None if it can't be read"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+async def check_url(session, url, timeout, max_retry_after=MAX_RETRY_AFTER):
+    """Check one URL: HEAD, then GET if HEAD is refused or fails
+
+    A 429 with a short enough Retry-After is waited out and retried once.
+    """
+    result = {'url': url, 'status': None, 'ok': False, 'error': None, 'method': 'HEAD'}
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    methods = ['HEAD', 'GET']
+    retried = False
+    while methods:
+        method = methods.pop(0)
+        result['method'] = method
+        delay = None
+        try:
+            async with session.request(method, url, allow_redirects=True, timeout=client_timeout) as response:
+                result['status'] = response.status
+                result['error'] = None
+                retry_after = (retry_after_seconds(response.headers.get('Retry-After'))
+                               if response.status == 429 else None)
+                if retry_after is not None and retry_after <= max_retry_after and not retried:
+                    retried = True
+                    methods.insert(0, method)
+                    delay = retry_after
+                elif not (method == 'HEAD' and response.status in HEAD_FALLBACK_STATUSES):
+                    result['ok'] = response.status < 400
+                    break
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            result['error'] = f'{type(e).__name__}: {e}'.rstrip(': ')
+        if delay is not None:
+            # Wait outside the request so the connection goes back to the pool meanwhile
+            await asyncio.sleep(delay)
+
+    result['checked_at'] = time.time()
+    return result
+
+
+async def check_urls(urls, per_host=4, total=32, timeout=15.0, max_retry_after=MAX_RETRY_AFTER):
+    """Check urls concurrently on one connection pool; returns {url: result}"""
+    connector = aiohttp.TCPConnector(limit=total, limit_per_host=per_host)
+    headers = {'User-Agent': USER_AGENT}
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        results = await asyncio.gather(*(check_url(session, url, timeout, max_retry_after) for url in urls))
+    return {r['url']: r for r in results}
+
+
+def run_link_check(base_dir, ttl=24 * 60 * 60, per_host=4, total=32, timeout=15.0, use_cache=True,
+                   max_retry_after=MAX_RETRY_AFTER):
+    """Check every URL in the issue; returns (results, sources, cached_count)"""
+    base_dir = Path(base_dir)
+    cache_path = base_dir / 'content' / CACHE_NAME
+
+    sources = collect_urls(base_dir)
+    cached = load_cache(cache_path, ttl) if use_cache else {}
+
+    results = {url: cached[url] for url in sources if url in cached}
+    to_check = [url for url in sources if url not in results]
+    if to_check:
+        results.update(asyncio.run(check_urls(to_check, per_host, total, timeout, max_retry_after)))
+
+    if use_cache:
+        save_cache(cache_path, {**cached, **results})
+    return results, sources, len(sources) - len(to_check)
+
+
+def main():
+    """Main function to check the links in an issue."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Check every URL in a Banks of the Boneyard issue')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1"); run the generators first')
+    parser.add_argument('--ttl', type=float, default=24 * 60 * 60,
+                        help='Seconds a cached result stays valid (default: 86400)')
+    parser.add_argument('--per-host', type=int, default=4, help='Concurrent connections per host (default: 4)')
+    parser.add_argument('--total', type=int, default=32, help='Concurrent connections overall (default: 32)')
+    parser.add_argument('--timeout', type=float, default=15.0, help='Seconds per request (default: 15)')
+    parser.add_argument('--max-retry-after', type=float, default=MAX_RETRY_AFTER,
+                        help='Longest Retry-After to wait for on HTTP 429, in seconds (default: 30)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the result cache')
+
+    args = parser.parse_args()
+
+    base_dir = Path(args.base_dir)
+    if not (base_dir / 'content').is_dir():
+        print(f"Error: Generated content not found in {base_dir / 'content'}")
+        print("Run generate_articles.py and generate_json.py first.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results, sources, cached_count = run_link_check(
+        base_dir, args.ttl, args.per_host, args.total, args.timeout, not args.no_cache, args.max_retry_after)
+    elapsed = time.perf_counter() - start
+
+    broken = [results[url] for url in sorted(sources) if not results[url]['ok']]
+    for result in broken:
+        reason = result['error'] or f"HTTP {result['status']}"
+        print(f"✗ {result['url']} ({reason})")
+        for source in sources[result['url']]:
+            print(f"    in {source}")
+
+    print(f"\nChecked {len(sources)} links in {elapsed:.1f}s ({cached_count} from cache).")
+    if broken:
+        print(f"✗ {len(broken)} broken link(s)")
+        sys.exit(1)
+    print("✓ All links OK")
+
+
+if __name__ == '__main__':
+    main()
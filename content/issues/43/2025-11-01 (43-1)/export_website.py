@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Export an issue's articles for the Banks website.
+
+Reads {base_dir}/articles/*.md and writes, straight into the website's inputs:
+  - content/articles-json/vol<V>iss<I>/<article>.json   pre-rendered article (front matter fields + html)
+  - content/articles-json/vol<V>iss<I>/markdown/<article>.md
+                                                         website markdown with YAML front matter
+  - website/public/assets/<hash>.<ext>                  article images, named by content hash
+
+An article edited for the website (tags, wording that only makes sense
+online) is kept next to the print one as {base_dir}/articles/website/<article>.md
+and exported in its place. Image references are rewritten to the hashed
+asset URLs. The export is incremental: articles whose source and images are
+unchanged since the last run are skipped, so the deploy only re-renders
+what changed.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import markdown
+import yaml
+
+from generate_articles import parse_article_header
+
+# Bump when the export format changes so every article is regenerated
+EXPORT_VERSION = 1
+
+MANIFEST_NAME = '.export-manifest.json'
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[3]
+JSON_ROOT = REPO_ROOT / 'content' / 'articles-json'
+ASSETS_DIR = REPO_ROOT / 'website' / 'public' / 'assets'
+
+# Subdirectory of articles/ holding the website edits of articles
+WEBSITE_EDITS_DIR = 'website'
+
+IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+
+
+def hash_file(path, chunk_size=1 << 16):
+    """Return the sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def asset_name(image_path, digest):
+    """Content-addressed file name for an image."""
+    return f'{digest[:16]}{image_path.suffix.lower()}'
+
+
+def load_issue_meta(base_dir):
+    """Volume, issue and date for the articles' front matter."""
+    with open(base_dir / 'config.yaml', 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    meta = {'volume': config['volume'], 'issue': config['issue'], 'date': config.get('date')}
+
+    # issue.md next to the issue directory carries the publication date
+    issue_md = base_dir.resolve().parent / 'issue.md'
+    if meta['date'] is None and issue_md.exists():
+        with open(issue_md, 'r', encoding='utf-8') as f:
+            issue_header, _ = parse_article_header(f)
+        meta['date'] = issue_header.get('date')
+
+    if isinstance(meta['date'], str):
+        meta['date'] = date.fromisoformat(meta['date'])
+    return meta
+
+
+def issue_slug(issue_meta):
+    """Directory of an issue under content/articles-json, e.g. vol43iss1."""
+    return f"vol{issue_meta['volume']}iss{issue_meta['issue']}"
+
+
+def referenced_images(body, images_dir):
+    """Map each image reference in the body to its file under images_dir."""
+    images = {}
+    for match in IMAGE_PATTERN.finditer(body):
+        ref = match.group(2).strip()
+        if '://' in ref:
+            continue
+        path = images_dir / (ref[2:] if ref.startswith('./') else ref)
+        if path.exists():
+            images[ref] = path
+    return images
+
+
+def source_hash(md_path, image_digests, issue_meta):
+    """Key that changes whenever anything feeding an article's export changes."""
+    digest = hashlib.sha256()
+    digest.update(f'v{EXPORT_VERSION}\0'.encode())
+    digest.update(json.dumps(issue_meta, default=str, sort_keys=True).encode())
+    digest.update(hash_file(md_path).encode())
+    for ref in sorted(image_digests):
+        digest.update(f'\0{ref}\0{image_digests[ref]}'.encode())
+    return digest.hexdigest()
+
+
+def rewrite_images(body, asset_urls):
+    """Point image references at their hashed asset URLs."""
+    def replace_image(match):
+        url = asset_urls.get(match.group(2).strip())
+        if url is None:
+            return match.group(0)
+        return f'![{match.group(1)}]({url})'
+    return IMAGE_PATTERN.sub(replace_image, body)
+
+
+def front_matter(header, issue_meta):
+    """Build the website front matter for an article."""
+    data = {
+        'volume': issue_meta['volume'],
+        'issue': issue_meta['issue'],
+        'title': header.get('title') or 'Untitled',
+        'date': header.get('date') or issue_meta['date'],
+        'authors': header.get('authors') or [],
+    }
+    for key in ('subtitle', 'byline', 'tags'):
+        if header.get(key):
+            data[key] = header[key]
+    return data
+
+
+def json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f'Cannot serialise {type(value).__name__}')
+
+
+def place_assets(images, image_digests, assets_dir, assets_url, assets=None):
+    """Put each image in assets_dir under its hashed name. Returns {ref: url}.
+
+    With an AssetStore (see asset_store.py) images are linked from the shared
+    store instead of copied.
+    """
+    asset_urls = {}
+    for ref, image_path in images.items():
+        name = asset_name(image_path, image_digests[ref])
+        target = assets_dir / name
+        if not target.exists():
+            if assets is not None:
+                assets.materialize(assets.add(image_path, image_digests[ref]), target)
+            else:
+                shutil.copyfile(image_path, target)
+        asset_urls[ref] = f'{assets_url.rstrip("/")}/{name}'
+    return asset_urls
+
+
+def export_article(md_path, name, asset_urls, issue_meta, out_dir):
+    """Write the JSON and markdown exports for one article."""
+    with open(md_path, 'r', encoding='utf-8') as f:
+        header, pending = parse_article_header(f)
+        body = (''.join(pending) + f.read()).strip()
+
+    body = rewrite_images(body, asset_urls)
+    data = front_matter(header, issue_meta)
+
+    md_out = out_dir / 'markdown' / f'{name}.md'
+    with open(md_out, 'w', encoding='utf-8') as f:
+        f.write('---\n')
+        f.write(yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
+        f.write('---\n\n')
+        f.write(body + '\n')
+
+    rendered = dict(data)
+    rendered['html'] = markdown.markdown(body, extensions=['extra', 'sane_lists'])
+    json_out = out_dir / f'{name}.json'
+    with open(json_out, 'w', encoding='utf-8') as f:
+        json.dump(rendered, f, indent=2, ensure_ascii=False, default=json_default)
+        f.write('\n')
+
+    return [md_out, json_out]
+
+
+def load_manifest(out_dir):
+    manifest_path = out_dir / MANIFEST_NAME
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_manifest(out_dir, manifest):
+    with open(out_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def export_issue(base_dir, out_dir=None, assets_dir=ASSETS_DIR, assets_url='/assets', force=False,
+                 assets=None):
+    """Export every article in base_dir, skipping unchanged ones. Returns (exported, skipped).
+
+    out_dir defaults to the issue's directory under content/articles-json. It
+    is committed together with its manifest; assets_dir is not, so the
+    assets of skipped articles are still put in place.
+    """
+    base_dir = Path(base_dir)
+    articles_dir = base_dir / 'articles'
+    images_dir = articles_dir / 'images'
+    website_edits = {path.stem: path for path in (articles_dir / WEBSITE_EDITS_DIR).glob('*.md')}
+
+    issue_meta = load_issue_meta(base_dir)
+    out_dir = Path(out_dir) if out_dir else JSON_ROOT / issue_slug(issue_meta)
+    assets_dir = Path(assets_dir)
+    (out_dir / 'markdown').mkdir(parents=True, exist_ok=True)
+    assets_dir.mkdir(parents=True, exist_ok=True)
+
+    old_manifest = {} if force else load_manifest(out_dir)
+    manifest = {}
+    exported, skipped = [], []
+
+    for print_path in sorted(articles_dir.glob('*.md')):
+        name = print_path.stem
+        md_path = website_edits.get(name, print_path)
+        body = md_path.read_text(encoding='utf-8')
+        images = referenced_images(body, images_dir)
+        image_digests = {ref: hash_file(path) for ref, path in images.items()}
+        key = source_hash(md_path, image_digests, {**issue_meta, 'assets_url': assets_url})
+        asset_urls = place_assets(images, image_digests, assets_dir, assets_url, assets)
+
+        previous = old_manifest.get(name)
+        if previous and previous['source_hash'] == key and all(
+                (out_dir / output).exists() for output in previous['outputs']):
+            manifest[name] = previous
+            skipped.append(name)
+            continue
+
+        outputs = export_article(md_path, name, asset_urls, issue_meta, out_dir)
+        manifest[name] = {
+            'source_hash': key,
+            'outputs': [str(output.relative_to(out_dir)) for output in outputs],
+        }
+        exported.append(name)
+        print(f"Exported {md_path.relative_to(articles_dir)}")
+
+    # Drop exports for articles that were removed from the issue
+    for name, entry in old_manifest.items():
+        if name not in manifest:
+            for output in entry['outputs']:
+                (out_dir / output).unlink(missing_ok=True)
+            print(f"Removed stale export for {name}")
+
+    save_manifest(out_dir, manifest)
+    return exported, skipped
+
+
+def main():
+    """Main function to export articles for the website."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Export an issue\'s articles as pre-rendered JSON and website markdown'
+    )
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1")')
+    parser.add_argument('--out', help='Directory for the JSON and markdown '
+                                      '(default: content/articles-json/vol<V>iss<I>)')
+    parser.add_argument('--assets-dir', default=str(ASSETS_DIR),
+                        help='Directory for the hashed images (default: website/public/assets)')
+    parser.add_argument('--assets-url', default='/assets',
+                        help='URL prefix the website serves the hashed assets from (default: /assets)')
+    parser.add_argument('--force', action='store_true', help='Re-export every article')
+    parser.add_argument('--copy-assets', action='store_true',
+                        help='Copy images instead of linking them from the shared asset store')
+
+    args = parser.parse_args()
+
+    base_dir = Path(args.base_dir)
+    if not (base_dir / 'articles').is_dir():
+        print(f"Error: Input directory not found: {base_dir / 'articles'}", file=sys.stderr)
+        sys.exit(1)
+
+    out_dir = Path(args.out) if args.out else JSON_ROOT / issue_slug(load_issue_meta(base_dir))
+    assets = None
+    if not args.copy_assets:
+        from asset_store import AssetStore
+        assets = AssetStore()
+    exported, skipped = export_issue(base_dir, out_dir, args.assets_dir, args.assets_url, args.force,
+                                     assets)
+
+    print(f"\n✓ Website export complete! {len(exported)} exported, {len(skipped)} unchanged.")
+    print(f"Output written to {out_dir} and {args.assets_dir}")
+
+
+if __name__ == '__main__':
+    main()
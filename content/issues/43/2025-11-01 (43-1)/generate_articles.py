@@ -5,63 +5,159 @@ Reads all markdown files from {article_dir}/articles/
 and converts them to YAML format in {article_dir}/content/articles/
 """
 
+import ast
+import io
 import yaml
-import re
 import sys
 from pathlib import Path
 
 
-def parse_markdown_article(markdown_content):
+# Keys recognised in the legacy "key: value" header. Anything else ends the
+# header, so a body that starts right after the title line is not swallowed.
+LEGACY_HEADER_KEYS = ('title', 'authors', 'author')
+
+FRONT_MATTER_DELIMITER = '---'
+
+
+def parse_authors(value):
     """
-    Parse markdown article format into components.
-    
-    Expected format:
+    Parse an author list without eval.
+
+    Accepts a list (already parsed front matter), a Python/JSON style list
+    literal such as "['Author 1', 'Author 2']", or a bare author string.
+    """
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(a).strip() for a in value if str(a).strip()]
+
+    authors_str = str(value).strip()
+    if not authors_str:
+        return []
+
+    try:
+        authors = ast.literal_eval(authors_str)
+    except (ValueError, SyntaxError):
+        authors = None
+
+    if isinstance(authors, (list, tuple)):
+        return [str(a).strip() for a in authors if str(a).strip()]
+    if isinstance(authors, str):
+        return [authors.strip()] if authors.strip() else []
+
+    # Fallback: try to parse manually
+    authors_str = authors_str.strip('[]')
+    return [a.strip().strip("'\"") for a in authors_str.split(',') if a.strip().strip("'\"")]
+
+
+def _parse_front_matter(lines):
+    """Consume YAML front matter lines up to the closing '---'."""
+    header_lines = []
+    for line in lines:
+        if line.rstrip('\r\n').strip() == FRONT_MATTER_DELIMITER:
+            break
+        header_lines.append(line)
+    else:
+        raise ValueError('Unterminated front matter (missing closing "---")')
+
+    data = yaml.safe_load(''.join(header_lines)) or {}
+    if not isinstance(data, dict):
+        raise ValueError('Front matter must be a YAML mapping')
+    return data
+
+
+def parse_article_header(lines):
+    """
+    Parse an article header from an iterator of lines, consuming only the header.
+
+    Two header formats are supported:
+
+    YAML front matter (content/articles/**):
+    ---
+    title: "<title>"
+    authors: ["Author 1", "Author 2"]
+    volume: 43
+    ---
+
+    Legacy issue format (<issue>/articles/*.md):
     title: <title>
     authors: ['Author 1', 'Author 2']
-    
-    <content>
+
+    Returns (header, pending) where header is a dict with at least 'title'
+    and 'authors', and pending is a list of already-consumed lines that
+    belong to the body. Lines after those are left unread in the iterator.
     """
-    lines = markdown_content.strip().split('\n')
-    
+    lines = iter(lines)
+    header = {}
+    pending = []
+
+    # Skip leading blank lines
+    first = None
+    for line in lines:
+        if line.strip():
+            first = line
+            break
+    if first is None:
+        return {'title': None, 'authors': []}, pending
+
+    if first.strip() == FRONT_MATTER_DELIMITER:
+        header = _parse_front_matter(lines)
+        header['authors'] = parse_authors(header.get('authors', header.get('author')))
+        header.pop('author', None)
+        header['title'] = str(header['title']).strip() if header.get('title') is not None else None
+        return header, pending
+
     title = None
     authors = []
-    content_start_idx = 0
-    
-    # Parse the header section
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        if line.startswith('title:'):
-            title = line.split('title:', 1)[1].strip()
-        elif line.startswith('authors:'):
-            # Parse the Python list format
-            authors_str = line.split('authors:', 1)[1].strip()
-            # Use eval to parse the list (safe since we control the input)
-            try:
-                authors = eval(authors_str)
-                if isinstance(authors, str):
-                    authors = [authors]
-            except:
-                # Fallback: try to parse manually
-                authors_str = authors_str.strip('[]')
-                authors = [a.strip().strip("'\"") for a in authors_str.split(',')]
-        elif line == '' and i > 0:
+    line = first
+    while line is not None:
+        stripped = line.strip()
+        if stripped == '':
             # Empty line indicates end of header
-            content_start_idx = i + 1
             break
+        key, sep, value = stripped.partition(':')
+        if not sep or key.strip() not in LEGACY_HEADER_KEYS:
+            # Not a header line; the body starts here
+            pending.append(line)
+            break
+        if key.strip() == 'title':
+            title = value.strip()
         else:
-            # If we haven't found an empty line and we're past the first few lines,
-            # assume header is done. This handles files with no authors.
-            if i > 5: # Arbitrary cutoff, adjust if headers can be longer
-                content_start_idx = i
-                break
+            authors = parse_authors(value)
+        line = next(lines, None)
+
+    header['title'] = title
+    header['authors'] = authors
+    return header, pending
+
+
+def read_article_header(input_path):
+    """Read only the header of an article file, never its body."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        header, _ = parse_article_header(f)
+    return header
+
+
+def parse_markdown_article(markdown_content):
+    """
+    Parse markdown article format into components.
+    
+    Expected format (or YAML front matter, see parse_article_header):
+    title: <title>
+    authors: ['Author 1', 'Author 2']
+    
+    <content>
+    """
+    lines = io.StringIO(markdown_content.strip())
+    header, pending = parse_article_header(lines)
     
     # Get the content (everything after the header)
-    content = '\n'.join(lines[content_start_idx:]).strip()
+    content = (''.join(pending) + lines.read()).strip()
     
     return {
-        'title': title or "Untitled", # Add a default title
-        'authors': authors or ["Unknown"], # Add a default author
+        **header,
+        'title': header.get('title') or "Untitled", # Add a default title
+        'authors': header.get('authors') or ["Unknown"], # Add a default author
         'content': content
     }
 
@@ -111,10 +207,59 @@ def convert_to_yaml(parsed_data):
     return '\n'.join(output)
 
 
-def process_markdown_file(input_path, output_dir):
+# Body is copied to the output in chunks of this many characters
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+def write_yaml_header(out, title, authors):
+    """Write the title/author part of the YAML article (same layout as convert_to_yaml)."""
+    out.write('title:\n')
+    out.write(f'  {title}\n')
+    out.write('author:\n')
+    for author in authors or ['Unknown']:
+        out.write(f'  - {author}\n')
+    out.write('\n')
+
+
+def stream_yaml_content(chunks, out):
+    """
+    Write the article body as an indented 'content: |' block, chunk by chunk.
+
+    Produces the same bytes as convert_to_yaml does for content.strip(): leading
+    whitespace is skipped, trailing whitespace is held back until more text
+    arrives (and dropped at the end), and every newline is followed by the
+    two-space block indent. Only one chunk plus any pending whitespace is held
+    in memory.
+    """
+    out.write('content: |\n')
+    started = False
+    held_whitespace = ''
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            out.write('  ')
+            started = True
+        text = chunk.rstrip()
+        if not text:
+            held_whitespace += chunk
+            continue
+        out.write((held_whitespace + text).replace('\n', '\n  '))
+        held_whitespace = chunk[len(text):]
+    if not started:
+        out.write('  (No content)') # Handle empty content
+    out.write('\n')
+
+
+def process_markdown_file(input_path, output_dir, chunk_size=STREAM_CHUNK_SIZE):
     """
     Process a single markdown file and convert it to YAML.
     
+    The header is parsed first, then the body is streamed to the output in
+    chunks, so memory stays bounded no matter how large the source is (e.g.
+    whole-issue transcripts).
+    
     Args:
         input_path: Path to the input markdown file
         output_dir: Directory where the YAML file should be written
@@ -125,22 +270,21 @@ def process_markdown_file(input_path, output_dir):
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Read the markdown file
-    with open(input_path, 'r', encoding='utf-8') as f:
-        markdown_content = f.read()
-    
-    # Parse the markdown
-    parsed_data = parse_markdown_article(markdown_content)
-    
-    # Convert to YAML
-    yaml_content = convert_to_yaml(parsed_data)
-    
     # Write to output file (same name but .yaml extension)
     output_filename = input_path.stem + '.yaml'
     output_path = output_dir / output_filename
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(yaml_content)
+    with open(input_path, 'r', encoding='utf-8') as src, \
+            open(output_path, 'w', encoding='utf-8') as out:
+        header, pending = parse_article_header(src)
+        write_yaml_header(out, header.get('title') or "Untitled", header.get('authors'))
+        
+        def chunks():
+            if pending:
+                yield ''.join(pending)
+            yield from iter(lambda: src.read(chunk_size), '')
+        
+        stream_yaml_content(chunks(), out)
     
     print(f"Converted {input_path.name} -> {output_path}")
     return output_path
@@ -157,6 +301,10 @@ def main():
         'article_dir',
         help='Input directory (e.g., "my_newspaper") containing an "articles" subdirectory with .md files'
     )
+    parser.add_argument(
+        '--file', action='append', default=[], metavar='PATH',
+        help='Convert this file instead of scanning <article_dir>/articles (e.g. an archive issue.txt transcript); may be repeated'
+    )
     
     args = parser.parse_args()
     
@@ -164,6 +312,12 @@ def main():
     input_dir = article_dir_path / 'articles'
     output_dir = article_dir_path / 'content' / 'articles'
     
+    if args.file:
+        for input_file in args.file:
+            process_markdown_file(input_file, output_dir)
+        print(f"\n✓ Conversion complete! {len(args.file)} file(s) converted.")
+        return
+    
     # Check if source directory exists
     if not input_dir.is_dir():
         print(f"Error: Input directory not found: {input_dir}", file=sys.stderr)
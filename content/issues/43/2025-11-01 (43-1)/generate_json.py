@@ -2,15 +2,24 @@
 """
 Script to generate info JSONs for ACM@UIUC SIGs and committees.
 Reads blurbs from ./*.yaml files and organization data from the API.
+
+Every run that changes any organization's data saves a numbered snapshot of
+all of it in content/blurb/snapshots/ (the last SNAPSHOT_HISTORY are kept)
+and prints what changed per organization since the previous snapshot, for
+editorial review. Only the JSON files of organizations that changed are
+rewritten, so unchanged directory entries keep their cached LaTeX.
 """
 
 import json
-import os
 import requests
 import yaml
+from datetime import datetime, timezone
 from pathlib import Path
 import sys
 
+SNAPSHOT_DIR = Path('content') / 'blurb' / 'snapshots'
+SNAPSHOT_HISTORY = 10
+
 
 def read_info_file(blurb_dir, filename):
     """Read the info from a YAML file in the raw_info directory."""
@@ -121,15 +130,108 @@ def create_info_json(org, blurb_dir):
     return info
 
 
+def load_snapshot(snapshot_dir, version=None):
+    """The snapshot with the given version (default: the latest), or an empty version 0"""
+    versions = sorted(int(p.stem) for p in snapshot_dir.glob('*.json') if p.stem.isdigit())
+    if version is None:
+        version = versions[-1] if versions else 0
+    path = snapshot_dir / f'{version:04d}.json'
+    if not path.exists():
+        if version:
+            raise FileNotFoundError(f"No snapshot {version} in {snapshot_dir}")
+        return {'version': 0, 'orgs': {}}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_snapshot(snapshot_dir, version, orgs):
+    """Write orgs as snapshot `version` and drop snapshots older than SNAPSHOT_HISTORY"""
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    snapshot = {
+        'version': version,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'orgs': dict(sorted(orgs.items())),
+    }
+    with open(snapshot_dir / f'{version:04d}.json', 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, indent=2, ensure_ascii=False)
+    for old in sorted(p for p in snapshot_dir.glob('*.json') if p.stem.isdigit())[:-SNAPSHOT_HISTORY]:
+        old.unlink()
+
+
+def short(value, limit=60):
+    """Compact one-line form of a field value for the diff"""
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+    text = ' '.join(text.split())
+    return text if len(text) <= limit else text[:limit - 3] + '...'
+
+
+def chair_labels(chairs):
+    return [f"{c.get('name', '')} ({c.get('title') or 'no title'})" for c in chairs or []]
+
+
+def describe_changes(old, new):
+    """Lines describing how one organization's info changed"""
+    lines = []
+    for field in sorted(old.keys() | new.keys()):
+        before, after = old.get(field), new.get(field)
+        if before == after:
+            continue
+        if field == 'chairs':
+            before, after = chair_labels(before), chair_labels(after)
+            lines += [f"chairs: - {p}" for p in before if p not in after]
+            lines += [f"chairs: + {p}" for p in after if p not in before]
+            if sorted(before) == sorted(after):
+                lines.append("chairs: reordered")
+        elif field == 'links' and isinstance(before, dict) and isinstance(after, dict):
+            for key in sorted(before.keys() | after.keys()):
+                if before.get(key) != after.get(key):
+                    lines.append(f"links.{key}: {short(before.get(key) or '(none)')} -> {short(after.get(key) or '(none)')}")
+        elif field == 'blurb':
+            lines.append(f"blurb edited ({len(before or '')} -> {len(after or '')} characters)")
+        else:
+            lines.append(f"{field}: {short(before if before is not None else '(none)')} -> "
+                         f"{short(after if after is not None else '(none)')}")
+    return lines
+
+
+def diff_orgs(old_orgs, new_orgs):
+    """{org: lines} for every organization added, removed or changed between two snapshots"""
+    diff = {}
+    for org in sorted(old_orgs.keys() | new_orgs.keys()):
+        if org not in old_orgs:
+            diff[org] = ['added']
+        elif org not in new_orgs:
+            diff[org] = ['removed from the API']
+        elif old_orgs[org] != new_orgs[org]:
+            diff[org] = describe_changes(old_orgs[org], new_orgs[org])
+    return diff
+
+
+def print_diff(diff, old_version, new_version):
+    if not diff:
+        print(f"No organization changed since snapshot {old_version}.")
+        return
+    print(f"\nChanges since snapshot {old_version} (snapshot {new_version}):")
+    for org, lines in diff.items():
+        print(f"  {org}")
+        for line in lines:
+            print(f"      {line}")
+    print()
+
+
 def main():
     """Main function to generate all info JSONs."""
-    # Parse command-line arguments
-    if len(sys.argv) < 2:
-        print("Usage: python3 generate_json.py <base_directory>")
-        print("Example: python3 generate_json.py vol43is1")
-        sys.exit(1)
-    
-    base_dir = Path(sys.argv[1])
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate directory JSON for SIGs and committees from the API')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1")')
+    parser.add_argument('--api-file', help='Read the organizations from a saved API response instead of fetching')
+    parser.add_argument('--dry-run', action='store_true', help='Print the changes without writing anything')
+    parser.add_argument('--diff', nargs='*', type=int, metavar='VERSION',
+                        help='Print the changes between two saved snapshots (default: the last two) and exit')
+    args = parser.parse_args()
+
+    base_dir = Path(args.base_dir)
     
     if not base_dir.exists():
         print(f"Error: Directory '{base_dir}' does not exist.")
@@ -141,13 +243,32 @@ def main():
         print(f"Error: Blurb directory '{blurb_dir}' does not exist.")
         sys.exit(1)
     
+    snapshot_dir = base_dir / SNAPSHOT_DIR
+    if args.diff is not None:
+        if len(args.diff) > 2:
+            parser.error('--diff takes at most two snapshot versions')
+        try:
+            new = load_snapshot(snapshot_dir, args.diff[1] if len(args.diff) == 2 else None)
+            old_version = args.diff[0] if args.diff else new['version'] - 1
+            old = load_snapshot(snapshot_dir, old_version) if old_version > 0 else {'version': 0, 'orgs': {}}
+        except FileNotFoundError as e:
+            # Pruned (only the last SNAPSHOT_HISTORY are kept) or never saved
+            print(f"Error: {e}")
+            sys.exit(1)
+        print_diff(diff_orgs(old['orgs'], new['orgs']), old['version'], new['version'])
+        return
+    
     # Create content/blurb directory if it doesn't exist
     output_dir = base_dir / "content" / "blurb"
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Fetch organization data
-    print("Fetching organization data from API...")
-    organizations = fetch_organizations()
+    if args.api_file:
+        with open(args.api_file, 'r', encoding='utf-8') as f:
+            organizations = json.load(f)
+    else:
+        print("Fetching organization data from API...")
+        organizations = fetch_organizations()
     
     if not organizations:
         print("Failed to fetch organization data. Exiting.")
@@ -155,28 +276,37 @@ def main():
     
     print(f"Found {len(organizations)} organizations.")
     
-    # Process each organization
+    # Info JSON for each organization, by file name - normalize name by removing pipes and special chars
+    # Thanks reflections_|_projections!
+    orgs = {}
     for org in organizations:
         org_id = org.get("id")
         if not org_id:
             continue
-        
-        print(f"Processing {org_id}...")
-        
-        # Create info JSON
-        info = create_info_json(org, blurb_dir)
-        
-        # Write to file - normalize name by removing pipes and special chars
-        # Thanks reflections_|_projections!
-        output_filename = normalize_org_id(org_id) + ".json"
-        output_path = output_dir / output_filename
-        
+        orgs[normalize_org_id(org_id)] = create_info_json(org, blurb_dir)
+    
+    previous = load_snapshot(snapshot_dir)
+    diff = diff_orgs(previous['orgs'], orgs)
+    version = previous['version'] + 1 if diff else previous['version']
+    print_diff(diff, previous['version'], version)
+    if args.dry_run:
+        return
+    if diff:
+        save_snapshot(snapshot_dir, version, orgs)
+    
+    # Only rewrite files whose content changed, so unchanged files keep their mtime
+    written = 0
+    for name, info in orgs.items():
+        output_path = output_dir / f"{name}.json"
+        text = json.dumps(info, indent=2, ensure_ascii=False)
+        if output_path.exists() and output_path.read_text(encoding='utf-8') == text:
+            continue
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(info, f, indent=2, ensure_ascii=False)
-        
-        print(f"  Created {output_path}")
+            f.write(text)
+        written += 1
+        print(f"  Wrote {output_path}")
     
-    print(f"\nDone! Generated {len(organizations)} JSON files in {output_dir}/")
+    print(f"\nDone! {len(orgs)} organizations, {written} JSON files updated in {output_dir}/")
 
 
 if __name__ == "__main__":
@@ -3,32 +3,220 @@
 Generate Banks of the Boneyard newspaper LaTeX files from YAML/JSON sources
 """
 
+import contextlib
+import hashlib
+import io
 import json
 import os
+import sys
+import tempfile
 import yaml
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
+from jinja2 import BytecodeCache, Environment, FileSystemLoader, StrictUndefined
+
+from generate_articles import convert_to_yaml, parse_markdown_article
+from issue_source import open_source
+
+# Section layouts live in templates/*.tex.j2, compiled once per process; the
+# compiled bytecode is kept in the artifact store under TEMPLATE_NAMESPACE
+TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+TEMPLATE_NAMESPACE = 'template'
+
+# Rendered article fragments and directory entries are cached under a hash of
+# their source (the article, or the organization's data and logo), the mode,
+# the code that reads and renders them and the templates, so any change to the
+# generator invalidates them
+FRAGMENT_NAMESPACE = 'fragment'
+GENERATOR_SOURCES = ('generate_newspaper.py', 'generate_articles.py', 'issue_source.py')
+GENERATOR_DIGEST = hashlib.sha256(b''.join(
+    [(Path(__file__).resolve().parent / name).read_bytes() for name in GENERATOR_SOURCES]
+    + [p.read_bytes() for p in sorted(TEMPLATE_DIR.glob('*.tex.j2'))]
+)).hexdigest()
+
+# Officer titles grouped under one heading in the directory, in display order
+CHAIR_TITLE_GROUPS = {
+    "chair": "Chair",
+    "co-chair": "Chair",
+    "lead": "Chair",
+    "vice chair": "Vice Chair",
+    "treasurer": "Treasurer",
+    "secretary": "Secretary",
+    "admin": "Admin",
+    "helper": "Helper"
+}
+CHAIR_GROUP_ORDER = ["Chair", "Vice Chair", "Treasurer", "Secretary", "Admin", "Helper"]
+
+# markdown_to_latex patterns, compiled once; placeholders are delimited by Â§Â§Â§
+LINEBREAK_PATTERN = re.compile(r'<br\s*/?>', re.IGNORECASE)
+SUBSUBSECTION_PATTERN = re.compile(r'^### (.+)$', re.MULTILINE)
+SUBSECTION_PATTERN = re.compile(r'^## (.+)$', re.MULTILINE)
+SECTION_PATTERN = re.compile(r'^# (.+)$', re.MULTILINE)
+BOLD_PATTERN = re.compile(r'\*\*(.+?)\*\*')
+ITALIC_PATTERN = re.compile(r'\*(.+?)\*')
+LIST_ITEM_PATTERN = re.compile(r'^\s*[\*\-]\s+')
+IMAGE_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§IMAGE:(.+?)Â§Â§Â§')
+SUBSUB_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§SUBSUB:(.+?)Â§Â§Â§')
+SUB_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§SUB:(.+?)Â§Â§Â§')
+SEC_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§SEC:(.+?)Â§Â§Â§')
+BOLD_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§BOLD:(.+?)Â§Â§Â§')
+ITALIC_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§ITALIC:(.+?)Â§Â§Â§')
+ITEM_PLACEHOLDER_PATTERN = re.compile(r'Â§Â§Â§ITEM:(.+?)Â§Â§Â§')
+HREF_RESTORE_PATTERN = re.compile(r'Â§Â§Â§HREFPLACEHOLDER(\d+)Â§Â§Â§')
+IMAGE_RESTORE_PATTERN = re.compile(r'Â§Â§Â§IMAGEPLACEHOLDER(\d+)Â§Â§Â§')
+
+
+def sub_bracket_links(text, replace, prefix='', allow_empty_label=False):
+    """Replace markdown links prefix[label](target) with replace(label, target)
+    
+    Matches exactly what re.sub with prefix + r'\[([^\]]+)\]\(([^\)]+)\)'
+    would (r'[^\]]*' for the label with allow_empty_label), but in linear time.
+    The regex restarts at every '[' and rescans up to the next ']' and ')',
+    which is quadratic on text full of unclosed brackets; here the next ']'
+    and ')' are looked up once and reused until the scan passes them.
+    """
+    opener = prefix + '['
+    out = []
+    copied = 0
+    next_bracket = next_paren = -1
+    start = text.find(opener)
+    while start != -1:
+        label_start = start + len(opener)
+        if next_bracket < label_start:
+            next_bracket = text.find(']', label_start)
+            if next_bracket == -1:
+                break
+        target_start = next_bracket + 2
+        if (next_bracket > label_start or allow_empty_label) and text.startswith('(', next_bracket + 1):
+            if next_paren < target_start:
+                next_paren = text.find(')', target_start)
+                if next_paren == -1:
+                    next_paren = len(text)
+            if target_start < next_paren < len(text):
+                out.append(text[copied:start])
+                out.append(replace(text[label_start:next_bracket], text[target_start:next_paren]))
+                copied = next_paren + 1
+                start = text.find(opener, copied)
+                continue
+        start = text.find(opener, start + 1)
+    out.append(text[copied:])
+    return ''.join(out)
+
+
+class StoreBytecodeCache(BytecodeCache):
+    """Jinja bytecode cache backed by the artifact store (see artifact_store.py)
+    
+    Jinja checks each entry against the template source and the Python
+    version itself, so a stale entry is simply recompiled and overwritten.
+    """
+    
+    def __init__(self, store):
+        self.store = store
+    
+    def load_bytecode(self, bucket):
+        data = self.store.get_bytes(TEMPLATE_NAMESPACE, bucket.key)
+        if data is not None:
+            bucket.bytecode_from_string(data)
+    
+    def dump_bytecode(self, bucket):
+        self.store.put_bytes(TEMPLATE_NAMESPACE, bucket.key, bucket.bytecode_to_string())
+
+
+def make_template_environment(bytecode_cache=None):
+    """A new Jinja environment for templates/
+    
+    Templates use LaTeX-friendly delimiters: <% block %>, << variable >> and
+    <# comment #>. Nothing is escaped; values must already be LaTeX.
+    """
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        bytecode_cache=bytecode_cache,
+        block_start_string='<%', block_end_string='%>',
+        variable_start_string='<<', variable_end_string='>>',
+        comment_start_string='<#', comment_end_string='#>',
+        trim_blocks=True, lstrip_blocks=True,
+        undefined=StrictUndefined, autoescape=False,
+    )
+
+
+_environments = {}
+
+
+def template_environment(store=None):
+    """The shared template environment for this process, with bytecode kept in store
+    
+    With a store (build.py and the CLI pass one), worker processes load
+    compiled templates from it instead of parsing them. Without one nothing
+    is written anywhere: templates are compiled once per process and kept in
+    memory, so rendering from a MemorySource stays free of disk writes.
+    """
+    key = None if store is None else (type(store).__name__, str(getattr(store, 'root', id(store))))
+    env = _environments.get(key)
+    if env is None:
+        env = _environments[key] = make_template_environment(None if store is None else StoreBytecodeCache(store))
+    return env
+
+
 class NewspaperGenerator:
-    def __init__(self, base_dir, print_mode=False):
-        self.base_dir = Path(base_dir)
+    def __init__(self, base_dir, print_mode=False, store=None):
+        # Inputs come from an issue source (see issue_source.py): base_dir may be
+        # the issue directory, a zip archive, a {path: contents} dict or a source
+        self.source = open_source(base_dir)
+        # The issue directory on disk, or None when rendering from memory or a zip
+        self.base_dir = self.source.base_dir
         self.config = self.load_config()
         self.volume = self.config['volume']
         self.issue = self.config['issue']
         self.print_mode = print_mode 
+        # Optional artifact store (see artifact_store.py) for rendered article fragments
+        self.store = store
+    
+    def template(self, name):
+        """Load a compiled section template from templates/"""
+        return template_environment(self.store).get_template(name)
+    
+    def render_article_body(self, name, article, needspace, letter=False):
+        """Lay out an article (title, byline, body) with templates/article.tex.j2"""
+        title = self.escape_special_chars(article.get('title', 'Untitled').strip())
+        authors = article.get('author', article.get('authors', []))
+        if isinstance(authors, str):
+            authors = [authors]
+        body = self.markdown_to_latex(article.get('content', ''), is_article=True)
+        return self.template('article.tex.j2').render(
+            name=name, title=title, authors=authors, body=body, needspace=needspace, letter=letter)
         
     def load_config(self):
         """Load the configuration file"""
-        config_path = self.base_dir / 'config.yaml'
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return yaml.safe_load(self.source.read_text('config.yaml'))
+    
+    def read_article_source(self, article_name):
+        """(path, bytes) of an article's generated YAML, else of its markdown; None if neither exists"""
+        for path in (f'content/articles/{article_name}.yaml', f'articles/{article_name}.md'):
+            try:
+                return path, self.source.read_bytes(path)
+            except FileNotFoundError:
+                pass
+        return None
     
     def load_article(self, article_name):
-        """Load an article YAML file"""
-        article_path = self.base_dir / 'content' / 'articles' / f'{article_name}.yaml'
-        with open(article_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        """Load an article from content/articles/<name>.yaml
+        
+        Sources without generated YAML (e.g. a zip of the issue as edited) fall
+        back to articles/<name>.md, converted as generate_articles.py does.
+        """
+        found = self.read_article_source(article_name)
+        if found is None:
+            raise FileNotFoundError(f"No article named '{article_name}'")
+        path, data = found
+        text = data.decode('utf-8')
+        if path.endswith('.md'):
+            text = convert_to_yaml(parse_markdown_article(text))
+        return yaml.safe_load(text)
     
     def normalize_org_name(self, org_name):
         """Normalize organization name to match filename (remove pipes, clean underscores). This is mainly for RP"""
@@ -42,38 +230,41 @@ class NewspaperGenerator:
         """Load organization info from JSON"""
         normalized_name = self.normalize_org_name(org_name)
         
-        json_path = self.base_dir / 'content' / 'blurb' / f'{normalized_name}.json'
-        if json_path.exists():
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        # if i'm stupid it'll take this code path
-        json_path = self.base_dir / 'content' / 'blurb' / f'{org_name}.json'
-        if json_path.exists():
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        # if i'm stupid it'll take the second path
+        for name in (normalized_name, org_name):
+            try:
+                return json.loads(self.source.read_text(f'content/blurb/{name}.json'))
+            except FileNotFoundError:
+                pass
         
         return None
     
     def load_events(self):
         """Load events data"""
-        events_path = self.base_dir / 'events.yaml'
-        if events_path.exists():
-            with open(events_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        return {'events': []}
+        try:
+            return yaml.safe_load(self.source.read_text('events.yaml'))
+        except FileNotFoundError:
+            return {'events': []}
     
     def load_horoscope(self):
         """Load horoscope data"""
-        horoscope_path = self.base_dir / 'horoscope.yaml'
-        if horoscope_path.exists():
-            with open(horoscope_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        return {'horoscope': []}
+        try:
+            return yaml.safe_load(self.source.read_text('horoscope.yaml'))
+        except FileNotFoundError:
+            return {'horoscope': []}
     
     def markdown_to_latex(self, markdown_text, is_article=False):
         """Convert markdown to LaTeX
         
+        Runs in time linear in the length of the text, whatever it contains
+        (see `python3 benchmark.py markdown`). Every pass is either a plain
+        scan, sub_bracket_links, or a regex that cannot backtrack far: headers
+        and list items are anchored to their line, and a lazy (.+?) match
+        stops at the first closing delimiter on its line. A lazy match only
+        fails when no closing delimiter follows on that line, which can happen
+        for at most one opening delimiter (and those overlapping it) per line,
+        so each character is rescanned a bounded number of times.
+        
         Args:
             markdown_text: The markdown text to convert
             is_article: If True and in print_mode, hyperlinks will be converted to QR codes
@@ -84,47 +275,45 @@ class NewspaperGenerator:
         text = markdown_text
         
         # Convert <br/> and <br> tags to line breaks - do this early before escaping
-        text = re.sub(r'<br\s*/?>', r'Â§Â§Â§LINEBREAKÂ§Â§Â§', text, flags=re.IGNORECASE)
+        text = LINEBREAK_PATTERN.sub(r'Â§Â§Â§LINEBREAKÂ§Â§Â§', text)
         
         # Headers - do first before escaping
-        text = re.sub(r'^### (.+)$', r'Â§Â§Â§SUBSUB:\1Â§Â§Â§', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'Â§Â§Â§SUB:\1Â§Â§Â§', text, flags=re.MULTILINE)
-        text = re.sub(r'^# (.+)$', r'Â§Â§Â§SEC:\1Â§Â§Â§', text, flags=re.MULTILINE)
+        text = SUBSUBSECTION_PATTERN.sub(r'Â§Â§Â§SUBSUB:\1Â§Â§Â§', text)
+        text = SUBSECTION_PATTERN.sub(r'Â§Â§Â§SUB:\1Â§Â§Â§', text)
+        text = SECTION_PATTERN.sub(r'Â§Â§Â§SEC:\1Â§Â§Â§', text)
         
         # Bold and italic - use placeholders
-        bold_pattern = r'\*\*(.+?)\*\*'
-        text = re.sub(bold_pattern, r'Â§Â§Â§BOLD:\1Â§Â§Â§', text)
+        text = BOLD_PATTERN.sub(r'Â§Â§Â§BOLD:\1Â§Â§Â§', text)
         
         # Replace *text* with italic placeholder
-        italic_pattern = r'\*(.+?)\*'
-        text = re.sub(italic_pattern, r'Â§Â§Â§ITALIC:\1Â§Â§Â§', text)
+        text = ITALIC_PATTERN.sub(r'Â§Â§Â§ITALIC:\1Â§Â§Â§', text)
         
         # Images - convert markdown image syntax to placeholders FIRST (before links)
-        image_pattern = r'!\[([^\]]*)\]\(([^\)]+)\)'
-        def replace_image(match):
-            alt_text = match.group(1)
-            image_path = match.group(2)
+        def replace_image(alt_text, image_path):
             # Remove ./ prefix if present
             if image_path.startswith('./'):
                 image_path = image_path[2:]
             # Store the image path with a special marker to avoid escaping underscores later
             return f'Â§Â§Â§IMAGE:{image_path}Â§Â§Â§'
-        text = re.sub(image_pattern, replace_image, text)
+        text = sub_bracket_links(text, replace_image, prefix='!', allow_empty_label=True)
         
-        # Links - convert markdown links to placeholders
-        link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        text = re.sub(link_pattern, r'Â§Â§Â§LINK:\1Â§|Â§\2Â§Â§Â§', text)
+        # Links - set aside so special characters inside href URLs are not escaped
+        hrefs = []
+        def save_href(link_text, url):
+            hrefs.append((link_text, url))
+            return f'Â§Â§Â§HREFPLACEHOLDER{len(hrefs)-1}Â§Â§Â§'
+        text = sub_bracket_links(text, save_href)
         
         # Lists - convert bullet points to placeholders
         in_list = False
         lines = text.split('\n')
         new_lines = []
         for line in lines:
-            if re.match(r'^\s*[\*\-]\s+', line):
+            if LIST_ITEM_PATTERN.match(line):
                 if not in_list:
                     new_lines.append('Â§Â§Â§BEGINLISTÂ§Â§Â§')
                     in_list = True
-                item = re.sub(r'^\s*[\*\-]\s+', '', line)
+                item = LIST_ITEM_PATTERN.sub('', line)
                 new_lines.append(f'Â§Â§Â§ITEM:{item}Â§Â§Â§')
             else:
                 if in_list:
@@ -147,32 +336,22 @@ class NewspaperGenerator:
             '^': '\\textasciicircum{}'
         }
         
-        # Don't escape special characters inside href URLs or image paths
-        # First, temporarily protect href content
-        href_pattern = r'Â§Â§Â§LINK:(.+?)Â§\|Â§(.+?)Â§Â§Â§'
-        hrefs = []
-        def save_href(match):
-            hrefs.append((match.group(1), match.group(2)))
-            return f'Â§Â§Â§HREFPLACEHOLDER{len(hrefs)-1}Â§Â§Â§'
-        text = re.sub(href_pattern, save_href, text)
-        
-        # Also protect image paths from escaping
-        image_placeholder_pattern = r'Â§Â§Â§IMAGE:(.+?)Â§Â§Â§'
+        # Protect image paths from escaping (hrefs were set aside above)
         images = []
         def save_image(match):
             images.append(match.group(1))
             return f'Â§Â§Â§IMAGEPLACEHOLDER{len(images)-1}Â§Â§Â§'
-        text = re.sub(image_placeholder_pattern, save_image, text)
+        text = IMAGE_PLACEHOLDER_PATTERN.sub(save_image, text)
         
         for char, replacement in special_chars.items():
             text = text.replace(char, replacement)
         
         # Now convert placeholders to actual LaTeX
-        text = re.sub(r'Â§Â§Â§SUBSUB:(.+?)Â§Â§Â§', r'\\subsubsection*{\1}', text)
-        text = re.sub(r'Â§Â§Â§SUB:(.+?)Â§Â§Â§', r'\\subsection*{\1}', text)
-        text = re.sub(r'Â§Â§Â§SEC:(.+?)Â§Â§Â§', r'\\section*{\1}', text)
-        text = re.sub(r'Â§Â§Â§BOLD:(.+?)Â§Â§Â§', r'\\textbf{\1}', text)
-        text = re.sub(r'Â§Â§Â§ITALIC:(.+?)Â§Â§Â§', r'\\textit{\1}', text)
+        text = SUBSUB_PLACEHOLDER_PATTERN.sub(r'\\subsubsection*{\1}', text)
+        text = SUB_PLACEHOLDER_PATTERN.sub(r'\\subsection*{\1}', text)
+        text = SEC_PLACEHOLDER_PATTERN.sub(r'\\section*{\1}', text)
+        text = BOLD_PLACEHOLDER_PATTERN.sub(r'\\textbf{\1}', text)
+        text = ITALIC_PLACEHOLDER_PATTERN.sub(r'\\textit{\1}', text)
         
         # Convert line break placeholders to LaTeX line breaks
         # Using \vspace{0.5em} which adds vertical space and works reliably in all contexts
@@ -200,19 +379,19 @@ class NewspaperGenerator:
                        f'\\end{{center}}')
             else:
                 return f'\\href{{{url}}}{{{link_text}}}'
-        text = re.sub(r'Â§Â§Â§HREFPLACEHOLDER(\d+)Â§Â§Â§', restore_href, text)
+        text = HREF_RESTORE_PATTERN.sub(restore_href, text)
         
         # Restore image placeholders
         def restore_image(match):
             idx = int(match.group(1))
             return f'Â§Â§Â§IMAGE:{images[idx]}Â§Â§Â§'
-        text = re.sub(r'Â§Â§Â§IMAGEPLACEHOLDER(\d+)Â§Â§Â§', restore_image, text)
+        text = IMAGE_RESTORE_PATTERN.sub(restore_image, text)
         
         # Convert image placeholders - note: captions are handled separately as italic text following the image
-        text = re.sub(r'Â§Â§Â§IMAGE:(.+?)Â§Â§Â§', r'\\begin{center}\\includegraphics[width=0.82\\columnwidth]{./articles/images/\1}\\end{center}', text)
+        text = IMAGE_PLACEHOLDER_PATTERN.sub(r'\\begin{center}\\includegraphics[width=0.82\\columnwidth]{./articles/images/\1}\\end{center}', text)
         text = text.replace('Â§Â§Â§BEGINLISTÂ§Â§Â§', '\\begin{itemize}')
         text = text.replace('Â§Â§Â§ENDLISTÂ§Â§Â§', '\\end{itemize}')
-        text = re.sub(r'Â§Â§Â§ITEM:(.+?)Â§Â§Â§', r'\\item \1', text)
+        text = ITEM_PLACEHOLDER_PATTERN.sub(r'\\item \1', text)
         
         return text
     
@@ -247,88 +426,57 @@ class NewspaperGenerator:
         if not article:
             return ''
         
-        content = []
-        
-        # Add needspace to prevent orphaned headers
-        content.append('\\needspace{5\\baselineskip}')
-        content.append('\\vfill')
-        content.append(f'\\label{{article:{lftc}}}')
-        
-        # Article title and byline
-        title = article.get('title', 'Untitled').strip()
-        title = self.escape_special_chars(title)  # Escape special characters in title
-        authors = article.get('author', article.get('authors', []))
-        if isinstance(authors, str):
-            authors = [authors]
-        
-        # Format the byline
-        if authors:
-            author_str = ', '.join(authors)
-            content.append(f'\\byline{{\\textbf{{\\Large {title}}}}}{{{author_str}}}')
-        else:
-            content.append(f'\\headline{{\\textbf{{\\Large {title}}}}}')
-        
-        # Article content
-        article_content = article.get('content', '')
-        latex_content = self.markdown_to_latex(article_content, is_article=True)
-        content.append(latex_content)
+        return self.render_article_body(lftc, article, needspace=5, letter=True)
+    
+    def fragment_key(self, article_name):
+        """Cache key for an article's rendered LaTeX, or None if its source is missing"""
+        found = self.read_article_source(article_name)
+        if found is None:
+            return None
+        path, source = found
+        digest = hashlib.sha256()
+        digest.update(f'{GENERATOR_DIGEST}\0{path}\0print={self.print_mode}\0'.encode())
+        digest.update(source)
+        return digest.hexdigest()
+    
+    def generate_article_tex(self, article_name):
+        """Generate the LaTeX for a single article, or None if it can't be loaded"""
+        key = self.fragment_key(article_name) if self.store else None
+        if key:
+            cached = self.store.get_text(FRAGMENT_NAMESPACE, key)
+            if cached is not None:
+                return cached
+        
+        article_tex = self.render_article_tex(article_name)
+        if key and article_tex is not None:
+            self.store.put_text(FRAGMENT_NAMESPACE, key, article_tex)
+        return article_tex
+    
+    def render_article_tex(self, article_name):
+        """Render the LaTeX for a single article from its YAML source"""
+        try:
+            article = self.load_article(article_name)
+        except Exception as e:
+            print(f"Warning: Could not load article '{article_name}': {e}")
+            return None
         
-        # Close article
-        content.append('\\closearticle\n')
-        content.append('\\vfill')
-        content.append('\\vfill')
+        if not article:
+            return None
         
-        return '\n\n'.join(content)
+        # Reserve room for header + image + a paragraph when the article opens with an image
+        starts_with_image = article.get('content', '').strip().startswith('![')
+        return self.render_article_body(article_name, article, needspace=20 if starts_with_image else 5)
     
-    def generate_articles_tex(self):
-        """Generate the articles LaTeX file"""
-        content = []
+    def generate_articles_tex(self, article_names=None):
+        """Generate the articles LaTeX file (or the part of it covering article_names)"""
+        if article_names is None:
+            article_names = self.config.get('article_order', [])
         
-        # Skip first article (Letter from the Chair) - start from index 1
-        for article_name in self.config.get('article_order', []):
-            try:
-                article = self.load_article(article_name)
-            except Exception as e:
-                print(f"Warning: Could not load article '{article_name}': {e}")
-                continue
-            
-            if not article:
-                continue
-            
-            # Check if article starts with an image
-            article_content = article.get('content', '')
-            starts_with_image = article_content.strip().startswith('![')
-            
-            # Use larger needspace if article starts with image
-            # This reserves space for: header + image + at least one paragraph
-            if starts_with_image:
-                content.append('\\needspace{20\\baselineskip}')
-            else:
-                content.append('\\needspace{5\\baselineskip}')
-            
-            # Add label for TOC reference
-            content.append(f'\\label{{article:{article_name}}}')
-            
-            # Article title and byline
-            title = article.get('title', 'Untitled').strip()
-            title = self.escape_special_chars(title)
-            authors = article.get('author', article.get('authors', []))
-            if isinstance(authors, str):
-                authors = [authors]
-            
-            # Format the byline
-            if authors:
-                author_str = ', '.join(authors)
-                content.append(f'\\byline{{\\textbf{{\\Large {title}}}}}{{{author_str}}}')
-            else:
-                content.append(f'\\headline{{\\textbf{{\\Large {title}}}}}')
-            
-            # Article content
-            latex_content = self.markdown_to_latex(article_content, is_article=True)
-            content.append(latex_content)
-            
-            # Close article
-            content.append('\\closearticle\n')
+        content = []
+        for article_name in article_names:
+            article_tex = self.generate_article_tex(article_name)
+            if article_tex is not None:
+                content.append(article_tex)
         
         return '\n\n'.join(content)
     
@@ -336,127 +484,27 @@ class NewspaperGenerator:
     def generate_events_tex(self):
         """Generate the events section LaTeX file"""
         events_data = self.load_events()
-        content = []
-        
-        content.append('\\headline{\\textbf{\\LARGE Upcoming Events}}')
-        content.append('\\vspace{0.05cm}')
-        content.append('')
-        
-        events = events_data.get('events', [])
-        if not events:
-            content.append('\\noindent\\textit{Check the ACM Discord and website for the latest event information!}')
-        else:
-            for i, event in enumerate(events):
-                event_name = event.get('name', 'Unnamed Event')
-                date = event.get('date', 'TBD')
-                time = event.get('time', '')
-                location = event.get('location', '')
-                description = event.get('description', '')
-                
-                # Event name in bold with noindent
-                content.append(f'\\noindent\\textbf{{{event_name}}}')
-                content.append('')
-                
-                # Date, time, location on separate lines with bullet points for better readability
-                info_parts = []
-                if date:
-                    info_parts.append(date)
-                if time:
-                    info_parts.append(time)
-                if location:
-                    info_parts.append(location)
-                
-                if info_parts:
-                    # Use a single line with middle dots for compact but readable formatting
-                    content.append('\\noindent\\textit{' + ' $\\cdot$ '.join(info_parts) + '}')
-                    content.append('')
-                
-                if description:
-                    content.append('\\noindent\\small ' + description)
-                    content.append('')
-                
-                # Add spacing between events, but not after the last one
-                if i < len(events) - 1:
-                    content.append('\\vspace{0.25cm}')
-                    content.append('')
-        
-        content.append('\\vspace{0.2cm}')
-        
-        return '\n'.join(content)
+        return self.template('events.tex.j2').render(events=events_data.get('events') or [])
     
     def generate_horoscope_tex(self):
         """Generate the horoscope section LaTeX file"""
         horoscope_data = self.load_horoscope()
-        content = []
-        
-        # Add label for TOC reference
-        content.append('\\label{horoscope}')
-        content.append('')
-        
         horoscope_list = horoscope_data.get('horoscope', [])
-        if not horoscope_list:
-            content.append('\\headline{\\textbf{\\LARGE Your Horoscope}}')
-            content.append('\\vspace{0.05cm}')
-            content.append('')
-            content.append('\\noindent\\textit{No horoscope available this issue.}')
-        else:
-            # Extract author from the list (it's a separate dict item)
-            author = None
-            question = None
-            responses = []
-            
-            for item in horoscope_list:
-                if 'author' in item:
-                    author = item['author']
-                if 'question' in item:
-                    question = item['question']
-                if 'response' in item:
-                    responses = item['response']
-            
-            # Display title with byline if author exists
-            if author:
-                author_upper = author.upper()
-                content.append(f'\\byline{{\\textbf{{\\LARGE Your Horoscope}}}}{{{author_upper}}}')
-            else:
-                content.append('\\headline{\\textbf{\\LARGE Your Horoscope}}')
-            
-            content.append('\\vspace{0.05cm}')
-            content.append('')
-            
-            # Display the question
-            if question:
-                content.append(f'\\noindent\\textbf{{\\large {question}}}')
-                content.append('')
-                content.append('\\vspace{0.3cm}')
-                content.append('')
-            
-            # Start 2-column layout for zodiac signs
-            content.append('\\begin{multicols}{2}')
-            content.append('')
-            
-            # Display each zodiac sign's response
-            for i, response_item in enumerate(responses):
-                for sign, text in response_item.items():
-                    # Zodiac sign in bold
-                    content.append(f'\\noindent\\textbf{{{sign}:}} {text}')
-                    content.append('')
-                    
-                    # Add spacing between entries
-                    if i < len(responses) - 1:
-                        content.append('\\vspace{0.2cm}')
-                        content.append('')
-                    
-                    # Force column break after the 6th zodiac sign (Virgo)
-                    if i == 5:  # After Virgo (0-indexed, so 5 is the 6th)
-                        content.append('\\columnbreak')
-                        content.append('')
-            
-            # End 2-column layout
-            content.append('\\end{multicols}')
-        
-        content.append('\\vspace{0.2cm}')
         
-        return '\n'.join(content)
+        # The author, question and responses are separate items of the list
+        author = None
+        question = None
+        responses = []
+        for item in horoscope_list or []:
+            if 'author' in item:
+                author = item['author']
+            if 'question' in item:
+                question = item['question']
+            if 'response' in item:
+                responses = item['response']
+        
+        return self.template('horoscope.tex.j2').render(
+            present=bool(horoscope_list), author=author, question=question, responses=responses)
     
     def format_meeting_time(self, meeting_time):
         """Format meeting time from JSON data"""
@@ -501,283 +549,256 @@ class NewspaperGenerator:
         
         return ', '.join(parts)
     
-    def generate_directory_tex(self):
-        """Generate the directory section LaTeX file"""
-        # Import moved inside method for encapsulation, 
-        # or you can move it to the top of your file.
-        from collections import defaultdict
-
-        content = []
-        
-        content.append('\\newpage')
-        content.append('\\label{directory}')
-        
-        content.append('\\begin{center}')
-        content.append('\\textbf{\\underline{\\Huge ACM @ UIUC Directory}}')
-        content.append('\\end{center}')
-        content.append('\\vspace{0.3cm}')
-        content.append('')
-        
-        content.append('\\begin{multicols}{2}')
-        content.append('')
-        
-        processed_count = 0
-        for org_name in self.config.get('directory_order', []):
-            blurb_data = self.load_blurb(org_name)
-            if not blurb_data:
-                print(f"Warning: No data found for {org_name}")
-                continue
-            
-            status = blurb_data.get('status', '')
-            if status == 'dormant' or status == 'dormat':
-                continue
-            
-            if not blurb_data.get('blurb', '').strip():
-                continue
-            
-            if processed_count > 0:
-                content.append('\\noindent\\rule{\\columnwidth}{0.4pt}')
-                content.append('\\vspace{0.3cm}')
-                content.append('')
-            
-            processed_count += 1
-            
-            display_name = blurb_data.get("name")
-            if org_name == 'reflections_projections':
-                display_name = r'Reflections \textbar{} Projections'
-            
-            logo_path = self.base_dir / 'logo' / f'{org_name}.png'
-            if not logo_path.exists():
-                logo_path = self.base_dir / 'logo' / f'{org_name}.jpg'
-            if not logo_path.exists():
-                logo_path = self.base_dir / 'logo' / f'{org_name}.jpeg'
-            
-            content.append(r'\noindent')
-            content.append('\\begin{minipage}{\\columnwidth}')
-            
-            if logo_path.exists():
-                rel_logo_path = f'./logo/{logo_path.name}'
-                content.append('\\begin{center}')
-                content.append(f'\\includegraphics[width=0.35\\columnwidth]{{{rel_logo_path}}}')
-                content.append('\\end{center}')
-                content.append('\\vspace{0.05cm}')
-            
-            content.append(f'\\subsection*{{{display_name}}}')
-            chairs = blurb_data.get('chairs', [])
-            valid_chairs = [c for c in chairs if c.get('name')]
-
-            if valid_chairs:
-                # Get all distinct titles, including empty string for 'no title'
-                all_titles = {c.get('title', '').strip() for c in valid_chairs}
-                num_distinct_titles = len(all_titles)
-
-                if num_distinct_titles <= 1:
-                    # SCENARIO 1: One or zero distinct titles (e.g., all "Chair", or all "")
-                    # Just list all names under "Chairs:"
-                    chair_names = [c.get("name", "") for c in valid_chairs]
-                    content.append('\\noindent\\textbf{Chairs:} ' + ', '.join(chair_names) + r'\\')
-                else:
-                    # SCENARIO 2: Multiple distinct titles
-                    
-                    # 1. Define group mapping (lowercase raw title -> display group)
-                    title_group_map = {
-                        "chair": "Chair",
-                        "co-chair": "Chair",
-                        "lead": "Chair",
-                        "vice chair": "Vice Chair",
-                        "treasurer": "Treasurer",
-                        "secretary": "Secretary",
-                        "admin": "Admin",
-                        "helper": "Helper"
-                    }
-                    
-                    # 2. Define display order for predefined groups
-                    display_order = [
-                        "Chair", 
-                        "Vice Chair", 
-                        "Treasurer", 
-                        "Secretary", 
-                        "Admin", 
-                        "Helper"
-                    ]
-                    
-                    # 3. Group the chairs
-                    grouped_names = defaultdict(list)
-                    other_titles = set()
-                    no_title_names = []
-                    
-                    for chair in valid_chairs:
-                        name = chair.get("name")
-                        title = chair.get("title", "").strip()
-                        title_lower = title.lower()
-                        
-                        group_name = title_group_map.get(title_lower)
-                        
-                        if group_name:
-                            # It's a predefined group
-                            grouped_names[group_name].append(name)
-                        elif title: 
-                            # It's an "other" title (e.g., "Webmaster")
-                            grouped_names[title].append(name) # Use the original cased title
-                            other_titles.add(title)
-                        else: 
-                            # No title
-                            no_title_names.append(name)
-                            
-                    # 4. Generate LaTeX output in the correct order
-                    
-                    # Add predefined groups in order
-                    for group in display_order:
-                        if group in grouped_names:
-                            names_list = grouped_names[group]
-                            content.append(f'\\noindent\\textbf{{{group}:}} ' + ', '.join(names_list) + r'\\')
-                    
-                    # Add "other" titles, sorted alphabetically
-                    for group in sorted(list(other_titles)):
-                        if group in grouped_names:
-                            names_list = grouped_names[group]
-                            content.append(f'\\noindent\\textbf{{{group}:}} ' + ', '.join(names_list) + r'\\')
-
-                    # Add "no title" people last, under "Members"
-                    if no_title_names:
-                        content.append(f'\\noindent\\textbf{{Members:}} ' + ', '.join(no_title_names) + r'\\')
-
-            # Get the list of meeting times (plural)
-            meeting_times = blurb_data.get('meeting_times')
-            
-            # Check if it's a list and has content
-            if meeting_times and isinstance(meeting_times, list):
-                
-                # Format all meeting time strings
-                time_strings = []
-                for mt in meeting_times:
-                    time_str = self.format_meeting_time(mt)
-                    if time_str:
-                        time_strings.append(time_str)
-                
-                # If we have any valid time strings, print them
-                if time_strings:
-                    # Add the first line with the "Meetings:" prefix
-                    content.append(f'\\noindent\\textbf{{Meetings:}} {time_strings[0]}\\\\')
-                    
-                    # Add subsequent lines, indented using \phantom for alignment
-                    for time_str in time_strings[1:]:
-                        # \phantom creates invisible whitespace matching the width of "Meetings: "
-                        content.append(f'\\noindent\\phantom{{\\textbf{{Meetings:}} }}{time_str}\\\\')
-                    
-            website = blurb_data.get('website', '')
-            links = blurb_data.get('links', {})
-            
-            if self.print_mode:
-                if website:
-                    display_url = website.replace('https://', '').replace('http://', '')
-                    display_url = display_url.replace('#', '\\#').replace('_', '\\_').replace('%', '\\%')
-                    # Add \\ at theend
-                    content.append(f'\\noindent\\textbf{{Website:}} {display_url}\\\\')
-                    
-                for src, url in links.items():
-                    clean_url = url.replace('https://', '').replace('http://', '')
-                    clean_url = clean_url.replace('#', '\\#').replace('_', '\\_').replace('%', '\\%')
-                    content.append(f'\\noindent\\textbf{{{src.capitalize()}:}} {clean_url}\\\\')
+    def find_logo(self, org_name):
+        """Path of an organization's logo (png, jpg or jpeg) relative to the issue, or None"""
+        # One listing of logo/ (cached by the source) instead of a lookup per candidate
+        logos = self.source.listdir('logo')
+        for ext in ('png', 'jpg', 'jpeg'):
+            if f'{org_name}.{ext}' in logos:
+                return f'./logo/{org_name}.{ext}'
+        return None
+    
+    def chair_roles(self, chairs):
+        """(heading, names) rows listing an organization's officers"""
+        valid_chairs = [c for c in chairs if c.get('name')]
+        if not valid_chairs:
+            return []
+        
+        # One or zero distinct titles (e.g., all "Chair", or all ""): everyone under "Chairs"
+        if len({c.get('title', '').strip() for c in valid_chairs}) <= 1:
+            return [('Chairs', [c.get('name', '') for c in valid_chairs])]
+        
+        # Multiple distinct titles: known titles grouped in order, then other
+        # titles alphabetically, then people without a title under "Members"
+        grouped_names = defaultdict(list)
+        other_titles = set()
+        no_title_names = []
+        for chair in valid_chairs:
+            name = chair.get('name')
+            title = chair.get('title', '').strip()
+            group_name = CHAIR_TITLE_GROUPS.get(title.lower())
+            if group_name:
+                grouped_names[group_name].append(name)
+            elif title:
+                grouped_names[title].append(name)
+                other_titles.add(title)
             else:
-                if website:
-                    display_url = website.replace('https://', '').replace('http://', '')
-                    if len(display_url) > 40:
-                        display_url = display_url[:37] + '...'
-                    display_url = display_url.replace('#', '\\#').replace('_', '\\_').replace('%', '\\%')
-                    content.append(f'\\noindent\\textbf{{Website:}} \\href{{{website}}}{{{display_url}}}\\\\')
-                    
-                for src, url in links.items():
-                    clean_url = url.replace('https://', '').replace('http://', '')
-                    clean_url = clean_url.replace('#', '\\#').replace('_', '\\_').replace('%', '\\%')
-                    content.append(f'\\noindent\\textbf{{{src.capitalize()}:}} \\href{{{url}}}{{{clean_url}}}\\\\')
-
-            content.append(r'')
-            
-            blurb = blurb_data.get('blurb', '').strip()
-            if blurb:
-                blurb_latex = self.markdown_to_latex(blurb)
-                content.append(r'{\setlength{\parindent}{1.5em}')
-                content.append(blurb_latex)
-                content.append(r'}')
-            
-            content.append('\\end{minipage}')
-            content.append('')
-            content.append('\\vspace{0.3cm}')
-            content.append('')
+                no_title_names.append(name)
         
-        content.append('\\end{multicols}')
-        
-        return '\n'.join(content)
+        roles = [(group, grouped_names[group]) for group in CHAIR_GROUP_ORDER if group in grouped_names]
+        roles += [(title, grouped_names[title]) for title in sorted(other_titles)]
+        if no_title_names:
+            roles.append(('Members', no_title_names))
+        return roles
+    
+    def url_text(self, url, max_length=None):
+        """A URL without its scheme, shortened to max_length and escaped for display"""
+        text = url.replace('https://', '').replace('http://', '')
+        if max_length and len(text) > max_length:
+            text = text[:max_length - 3] + '...'
+        return text.replace('#', '\\#').replace('_', '\\_').replace('%', '\\%')
+    
+    def directory_entry_key(self, org_name, blurb_data):
+        """Cache key for an organization's rendered directory entry"""
+        digest = hashlib.sha256()
+        digest.update(f'{GENERATOR_DIGEST}\0directory\0{org_name}\0print={self.print_mode}\0'
+                      f'{self.find_logo(org_name)}\0'.encode())
+        digest.update(json.dumps(blurb_data, sort_keys=True).encode())
+        return digest.hexdigest()
+    
+    def generate_directory_entry_tex(self, org_name, template=None):
+        """Generate one organization's directory entry, or None if it is skipped"""
+        blurb_data = self.load_blurb(org_name)
+        if not blurb_data:
+            print(f"Warning: No data found for {org_name}")
+            return None
+        
+        status = blurb_data.get('status', '')
+        if status == 'dormant' or status == 'dormat':
+            return None
+        
+        if not blurb_data.get('blurb', '').strip():
+            return None
+        
+        # Only organizations whose data (or logo) changed since a cached build are rendered again
+        key = self.directory_entry_key(org_name, blurb_data) if self.store else None
+        if key:
+            cached = self.store.get_text(FRAGMENT_NAMESPACE, key)
+            if cached is not None:
+                return cached
+        
+        entry_tex = self.render_directory_entry_tex(org_name, blurb_data, template)
+        if key:
+            self.store.put_text(FRAGMENT_NAMESPACE, key, entry_tex)
+        return entry_tex
+    
+    def render_directory_entry_tex(self, org_name, blurb_data, template=None):
+        """Render an organization's directory entry from its JSON data"""
+        template = template or self.template('directory_entry.tex.j2')
+        return template.render(**self.directory_entry_context(org_name, blurb_data))
+    
+    def directory_entry_context(self, org_name, blurb_data):
+        """Data for templates/directory_entry.tex.j2, already converted to LaTeX"""
+        blurb = blurb_data.get('blurb', '').strip()
+        display_name = blurb_data.get("name")
+        if org_name == 'reflections_projections':
+            display_name = r'Reflections \textbar{} Projections'
+        
+        meetings = []
+        meeting_times = blurb_data.get('meeting_times')
+        if meeting_times and isinstance(meeting_times, list):
+            meetings = [t for t in (self.format_meeting_time(mt) for mt in meeting_times) if t]
+        
+        # Print mode shows full URLs without links; online, long website addresses are shortened
+        links = []
+        website = blurb_data.get('website', '')
+        if website:
+            links.append(('Website', website, self.url_text(website, None if self.print_mode else 40)))
+        for src, url in blurb_data.get('links', {}).items():
+            links.append((src.capitalize(), url, self.url_text(url)))
+        
+        return dict(
+            name=display_name,
+            logo=self.find_logo(org_name),
+            roles=self.chair_roles(blurb_data.get('chairs', [])),
+            meetings=meetings,
+            links=links,
+            blurb=self.markdown_to_latex(blurb),
+            print_mode=self.print_mode,
+        )
+    
+    def generate_directory_entries(self, org_names):
+        """Generate the directory entries for org_names, dropping skipped organizations"""
+        template = self.template('directory_entry.tex.j2')
+        entries = []
+        for org_name in org_names:
+            entry = self.generate_directory_entry_tex(org_name, template)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+    
+    def assemble_directory_tex(self, entries):
+        """Wrap rendered directory entries in the directory section"""
+        return self.template('directory.tex.j2').render(entries=entries)
+    
+    def generate_directory_tex(self, org_names=None):
+        """Generate the directory section LaTeX file"""
+        if org_names is None:
+            org_names = self.config.get('directory_order', [])
+        return self.assemble_directory_tex(self.generate_directory_entries(org_names))
 
     def generate_toc_tex(self):
         """Generate table of contents"""
-        content = []
-        content.append('\\headline{\\textbf{\\LARGE In This Issue}}')
-        content.append('')
-        
-        # Add articles with dynamic page references
+        entries = []
         for article_name in self.config.get('article_order', []):
             try:
                 article = self.load_article(article_name)
-                title = article.get('title', 'Untitled')
-                title = self.escape_special_chars(title)  # Escape special characters in title
-                # Use \pageref to get actual page number
-                content.append(f'\\noindent {title} \\dotfill \\pageref{{article:{article_name}}}')
-                content.append('')
-            except:
+                # Titles link to \pageref{article:<name>} for the actual page number
+                entries.append((article_name, self.escape_special_chars(article.get('title', 'Untitled'))))
+            except Exception:
                 pass
+        return self.template('toc.tex.j2').render(entries=entries)
+    
+    # (output file, progress label) in the order the sections are generated
+    SECTIONS = [
+        ('toc.tex', 'table of contents'),
+        ('events.tex', 'events'),
+        ('horoscope.tex', 'horoscope'),
+        ('letter.tex', 'letter from the chair'),
+        ('articles.tex', 'articles'),
+        ('directory.tex', 'directory'),
+    ]
+    
+    def plan_sections(self, jobs):
+        """Split each section into independent render tasks
         
-        content.append('\\noindent Your Horoscope \\dotfill \\pageref{horoscope}')
-        content.append('')
-        
-        content.append('\\noindent ACM @ UIUC Directory \\dotfill \\pageref{directory}')
-        content.append('')
-        
-        content.append('\\vspace{0.3cm}')
+        Returns {output file: (tasks, combine)} where tasks is a list of
+        (method name, args) and combine turns the task results into the section.
+        Articles and directory entries are chunked so they spread across workers.
+        """
+        def chunks(names):
+            names = list(names)
+            size = max(1, -(-len(names) // (jobs * 4)))
+            return [(names[i:i + size],) for i in range(0, len(names), size)] or [([],)]
+        
+        def single(results):
+            return results[0]
+        
+        def join_articles(results):
+            return '\n\n'.join(r for r in results if r)
+        
+        def join_directory(results):
+            return self.assemble_directory_tex([e for entries in results for e in entries])
+        
+        return {
+            'toc.tex': ([('generate_toc_tex', ())], single),
+            'events.tex': ([('generate_events_tex', ())], single),
+            'horoscope.tex': ([('generate_horoscope_tex', ())], single),
+            'letter.tex': ([('generate_letter_tex', ())], single),
+            'articles.tex': ([('generate_articles_tex', args)
+                              for args in chunks(self.config.get('article_order', []))], join_articles),
+            'directory.tex': ([('generate_directory_entries', args)
+                               for args in chunks(self.config.get('directory_order', []))], join_directory),
+        }
+    
+    def iter_sections(self, jobs=1, log=None):
+        """Render every section, yielding (file name, LaTeX) in SECTIONS order
         
-        return '\n'.join(content)
+        Sections are rendered on a process pool of `jobs` workers (None: one per
+        core; 1 renders in-process) and each is yielded once it is complete.
+        Progress and warnings are written to `log` if given, else dropped; with
+        an in-memory or zip source nothing touches the disk.
+        """
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        plan = self.plan_sections(jobs)
+        
+        executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        try:
+            # Queue every task up front; results are collected in section order
+            pending = {}
+            for filename, _ in self.SECTIONS:
+                tasks, _ = plan[filename]
+                if executor:
+                    pending[filename] = [executor.submit(_render_task, self, method, args).result
+                                         for method, args in tasks]
+                else:
+                    pending[filename] = [partial(_render_task, self, method, args)
+                                         for method, args in tasks]
+            
+            for filename, label in self.SECTIONS:
+                if log:
+                    log.write(f"Generating {label}...\n")
+                results = []
+                for result in pending[filename]:
+                    tex, output, error = result()
+                    # Replay worker output so warnings appear under their section
+                    if log:
+                        log.write(output)
+                    if error is not None:
+                        raise error
+                    results.append(tex)
+                _, combine = plan[filename]
+                yield filename, combine(results)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
     
-    def generate_all(self, output_dir):
-        """Generate all LaTeX content files"""
+    def render_sections(self, jobs=1):
+        """Every section as {file name: LaTeX}, e.g. for a service or a test"""
+        return dict(self.iter_sections(jobs))
+    
+    def generate_all(self, output_dir, jobs=None):
+        """Generate all LaTeX content files
+        
+        Sections are rendered on a process pool of `jobs` workers (default: one
+        per core; 1 renders in-process) and written in order, each atomically.
+        """
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        # Generate table of contents
-        print("Generating table of contents...")
-        toc_tex = self.generate_toc_tex()
-        with open(output_path / 'toc.tex', 'w', encoding='utf-8') as f:
-            f.write(toc_tex)
-        
-        # Generate events
-        print("Generating events...")
-        events_tex = self.generate_events_tex()
-        with open(output_path / 'events.tex', 'w', encoding='utf-8') as f:
-            f.write(events_tex)
-        
-        # Generate horoscope
-        print("Generating horoscope...")
-        horoscope_tex = self.generate_horoscope_tex()
-        with open(output_path / 'horoscope.tex', 'w', encoding='utf-8') as f:
-            f.write(horoscope_tex)
-        
-        # Generate letter from the chair
-        print("Generating letter from the chair...")
-        letter_tex = self.generate_letter_tex()
-        with open(output_path / 'letter.tex', 'w', encoding='utf-8') as f:
-            f.write(letter_tex)
-        
-        # Generate articles
-        print("Generating articles...")
-        articles_tex = self.generate_articles_tex()
-        with open(output_path / 'articles.tex', 'w', encoding='utf-8') as f:
-            f.write(articles_tex)
-        
-        # Generate directory
-        print("Generating directory...")
-        directory_tex = self.generate_directory_tex()
-        with open(output_path / 'directory.tex', 'w', encoding='utf-8') as f:
-            f.write(directory_tex)
+        for filename, tex in self.iter_sections(jobs, log=sys.stdout):
+            write_text_atomic(output_path / filename, tex)
         
         print(f"\nAll files generated in {output_path}/")
         print("\nGenerated files:")
@@ -791,6 +812,96 @@ class NewspaperGenerator:
         print("1. Review the generated .tex files")
         print("2. Compile main.tex with: pdflatex main.tex")
 
+    def generate_preview(self, output_dir, only):
+        """Generate a reduced issue containing only the selected articles and/or the directory
+        
+        `only` lists article names from config.yaml (the letter from the chair
+        included) and optionally 'directory'. The selected sections are written
+        to output_dir, and preview.tex, a stub of main.tex with the same preamble
+        and column layout, is written next to main.tex, so the issue must be a
+        directory.
+        """
+        if self.base_dir is None:
+            raise ValueError("Previews are written next to main.tex and need an issue directory")
+        letter = self.config.get('letter_from_the_chair')
+        article_order = self.config.get('article_order', [])
+        valid = [letter] + article_order + ['directory']
+        unknown = [name for name in only if name not in valid]
+        if unknown:
+            raise ValueError(f"Unknown preview selection: {', '.join(unknown)} "
+                             f"(choose from: {', '.join(valid)})")
+        
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        rel_dir = os.path.relpath(output_path, self.base_dir).replace(os.sep, '/')
+        
+        body = []
+        if letter in only:
+            print("Generating letter from the chair...")
+            write_text_atomic(output_path / 'letter.tex', self.generate_letter_tex())
+            body.append(f'\\input{{./{rel_dir}/letter.tex}}')
+        
+        # Keep the issue's article order regardless of the order given on the command line
+        selected = [name for name in article_order if name in only]
+        if selected:
+            print(f"Generating {len(selected)} article(s)...")
+            write_text_atomic(output_path / 'articles.tex', self.generate_articles_tex(selected))
+            if body:
+                body.append('\\newpage')
+            body.append('\\begin{multicols}{2}')
+            body.append(f'\\input{{./{rel_dir}/articles.tex}}')
+            body.append('\\end{multicols}')
+        
+        if 'directory' in only:
+            print("Generating directory...")
+            write_text_atomic(output_path / 'directory.tex', self.generate_directory_tex())
+            # directory.tex starts with its own \newpage
+            body.append(f'\\input{{./{rel_dir}/directory.tex}}')
+        
+        # Reuse the real preamble so fonts, packages and column widths match the issue
+        main_tex = self.source.read_text('main.tex')
+        preamble = main_tex.split('\\begin{document}', 1)[0]
+        
+        preview_path = self.base_dir / 'preview.tex'
+        write_text_atomic(preview_path, preamble + '\\begin{document}\n\n'
+                          + '\n\n'.join(body) + '\n\n\\end{document}\n')
+        
+        print(f"\nPreview generated in {output_path}/")
+        print(f"Compile with: cd {self.base_dir} && pdflatex preview.tex")
+        return preview_path
+
+
+def _render_task(generator, method_name, args):
+    """Run one render task (in a worker process), capturing what it prints"""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            return getattr(generator, method_name)(*args), log.getvalue(), None
+        except Exception as e:
+            return None, log.getvalue(), e
+
+
+def current_umask():
+    """The process umask (reading it means setting it, so it is put straight back)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_text_atomic(path, text):
+    """Write text to path via a temporary file so readers never see a partial file"""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # mkstemp creates the file 0600; give it the permissions open() would have
+        os.chmod(tmp_path, 0o666 & ~current_umask())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 if __name__ == '__main__':
     import sys
@@ -801,12 +912,26 @@ if __name__ == '__main__':
                         help='Base directory for the newspaper files (default: /mnt/project/vol43is1)')
     parser.add_argument('--print-mode', action='store_true',
                         help='Generate print version with non-clickable links in black')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker processes for rendering sections (default: one per core, 1 = no pool)')
+    parser.add_argument('--only', type=lambda v: [name.strip() for name in v.split(',') if name.strip()],
+                        help='Draft preview: comma-separated article names and/or "directory"; '
+                             'writes content/preview/ and preview.tex instead of the full issue')
+    parser.add_argument('--cache-dir', default=os.environ.get('BANKS_CACHE_DIR'),
+                        help='Reuse rendered article fragments from this artifact cache (default: $BANKS_CACHE_DIR, off if unset)')
     
     args = parser.parse_args()
     
     try:
-        generator = NewspaperGenerator(args.base_dir, print_mode=args.print_mode)
-        generator.generate_all(f'{args.base_dir}/content')
+        store = None
+        if args.cache_dir:
+            from artifact_store import open_store
+            store = open_store(args.cache_dir)
+        generator = NewspaperGenerator(args.base_dir, print_mode=args.print_mode, store=store)
+        if args.only:
+            generator.generate_preview(f'{args.base_dir}/content/preview', args.only)
+        else:
+            generator.generate_all(f'{args.base_dir}/content', jobs=args.jobs)
         
         if args.print_mode:
             print("\nGenerated in PRINT mode (non-clickable black links)")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Render thumbnails and page previews for the archive PDFs.
+
+Every content/issues/**/issue.md names a scanned (print.pdf_scan) or
+born-digital (print.pdf) PDF. For each one this renders a first-page
+thumbnail and a low-resolution preview of every page into
+{out}/<digest>-v<n>/, where <digest> is the PDF's content hash, so unchanged
+scans are never rendered twice and identical files share one set of
+images. Rendering runs on a process pool.
+
+The results are listed in {out}/catalog.json for the website:
+    {"issues": [{"path", "volume", "issue", "date", "pdf", "sha256",
+                 "pages", "thumbnail", "previews": [...]}, ...]}
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+
+import pypdfium2 as pdfium
+
+from archive_manifest import file_digests
+from generate_articles import read_article_header
+from generate_newspaper import current_umask
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+ISSUES_DIR = SCRIPT_DIR.parents[1]
+DEFAULT_OUT = SCRIPT_DIR.parents[3] / 'website' / 'public' / 'previews'
+
+# Bump when the rendering settings change so every PDF is re-rendered
+PREVIEW_VERSION = 1
+
+THUMBNAIL_WIDTH = 320
+PREVIEW_DPI = 50
+JPEG_QUALITY = 70
+
+
+def find_archive_pdfs(issues_dir=ISSUES_DIR):
+    """Yield (issue_md, header, pdf_path) for every issue whose PDF is on disk"""
+    for issue_md in sorted(Path(issues_dir).rglob('issue.md')):
+        header = read_article_header(issue_md)
+        print_info = header.get('print') or {}
+        pdf_name = print_info.get('pdf_scan') or print_info.get('pdf')
+        if not pdf_name:
+            continue
+        pdf_path = issue_md.parent / pdf_name
+        if pdf_path.exists():
+            yield issue_md, header, pdf_path
+
+
+def preview_key(digest):
+    """Directory name for a PDF's previews"""
+    return f'{digest[:16]}-v{PREVIEW_VERSION}'
+
+
+def render_previews(pdf_path, target_dir, thumbnail_width=THUMBNAIL_WIDTH, preview_dpi=PREVIEW_DPI):
+    """Render the thumbnail and page previews of one PDF into target_dir (runs in a worker)"""
+    target_dir = Path(target_dir)
+    tmp_dir = Path(tempfile.mkdtemp(dir=target_dir.parent, prefix=f'.{target_dir.name}.'))
+    try:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        previews = []
+        try:
+            for index in range(len(pdf)):
+                page = pdf[index]
+                if index == 0:
+                    scale = thumbnail_width / page.get_width()
+                    thumb = page.render(scale=scale).to_pil().convert('RGB')
+                    thumb.save(tmp_dir / 'thumb.jpg', quality=JPEG_QUALITY, optimize=True)
+                image = page.render(scale=preview_dpi / 72).to_pil().convert('RGB')
+                name = f'page-{index + 1:03d}.jpg'
+                image.save(tmp_dir / name, quality=JPEG_QUALITY, optimize=True)
+                previews.append(name)
+                page.close()
+        finally:
+            pdf.close()
+
+        meta = {'pages': len(previews), 'thumbnail': 'thumb.jpg', 'previews': previews}
+        with open(tmp_dir / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+        # mkdtemp creates the directory 0700; the site serves these files, so give it the usual mode
+        os.chmod(tmp_dir, 0o777 & ~current_umask())
+        # Publish the finished directory in one step; another run may have won the race
+        try:
+            os.rename(tmp_dir, target_dir)
+        except OSError:
+            if not (target_dir / 'meta.json').exists():
+                raise
+            shutil.rmtree(tmp_dir)
+        return meta
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def load_meta(preview_dir):
+    meta_path = preview_dir / 'meta.json'
+    if meta_path.exists():
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return None
+
+
+def json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'Cannot serialise {type(value).__name__}')
+
+
+def generate_previews(out_dir=DEFAULT_OUT, issues_dir=ISSUES_DIR, jobs=None, url_prefix='/previews', prune=False):
+    """Render previews for every archive PDF that has none yet and write the catalog"""
+    out_dir = Path(out_dir)
+    issues_dir = Path(issues_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    to_render = {}
+    found = list(find_archive_pdfs(issues_dir))
+    digests = file_digests(pdf_path for _, _, pdf_path in found)
+    for issue_md, header, pdf_path in found:
+        digest = digests[pdf_path]
+        key = preview_key(digest)
+        entries.append((issue_md, header, pdf_path, digest, key))
+        if load_meta(out_dir / key) is None:
+            to_render.setdefault(key, pdf_path)
+
+    print(f"Found {len(entries)} archive PDFs, {len(to_render)} need previews.")
+
+    failed = set()
+    if to_render:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(render_previews, pdf_path, out_dir / key): (key, pdf_path)
+                       for key, pdf_path in to_render.items()}
+            for future in as_completed(futures):
+                key, pdf_path = futures[future]
+                try:
+                    meta = future.result()
+                    print(f"  Rendered {pdf_path.relative_to(issues_dir)} ({meta['pages']} pages)")
+                except Exception as e:
+                    failed.add(key)
+                    print(f"  Error rendering {pdf_path.relative_to(issues_dir)}: {e}", file=sys.stderr)
+
+    catalog = []
+    for issue_md, header, pdf_path, digest, key in entries:
+        if key in failed:
+            continue
+        meta = load_meta(out_dir / key)
+        base_url = f'{url_prefix.rstrip("/")}/{key}'
+        catalog.append({
+            'path': issue_md.parent.relative_to(issues_dir).as_posix(),
+            'volume': header.get('volume'),
+            'issue': header.get('issue'),
+            'date': header.get('date'),
+            'pdf': pdf_path.name,
+            'sha256': digest,
+            'pages': meta['pages'],
+            'thumbnail': f'{base_url}/{meta["thumbnail"]}',
+            'previews': [f'{base_url}/{name}' for name in meta['previews']],
+        })
+
+    with open(out_dir / 'catalog.json', 'w', encoding='utf-8') as f:
+        json.dump({'issues': catalog}, f, indent=2, ensure_ascii=False, default=json_default)
+
+    if prune:
+        live = {entry[4] for entry in entries}
+        for child in out_dir.iterdir():
+            if child.is_dir() and child.name not in live:
+                shutil.rmtree(child)
+                print(f"  Pruned {child.name}")
+
+    return catalog, len(to_render) - len(failed), failed
+
+
+def main():
+    """Main function to generate archive previews."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render thumbnails and page previews for the archive PDFs')
+    parser.add_argument('--out', default=str(DEFAULT_OUT),
+                        help='Output directory (default: website/public/previews)')
+    parser.add_argument('--issues-dir', default=str(ISSUES_DIR), help='Archive root (default: content/issues)')
+    parser.add_argument('--url-prefix', default='/previews',
+                        help='URL the website serves the output directory from (default: /previews)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Worker processes (default: one per core)')
+    parser.add_argument('--prune', action='store_true', help='Delete previews of PDFs that are no longer in the archive')
+
+    args = parser.parse_args()
+
+    catalog, rendered, failed = generate_previews(args.out, args.issues_dir, args.jobs, args.url_prefix, args.prune)
+
+    print(f"\n✓ Previews ready for {len(catalog)} issues ({rendered} PDFs rendered, the rest from cache).")
+    print(f"Catalog written to {Path(args.out) / 'catalog.json'}")
+    if failed:
+        print(f"✗ {len(failed)} PDF(s) could not be rendered")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Where NewspaperGenerator reads an issue from.
+
+An issue source serves the files of an issue directory (config.yaml,
+articles/*.md, content/articles/*.yaml, content/blurb/*.json, events.yaml,
+horoscope.yaml, logo/, main.tex) by their path relative to the issue, so
+the generator can render from a directory, from a dict held in memory, or
+straight out of a zip archive without extracting it:
+
+    NewspaperGenerator('vol43is1')                        # directory
+    NewspaperGenerator(ZipSource('vol43is1.zip'))         # zip, issue at the root or in one folder
+    NewspaperGenerator(MemorySource({'config.yaml': ...}))
+
+Sources are picklable, so generators using them still render on a process pool.
+"""
+
+import abc
+import io
+import os
+import zipfile
+from pathlib import Path, PurePosixPath
+
+
+def normalize_path(path):
+    """'./content//blurb/x.json' -> 'content/blurb/x.json'"""
+    parts = [part for part in PurePosixPath(str(path).replace(os.sep, '/')).parts if part not in ('.', '/')]
+    return '/'.join(parts)
+
+
+def files_in(paths, directory):
+    """Names of the paths that sit directly inside directory"""
+    directory = normalize_path(directory)
+    prefix = f'{directory}/' if directory else ''
+    return {path[len(prefix):] for path in paths if path.startswith(prefix) and '/' not in path[len(prefix):]}
+
+
+class IssueSource(abc.ABC):
+    """Interface every issue source implements; paths are relative to the issue, '/'-separated"""
+
+    # Directory the issue lives in on disk, or None for sources that are not a directory
+    base_dir = None
+
+    @abc.abstractmethod
+    def read_bytes(self, path):
+        """Return the file's contents; raises FileNotFoundError if there is no such file"""
+
+    @abc.abstractmethod
+    def listdir(self, path):
+        """Names of the files directly inside a directory (empty if it does not exist)"""
+
+    def read_text(self, path):
+        return self.read_bytes(path).decode('utf-8')
+
+    def exists(self, path):
+        try:
+            self.read_bytes(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+
+class DirectorySource(IssueSource):
+    """An issue directory on disk"""
+
+    def __init__(self, base_dir):
+        self.base_dir = Path(base_dir)
+        # {path: (mtime, names)}, so repeated lookups (one logo per directory entry) list each directory once
+        self._listings = {}
+
+    def __getstate__(self):
+        return {'base_dir': self.base_dir, '_listings': {}}
+
+    def read_bytes(self, path):
+        return (self.base_dir / normalize_path(path)).read_bytes()
+
+    def exists(self, path):
+        return (self.base_dir / normalize_path(path)).is_file()
+
+    def listdir(self, path):
+        directory = self.base_dir / normalize_path(path)
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return set()
+        listing = self._listings.get(directory)
+        if listing is None or listing[0] != mtime:
+            listing = self._listings[directory] = (mtime, set(os.listdir(directory)))
+        return listing[1]
+
+
+class MemorySource(IssueSource):
+    """An issue held in memory as {relative path: str or bytes}"""
+
+    def __init__(self, files):
+        self.files = {normalize_path(path): data for path, data in files.items()}
+
+    @classmethod
+    def from_directory(cls, base_dir):
+        """Load every file of an issue directory into memory"""
+        base_dir = Path(base_dir)
+        return cls({path.relative_to(base_dir).as_posix(): path.read_bytes()
+                    for path in base_dir.rglob('*') if path.is_file()})
+
+    def read_bytes(self, path):
+        try:
+            data = self.files[normalize_path(path)]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+        return data.encode('utf-8') if isinstance(data, str) else data
+
+    def exists(self, path):
+        return normalize_path(path) in self.files
+
+    def listdir(self, path):
+        return files_in(self.files, path)
+
+
+class ZipSource(IssueSource):
+    """An issue inside a zip archive, read member by member without extracting
+
+    archive is a path, the archive's bytes or a binary file object (read into
+    memory). The issue is the folder holding config.yaml: the archive root,
+    or the shallowest folder that has one, unless root is given.
+    """
+
+    def __init__(self, archive, root=None):
+        if not isinstance(archive, (str, os.PathLike, bytes)):
+            archive = archive.read()
+        self.archive = archive
+        self._zip = None
+        if root is None:
+            candidates = [name for name in self.zip.namelist()
+                          if name == 'config.yaml' or name.endswith('/config.yaml')]
+            if not candidates:
+                raise FileNotFoundError(f"No config.yaml in {self.describe()}")
+            root = min(candidates, key=lambda name: name.count('/'))[:-len('config.yaml')]
+        self.root = normalize_path(root)
+        self._names = None
+
+    def __getstate__(self):
+        return {'archive': self.archive, 'root': self.root, '_zip': None, '_names': None}
+
+    def describe(self):
+        return 'zip archive' if isinstance(self.archive, bytes) else str(self.archive)
+
+    @property
+    def zip(self):
+        # Opened lazily so each worker process opens its own handle
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(io.BytesIO(self.archive) if isinstance(self.archive, bytes) else self.archive)
+        return self._zip
+
+    @property
+    def names(self):
+        """Paths of the files in the issue folder, relative to it"""
+        if self._names is None:
+            prefix = f'{self.root}/' if self.root else ''
+            self._names = {info.filename[len(prefix):]: info.filename for info in self.zip.infolist()
+                           if not info.is_dir() and info.filename.startswith(prefix)}
+        return self._names
+
+    def read_bytes(self, path):
+        member = self.names.get(normalize_path(path))
+        if member is None:
+            raise FileNotFoundError(path)
+        return self.zip.read(member)
+
+    def exists(self, path):
+        return normalize_path(path) in self.names
+
+    def listdir(self, path):
+        return files_in(self.names, path)
+
+
+def open_source(location):
+    """An IssueSource for a directory, a .zip path, a {path: contents} dict or an existing source"""
+    if isinstance(location, IssueSource):
+        return location
+    if isinstance(location, dict):
+        return MemorySource(location)
+    if isinstance(location, (str, os.PathLike)) and Path(location).is_file() and zipfile.is_zipfile(location):
+        return ZipSource(location)
+    return DirectorySource(location)
+
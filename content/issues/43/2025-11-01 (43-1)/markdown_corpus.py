@@ -0,0 +1,38 @@
+"""
+Markdown inputs for checking markdown_to_latex, shared by benchmark.py and
+tests/test_markdown_linear.py.
+
+Kept free of the benchmark's imports (pikepdf, the build and archive tools)
+so the tests only need what generate_newspaper.py needs.
+"""
+
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SAMPLE_ISSUE = SCRIPT_DIR / 'vol43is1'
+SAMPLE_ARTICLES = SCRIPT_DIR.parents[2] / 'articles'
+
+# Inputs that make backtracking regexes rescan the rest of the text from
+# every opening delimiter: each is a unit repeated to the requested size,
+# on one line unless the unit contains a newline
+ADVERSARIAL_MARKDOWN = {
+    'stray asterisks': 'word * ',
+    'unclosed bold': '**word ',
+    'asterisk runs': '***** ',
+    'open brackets': '[',
+    'unclosed links': '[text ',
+    'unclosed images': '![alt ',
+    'links without target': '[text](target ',
+    'brackets and parens': '[](',
+    'pasted log': '[INFO] (pid 4242) worker[3] started: *ready* (queue=[a, b\n',
+    'code dump': 'x = f(a[i], *args, **kw) # [todo](  \n',
+}
+
+# Linear code doubles its time when the input doubles and quadratic code
+# quadruples it; growth at or past this fails `benchmark.py markdown`
+MAX_GROWTH = 3.0
+
+
+def adversarial_markdown(unit, size):
+    """unit repeated to exactly size characters"""
+    return (unit * (size // len(unit) + 1))[:size]
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Suggest an article order for config.yaml that prints on fewer pages.
+
+Articles flow through two columns (multicols, balanced on the last page)
+after the front page. Each article opens with \\needspace{5\\baselineskip}
+(20 lines when it starts with an image), and headers, headings and images
+cannot break across columns, so in an unlucky order they are pushed to the
+next column and leave the bottom of the previous one empty, sometimes enough
+to add a printed page.
+
+Each article is estimated as a list of blocks, in points: its header (title
+lines, byline, rules), paragraphs wrapped at the average characters per
+column line, headings, list items, images at 0.82\\columnwidth with their real
+aspect ratio, and in print mode a QR code per link. Laying out an order is a
+fold over the articles in which each step only depends on how full the
+current column is, so each (article, column fill) step is computed once and
+cached, and scoring an order costs one lookup per article. Articles listed
+under pinned_articles in config.yaml (or passed with --pin) keep their
+positions; the rest are arranged exhaustively when there are at most
+EXHAUSTIVE_LIMIT of them, otherwise by hill climbing over swaps and moves
+from the current order and from a few seeded shuffles. Orders are ranked by
+pages, then by whitespace left at column bottoms, then by how few articles
+moved from the editor's order.
+
+These are estimates, not pdflatex: compile the issue before sending it to print.
+
+Usage: python3 optimize_order.py vol43is1 [--print-mode] [--pin banks] [--write]
+"""
+
+import io
+import math
+import random
+import re
+import sys
+import time
+from itertools import permutations
+
+from PIL import Image
+
+from generate_newspaper import LINEBREAK_PATTERN, NewspaperGenerator, sub_bracket_links
+
+# Page geometry from templates/newspaper.sty and the article class at 10pt, in points
+BASELINE = 12
+COLUMN_HEIGHT = 684                 # \textheight 9.5in
+COLUMN_WIDTH = 247                  # (7in \textwidth - 10pt \columnsep) / 2
+CHAR_WIDTH = 4.6                    # average Times character at 10pt, spaces included
+PARINDENT_CHARS = 3
+
+# Vertical space of the article furniture, in points
+CENTER_SKIP = 8                     # \topsep above and below a center environment
+TITLE_BASELINE = 18                 # \Large bold title
+TITLE_CHAR_WIDTH = 7.2
+BYLINE_HEIGHT = 10                  # \footnotesize "By ..."
+HEADLINE_RULE = 12
+CLOSE_ARTICLE = 20                  # \closearticle double rule
+HEADING_HEIGHTS = {'#': 43, '##': 35, '###': 33}
+LIST_SKIP = 8                       # \topsep around itemize
+ITEM_SKIP = 4                       # \itemsep
+ITEM_INDENT = 25                    # itemize left margin
+IMAGE_WIDTH = 0.82 * COLUMN_WIDTH
+DEFAULT_ASPECT = 3 / 4              # height / width when an image can't be read
+QR_CODE_HEIGHT = 90                 # 0.8in code, gap and URL caption (print mode)
+LINEBREAK_HEIGHT = 5                # <br> -> \vspace{0.5em}
+
+NEEDSPACE_LINES = 5
+NEEDSPACE_IMAGE_LINES = 20
+
+EXHAUSTIVE_LIMIT = 7
+RESTARTS = 3
+
+# Block kinds: text breaks between lines, boxes move whole to the next column
+TEXT, BOX = 'text', 'box'
+
+HEADING_PATTERN = re.compile(r'^(#{1,3}) (.+)$')
+LIST_ITEM_PATTERN = re.compile(r'^\s*[\*\-]\s+(.*)$')
+EMPHASIS_PATTERN = re.compile(r'\*+')
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+
+
+def wrapped_lines(text, width=COLUMN_WIDTH, char_width=CHAR_WIDTH, indent=0):
+    """Lines a paragraph of plain text takes at the given width"""
+    per_line = max(1, int(width / char_width))
+    return max(1, math.ceil((len(text) + indent) / per_line))
+
+
+class ArticleEstimator:
+    """Turns articles into (kind, height, needed space) blocks, in points"""
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.print_mode = generator.print_mode
+        self._aspects = {}
+
+    def image_aspect(self, path):
+        """Height / width of an article image"""
+        if path not in self._aspects:
+            try:
+                with Image.open(io.BytesIO(self.generator.source.read_bytes(f'articles/images/{path}'))) as image:
+                    width, height = image.size
+                self._aspects[path] = height / width
+            except (OSError, ValueError, ZeroDivisionError):
+                self._aspects[path] = DEFAULT_ASPECT
+        return self._aspects[path]
+
+    def header_height(self, article):
+        title = article.get('title') or 'Untitled'
+        lines = wrapped_lines(title.strip(), char_width=TITLE_CHAR_WIDTH)
+        authors = article.get('author', article.get('authors'))
+        return 2 * CENTER_SKIP + lines * TITLE_BASELINE + (BYLINE_HEIGHT if authors else 0) + HEADLINE_RULE
+
+    def inline_blocks(self, text, width=COLUMN_WIDTH, indent=PARINDENT_CHARS):
+        """Text of one paragraph or list item, followed by its images and QR codes"""
+        images, links = [], []
+
+        def take_image(alt, path):
+            images.append(path[2:] if path.startswith('./') else path)
+            return ''
+
+        def take_link(label, url):
+            links.append(url)
+            # Print mode replaces the link text with a QR code
+            return '' if self.print_mode else label
+
+        text = sub_bracket_links(text, take_image, prefix='!', allow_empty_label=True)
+        text = sub_bracket_links(text, take_link)
+        text = EMPHASIS_PATTERN.sub('', ' '.join(text.split()))
+
+        blocks = []
+        if text:
+            blocks.append((TEXT, wrapped_lines(text, width, indent=indent) * BASELINE, 0))
+        for path in images:
+            height = 2 * CENTER_SKIP + IMAGE_WIDTH * self.image_aspect(path)
+            blocks.append((BOX, math.ceil(height), 0))
+        if self.print_mode:
+            blocks.extend((BOX, QR_CODE_HEIGHT, 0) for _ in links)
+        return blocks
+
+    def blocks(self, article):
+        content = (article.get('content') or '').strip()
+        needspace = NEEDSPACE_IMAGE_LINES if content.startswith('![') else NEEDSPACE_LINES
+        blocks = [(BOX, self.header_height(article), needspace * BASELINE)]
+
+        content = LINEBREAK_PATTERN.sub('\n\n<br>\n\n', content)
+        for paragraph in PARAGRAPH_BREAK_PATTERN.split(content):
+            pending, in_list = [], False
+            for line in paragraph.splitlines() + [None]:
+                heading = HEADING_PATTERN.match(line) if line is not None else None
+                item = LIST_ITEM_PATTERN.match(line) if line is not None else None
+                if (line is None or heading or item or line.strip() == '<br>') and pending:
+                    blocks.extend(self.inline_blocks(' '.join(pending)))
+                    pending = []
+                if in_list and not item:
+                    blocks.append((BOX, LIST_SKIP, 0))
+                    in_list = False
+                if line is None:
+                    break
+                if heading:
+                    height = HEADING_HEIGHTS[heading.group(1)]
+                    # Headings stay with the first two lines after them
+                    blocks.append((BOX, height, height + 2 * BASELINE))
+                elif item:
+                    blocks.append((BOX, ITEM_SKIP if in_list else LIST_SKIP, 0))
+                    blocks.extend(self.inline_blocks(item.group(1), COLUMN_WIDTH - ITEM_INDENT, indent=0))
+                    in_list = True
+                elif line.strip() == '<br>':
+                    blocks.append((BOX, LINEBREAK_HEIGHT, 0))
+                elif line.strip():
+                    pending.append(line.strip())
+
+        blocks.append((BOX, CLOSE_ARTICLE, 0))
+        return blocks
+
+
+class ColumnLayout:
+    """Scores article orders by laying their blocks out in columns of column_height points"""
+
+    def __init__(self, blocks_by_name, column_height=COLUMN_HEIGHT):
+        self.blocks = blocks_by_name
+        self.height = column_height
+        # Points of content in each article, before any whitespace the layout adds
+        self.lengths = {name: sum(size for _, size, _ in blocks) for name, blocks in blocks_by_name.items()}
+        self._steps = {}
+
+    def step(self, name, fill):
+        """Place one article starting fill points down a column
+
+        Returns (columns finished, fill afterwards, whitespace left at the
+        bottom of finished columns).
+        """
+        key = (name, fill)
+        cached = self._steps.get(key)
+        if cached is not None:
+            return cached
+        height = self.height
+        columns = waste = 0
+        for kind, size, needed in self.blocks.get(name, ()):
+            if kind is BOX:
+                if fill and fill + max(size, needed) > height:
+                    waste += height - fill
+                    columns += 1
+                    fill = 0
+                fill += size
+                # Taller than a column: LaTeX lets it overflow, so carry the rest over
+                while fill > height:
+                    columns += 1
+                    fill -= height
+            else:
+                lines = size // BASELINE
+                while lines:
+                    fits = (height - fill) // BASELINE
+                    if fits >= lines:
+                        fill += lines * BASELINE
+                        break
+                    lines -= fits
+                    columns += 1
+                    fill = 0
+        result = self._steps[key] = (columns, fill, waste)
+        return result
+
+    def states(self, order):
+        """(columns finished, whitespace, fill) before each article of order and after the last"""
+        columns = waste = fill = 0
+        states = [(0, 0, 0)]
+        for name in order:
+            done, fill, left = self.step(name, fill)
+            columns += done
+            waste += left
+            states.append((columns, waste, fill))
+        return states
+
+    @staticmethod
+    def pages(columns, fill):
+        return math.ceil((columns + (1 if fill else 0)) / 2)
+
+    def score(self, order):
+        """(pages, points of whitespace at column bottoms) for an order"""
+        columns, waste, fill = self.states(order)[-1]
+        return self.pages(columns, fill), waste
+
+    def columns(self, name):
+        """Height of an article on its own, in columns"""
+        done, fill, _ = self.step(name, 0)
+        return done + fill / self.height
+
+
+def optimize_order(layout, order, pinned=(), seed=0, restarts=RESTARTS):
+    """Best order found for layout, with pinned articles at their current positions"""
+    order = list(order)
+    free_positions = [i for i, name in enumerate(order) if name not in pinned]
+    free = [order[i] for i in free_positions]
+
+    def build(arrangement):
+        candidate = list(order)
+        for i, name in zip(free_positions, arrangement):
+            candidate[i] = name
+        return candidate
+
+    def cost(candidate):
+        pages, waste = layout.score(candidate)
+        return pages, waste, sum(a != b for a, b in zip(candidate, order))
+
+    if len(free) <= EXHAUSTIVE_LIMIT:
+        return min((build(arrangement) for arrangement in permutations(free)), key=cost)
+
+    def climb(current):
+        """Take improving swaps and moves of free articles until none is left
+
+        A candidate only differs from the current order between positions lo
+        and hi, so it is laid out from the current order's state at lo, and
+        once the column fill past hi matches the current order's again the
+        rest is known to be the same. Whitespace only grows and the articles
+        still to place need at least their own length, so a candidate is
+        dropped as soon as it has more whitespace than the best order and
+        can't end up on fewer pages.
+        """
+        n = len(current)
+        height = layout.height
+        step = layout.step
+
+        def track(current):
+            remaining = [0] * (n + 1)
+            for k in range(n - 1, -1, -1):
+                remaining[k] = remaining[k + 1] + layout.lengths.get(current[k], 0)
+            return layout.states(current), remaining
+
+        states, remaining = track(current)
+        best = cost(current)
+        moved = best[2]
+        improved = True
+        while improved:
+            improved = False
+            for a in range(len(free_positions)):
+                for b in range(len(free_positions)):
+                    if a == b:
+                        continue
+                    lo, hi = free_positions[min(a, b)], free_positions[max(a, b)]
+                    candidate = list(current)
+                    if a < b:
+                        candidate[lo], candidate[hi] = candidate[hi], candidate[lo]
+                    else:
+                        # Move the article at free slot b to free slot a, shifting the free ones between
+                        slots = free_positions[b:a + 1]
+                        names = [current[i] for i in slots]
+                        for i, name in zip(slots, names[1:] + names[:1]):
+                            candidate[i] = name
+
+                    columns, waste, fill = states[lo]
+                    k = lo
+                    while k < n:
+                        if waste > best[1] and (columns * height + fill + remaining[k]) / (2 * height) > best[0] - 1:
+                            break
+                        if k > hi and fill == states[k][2]:
+                            columns += states[n][0] - states[k][0]
+                            waste += states[n][1] - states[k][1]
+                            fill = states[n][2]
+                            k = n
+                            break
+                        done, fill, left = step(candidate[k], fill)
+                        columns += done
+                        waste += left
+                        k += 1
+                    if k < n:
+                        continue
+                    candidate_moved = moved + sum((candidate[i] != order[i]) - (current[i] != order[i])
+                                                  for i in range(lo, hi + 1))
+                    candidate_cost = (layout.pages(columns, fill), waste, candidate_moved)
+                    if candidate_cost < best:
+                        current, best, moved, improved = candidate, candidate_cost, candidate_moved, True
+                        states, remaining = track(current)
+        return current, best
+
+    rng = random.Random(seed)
+    best, best_cost = climb(build(free))
+    for _ in range(restarts):
+        shuffled = list(free)
+        rng.shuffle(shuffled)
+        candidate, candidate_cost = climb(build(shuffled))
+        if candidate_cost < best_cost:
+            best, best_cost = candidate, candidate_cost
+    return best
+
+
+def estimate_layout(generator, names):
+    """ColumnLayout for the named articles (missing articles take no space, as in the issue)"""
+    estimator = ArticleEstimator(generator)
+    blocks = {}
+    for name in names:
+        try:
+            article = generator.load_article(name)
+        except Exception:
+            article = None
+        blocks[name] = estimator.blocks(article) if article else []
+    return ColumnLayout(blocks)
+
+
+def write_article_order(config_path, order):
+    """Replace the article_order list in config.yaml, leaving the rest of the file as it is"""
+    text = config_path.read_text(encoding='utf-8')
+    match = re.search(r'^article_order:[ \t]*\n((?:[ \t]+-[^\n]*(?:\n|$))+)', text, re.MULTILINE)
+    if not match:
+        raise ValueError(f"No article_order list in {config_path}")
+    indent = re.match(r'[ \t]+', match.group(1)).group(0)
+    items = ''.join(f'{indent}- {name}\n' for name in order)
+    config_path.write_text(text[:match.start(1)] + items + text[match.end(1):], encoding='utf-8')
+
+
+def main():
+    """Main function to suggest an article order."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Suggest an article order that needs fewer pages')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1")')
+    parser.add_argument('--print-mode', action='store_true', help='Estimate the print version (QR codes for links)')
+    parser.add_argument('--pin', action='append', default=[],
+                        help='Keep this article where it is (repeatable; adds to pinned_articles in config.yaml)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the shuffled restarts (default: 0)')
+    parser.add_argument('--write', action='store_true', help='Write the suggested order to config.yaml')
+    args = parser.parse_args()
+
+    generator = NewspaperGenerator(args.base_dir, print_mode=args.print_mode)
+    order = list(generator.config.get('article_order') or [])
+    pinned = set(generator.config.get('pinned_articles') or []) | set(args.pin)
+    unknown = sorted(pinned - set(order))
+    if unknown:
+        print(f"✗ Pinned article(s) not in article_order: {', '.join(unknown)}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    layout = estimate_layout(generator, order)
+    suggested = optimize_order(layout, order, pinned, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    mode = 'print' if args.print_mode else 'online'
+    print(f"Estimated layout of {len(order)} articles ({mode}), searched in {elapsed:.2f}s")
+    for label, candidate in (('current order', order), ('suggested order', suggested)):
+        pages, waste = layout.score(candidate)
+        print(f"  {label:<16} {pages} page(s), {waste / BASELINE:.0f} empty lines at column bottoms")
+    print("\narticle_order:")
+    for i, name in enumerate(suggested):
+        note = 'pinned' if name in pinned else ('' if order[i] == name else f'was #{order.index(name) + 1}')
+        print(f"  - {name:<24} {layout.columns(name):4.2f} col  {note}".rstrip())
+
+    if suggested == order:
+        print("\n✓ The current order is already the best found")
+    elif args.write:
+        config_path = generator.base_dir / 'config.yaml'
+        write_article_order(config_path, suggested)
+        print(f"\n✓ Wrote article_order to {config_path}")
+    else:
+        print("\nRun with --write to save this order to config.yaml")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Linearize and recompress PDFs before they are published.
+
+For each PDF this merges identical embedded images and font programs,
+drops unreferenced resources, recompresses Flate streams, packs objects into
+object streams and writes a linearized ("fast web view") file, so browsers can
+show the first page of a byte-range served PDF before the rest arrives.
+
+Issue PDFs (main.pdf, main-print.pdf) are optimized in place with --issue;
+archive PDFs (print.pdf / print.pdf_scan in content/issues/**/issue.md) are
+written to website/public/pdfs/<issue path>/ on a process pool. Results are
+cached in the artifact store (see artifact_store.py) under the input's hash,
+so unchanged PDFs are never processed twice.
+
+Usage:
+    python3 optimize_pdfs.py --issue vol43is1
+    python3 optimize_pdfs.py --archive [--jobs 4]
+"""
+
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pikepdf
+
+from artifact_store import open_store
+from archive_manifest import file_digests
+from export_website import hash_file
+from generate_previews import ISSUES_DIR, find_archive_pdfs
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_ARCHIVE_OUT = SCRIPT_DIR.parents[3] / 'website' / 'public' / 'pdfs'
+
+# Bump when the optimization settings change so every PDF is reprocessed
+OPTIMIZE_VERSION = 2
+NAMESPACE = 'pdf-optimized'
+
+FONT_FILE_KEYS = ('/FontFile', '/FontFile2', '/FontFile3')
+
+
+def hash_object(obj, digest, visited):
+    """Feed obj into digest by content, following indirect references into the objects they name
+
+    pikepdf's repr() of a referenced stream (an /SMask, an ICCBased colour
+    space) names it without its data, so two images with different masks
+    would look identical. Indirect objects already visited (references can
+    form cycles) are written as their position in the walk.
+    """
+    if isinstance(obj, (pikepdf.Stream, pikepdf.Dictionary, pikepdf.Array)) and obj.is_indirect:
+        if obj.objgen in visited:
+            digest.update(f'R{visited[obj.objgen]}\0'.encode())
+            return
+        visited[obj.objgen] = len(visited)
+    if isinstance(obj, pikepdf.Stream):
+        data = obj.read_raw_bytes()
+        digest.update(f'S{len(data)}\0'.encode())
+        digest.update(data)
+    if isinstance(obj, (pikepdf.Stream, pikepdf.Dictionary)):
+        keys = sorted(k for k in obj.keys() if k != '/Length')
+        digest.update(f'D{len(keys)}\0'.encode())
+        for key in keys:
+            digest.update(f'{key}\0'.encode())
+            hash_object(obj[key], digest, visited)
+    elif isinstance(obj, pikepdf.Array):
+        digest.update(f'A{len(obj)}\0'.encode())
+        for item in obj:
+            hash_object(item, digest, visited)
+    elif isinstance(obj, pikepdf.Object):
+        digest.update(obj.unparse() + b'\0')
+    else:
+        digest.update(f'{type(obj).__name__}:{obj}\0'.encode())
+
+
+def stream_key(stream):
+    """Identity of a stream's content: its raw bytes and dictionary (minus /Length), including referenced streams"""
+    digest = hashlib.sha256()
+    hash_object(stream, digest, {})
+    return digest.hexdigest()
+
+
+def iter_resources(pdf):
+    """Yield every resource dictionary: pages and the form XObjects they use"""
+    seen = set()
+    pending = [page.obj.get('/Resources') for page in pdf.pages]
+    while pending:
+        resources = pending.pop()
+        if not isinstance(resources, pikepdf.Dictionary):
+            continue
+        if resources.is_indirect:
+            if resources.objgen in seen:
+                continue
+            seen.add(resources.objgen)
+        yield resources
+        for xobject in (resources.get('/XObject') or {}).values():
+            if xobject.get('/Subtype') == '/Form':
+                pending.append(xobject.get('/Resources'))
+
+
+def dedupe_images_and_fonts(pdf):
+    """Point duplicate image XObjects and embedded font programs at one copy; returns (images, fonts) merged"""
+    canonical = {}
+    merged_images = merged_fonts = 0
+
+    for resources in iter_resources(pdf):
+        xobjects = resources.get('/XObject')
+        if isinstance(xobjects, pikepdf.Dictionary):
+            for name in list(xobjects.keys()):
+                xobject = xobjects[name]
+                if not isinstance(xobject, pikepdf.Stream) or xobject.get('/Subtype') != '/Image':
+                    continue
+                first = canonical.setdefault(stream_key(xobject), xobject)
+                if first.objgen != xobject.objgen:
+                    xobjects[name] = first
+                    merged_images += 1
+
+        fonts = resources.get('/Font')
+        if isinstance(fonts, pikepdf.Dictionary):
+            for font in fonts.values():
+                descriptors = [font.get('/FontDescriptor')]
+                descriptors += [f.get('/FontDescriptor') for f in (font.get('/DescendantFonts') or [])]
+                for descriptor in descriptors:
+                    if not isinstance(descriptor, pikepdf.Dictionary):
+                        continue
+                    for key in FONT_FILE_KEYS:
+                        program = descriptor.get(key)
+                        if not isinstance(program, pikepdf.Stream):
+                            continue
+                        first = canonical.setdefault(stream_key(program), program)
+                        if first.objgen != program.objgen:
+                            descriptor[key] = first
+                            merged_fonts += 1
+
+    return merged_images, merged_fonts
+
+
+def optimize_pdf(src, dest):
+    """Write an optimized, linearized copy of src to dest (runs in a worker); returns stats"""
+    src, dest = Path(src), Path(dest)
+    start = time.perf_counter()
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f'.{dest.name}.{os.getpid()}.tmp')
+    try:
+        with pikepdf.open(src) as pdf:
+            images, fonts = dedupe_images_and_fonts(pdf)
+            pdf.remove_unreferenced_resources()
+            pdf.save(tmp,
+                     linearize=True,
+                     compress_streams=True,
+                     recompress_flate=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate,
+                     deterministic_id=True)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return {
+        'images_merged': images,
+        'fonts_merged': fonts,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def cache_key(digest):
+    return hashlib.sha256(f'{digest}\0v{OPTIMIZE_VERSION}\0pikepdf={pikepdf.__version__}'.encode()).hexdigest()
+
+
+def optimize_all(pairs, jobs=None, store=None):
+    """Optimize each (src, dest) pair, reusing cached results
+
+    Returns a list of (src, dest, before, after, seconds, cached) in input order;
+    failures are reported and left out.
+    """
+    results = {}
+    to_run = {}
+    digests = file_digests(Path(src) for src, _ in pairs)
+    for src, dest in pairs:
+        src, dest = Path(src), Path(dest)
+        before = src.stat().st_size
+        key = cache_key(digests[src])
+        start = time.perf_counter()
+        if store and store.get_file(NAMESPACE, key, dest):
+            results[src] = (src, dest, before, dest.stat().st_size, time.perf_counter() - start, True)
+        else:
+            to_run[src] = (dest, before, key)
+
+    if to_run:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(optimize_pdf, src, dest): src for src, (dest, _, _) in to_run.items()}
+            for future in as_completed(futures):
+                src = futures[future]
+                dest, before, key = to_run[src]
+                try:
+                    stats = future.result()
+                except Exception as e:
+                    print(f"  Error optimizing {src}: {e}", file=sys.stderr)
+                    continue
+                if store:
+                    store.put_file(NAMESPACE, key, dest)
+                    # Optimizing an already optimized file is a no-op; remember that too
+                    store.put_file(NAMESPACE, cache_key(hash_file(dest)), dest)
+                results[src] = (src, dest, before, dest.stat().st_size, stats['seconds'], False)
+
+    return [results[Path(src)] for src, _ in pairs if Path(src) in results]
+
+
+def format_size(num_bytes):
+    for unit in ('B', 'K', 'M', 'G'):
+        if num_bytes < 1024 or unit == 'G':
+            return f'{num_bytes:.0f}{unit}' if unit == 'B' else f'{num_bytes:.1f}{unit}'
+        num_bytes /= 1024
+
+
+def print_report(results, root):
+    print(f"{'file':<60} {'before':>8} {'after':>8} {'saved':>7} {'time':>8}")
+    total_before = total_after = 0
+    for src, dest, before, after, seconds, cached in results:
+        total_before += before
+        total_after += after
+        try:
+            label = str(src.relative_to(root))
+        except ValueError:
+            label = str(src)
+        saved = f'{100 * (before - after) / before:.1f}%' if before else '-'
+        timing = 'cached' if cached else f'{seconds:.2f}s'
+        print(f"{label[-60:]:<60} {format_size(before):>8} {format_size(after):>8} {saved:>7} {timing:>8}")
+    if total_before:
+        print(f"{'total':<60} {format_size(total_before):>8} {format_size(total_after):>8} "
+              f"{100 * (total_before - total_after) / total_before:>6.1f}%")
+
+
+def main():
+    """Main function to optimize published PDFs."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Linearize and recompress published PDFs')
+    parser.add_argument('--issue', help='Issue directory whose main.pdf / main-print.pdf are optimized in place')
+    parser.add_argument('--archive', action='store_true', help='Optimize every archive PDF into --out')
+    parser.add_argument('--out', default=str(DEFAULT_ARCHIVE_OUT),
+                        help='Output directory for archive PDFs (default: website/public/pdfs)')
+    parser.add_argument('--issues-dir', default=str(ISSUES_DIR), help='Archive root (default: content/issues)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Worker processes (default: one per core)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not reuse or store cached results')
+
+    args = parser.parse_args()
+    if not args.issue and not args.archive:
+        parser.error('nothing to do: pass --issue DIR and/or --archive')
+
+    pairs = []
+    root = Path.cwd()
+    if args.issue:
+        for name in ('main.pdf', 'main-print.pdf'):
+            pdf_path = Path(args.issue) / name
+            if pdf_path.exists():
+                pairs.append((pdf_path, pdf_path))
+    if args.archive:
+        issues_dir = Path(args.issues_dir)
+        root = issues_dir
+        for issue_md, _, pdf_path in find_archive_pdfs(issues_dir):
+            pairs.append((pdf_path, Path(args.out) / pdf_path.relative_to(issues_dir)))
+
+    if not pairs:
+        print("No PDFs found to optimize.")
+        return
+
+    store = None if args.no_cache else open_store()
+    start = time.perf_counter()
+    results = optimize_all(pairs, args.jobs, store)
+    print_report(results, root)
+    print(f"\n✓ Optimized {len(results)} PDF(s) in {time.perf_counter() - start:.1f}s")
+    if len(results) < len(pairs):
+        print(f"✗ {len(pairs) - len(results)} PDF(s) failed")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
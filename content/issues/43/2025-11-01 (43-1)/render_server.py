@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Local render server for live article previews.
+
+Keeps one issue's inputs (config, articles, blurbs, events, horoscope) parsed
+in memory and re-reads a file only when its mtime or size changes, so a
+render costs little more than markdown_to_latex itself. Articles are read
+straight from articles/*.md (falling back to content/articles/*.yaml), so
+previews follow the editor without re-running generate_articles.py.
+
+Endpoints (mode=online|print, default online):
+    GET  /article/<name>?mode=print       LaTeX for one article
+    GET  /section/<section>?mode=print    toc, events, horoscope, letter, articles or directory
+    POST /markdown?name=draft&mode=print  LaTeX for the article markdown in the request body
+    GET  /metrics                         request counts and latency percentiles (JSON)
+    GET  /health
+
+Only the articles named in config.yaml (article_order and the letter from
+the chair) are served, and only the website's dev server origin
+(--allow-origin, default http://localhost:4321) may fetch renders from
+another page.
+
+Usage: python3 render_server.py vol43is1 [--port 8765]
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+import yaml
+
+from generate_articles import convert_to_yaml, parse_markdown_article
+from generate_newspaper import NewspaperGenerator
+
+# Latency samples kept per route for the percentiles in /metrics
+LATENCY_WINDOW = 1000
+
+# Largest article body POST /markdown accepts
+MAX_MARKDOWN_BYTES = 1 << 20
+
+# astro dev, where the draft preview pages fetch renders from
+DEFAULT_ALLOW_ORIGIN = 'http://localhost:4321'
+
+SECTION_METHODS = {
+    'toc': 'generate_toc_tex',
+    'events': 'generate_events_tex',
+    'horoscope': 'generate_horoscope_tex',
+    'letter': 'generate_letter_tex',
+    'articles': 'generate_articles_tex',
+    'directory': 'generate_directory_tex',
+}
+
+
+def load_yaml(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_name(name):
+    """Reject article names that are (or could become) paths"""
+    if not name or '/' in name or '\\' in name or '..' in name:
+        raise KeyError(f"article '{name}'")
+    return name
+
+
+def load_markdown_article(path):
+    """Parse an article's markdown the way generate_articles.py + yaml.safe_load would"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(convert_to_yaml(parse_markdown_article(f.read())))
+
+
+class InputCache:
+    """Parsed input files, re-parsed only when their mtime or size changes (thread-safe)"""
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.reloads = 0
+
+    def load(self, path, parse):
+        """Return parse(path), or None if the file does not exist"""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+        value = parse(path)
+        with self.lock:
+            self.entries[path] = (stamp, value)
+            self.reloads += 1
+        return value
+
+
+class WarmGenerator(NewspaperGenerator):
+    """NewspaperGenerator that reads its inputs through a shared InputCache
+
+    Instances are cheap (config comes from the cache), so the server builds
+    one per request and requests never share mutable generator state.
+    drafts maps article names to already-parsed articles that take the place
+    of the files on disk.
+    """
+
+    def __init__(self, base_dir, print_mode=False, inputs=None, drafts=None):
+        self.inputs = inputs if inputs is not None else InputCache()
+        self.drafts = drafts or {}
+        super().__init__(base_dir, print_mode=print_mode)
+
+    def load_config(self):
+        config = self.inputs.load(self.base_dir / 'config.yaml', load_yaml)
+        if config is None:
+            raise FileNotFoundError(f"No config.yaml in {self.base_dir}")
+        return config
+
+    def load_article(self, article_name):
+        if article_name in self.drafts:
+            return self.drafts[article_name]
+        source = self.base_dir / 'articles' / f'{article_name}.md'
+        generated = self.base_dir / 'content' / 'articles' / f'{article_name}.yaml'
+        try:
+            use_generated = generated.stat().st_mtime_ns >= source.stat().st_mtime_ns
+        except OSError:
+            use_generated = not source.exists()
+        if use_generated:
+            article = self.inputs.load(generated, load_yaml)
+            if article is None:
+                raise FileNotFoundError(f"No article named '{article_name}'")
+            return article
+        return self.inputs.load(source, load_markdown_article)
+
+    def load_blurb(self, org_name):
+        blurb_dir = self.base_dir / 'content' / 'blurb'
+        for name in (self.normalize_org_name(org_name), org_name):
+            blurb = self.inputs.load(blurb_dir / f'{name}.json', load_json)
+            if blurb is not None:
+                return blurb
+        return None
+
+    def load_events(self):
+        return self.inputs.load(self.base_dir / 'events.yaml', load_yaml) or {'events': []}
+
+    def load_horoscope(self):
+        return self.inputs.load(self.base_dir / 'horoscope.yaml', load_yaml) or {'horoscope': []}
+
+
+class LatencyStats:
+    """Per-route request counts and a sliding window of latencies"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.lock = threading.Lock()
+        self.counts = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.samples = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, route, seconds, ok):
+        with self.lock:
+            self.counts[route] += 1
+            if not ok:
+                self.errors[route] += 1
+            self.samples[route].append(seconds * 1000)
+
+    def snapshot(self):
+        with self.lock:
+            routes = {}
+            for route, samples in self.samples.items():
+                ordered = sorted(samples)
+                pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+                routes[route] = {
+                    'requests': self.counts[route],
+                    'errors': self.errors[route],
+                    'p50_ms': pick(0.50),
+                    'p95_ms': pick(0.95),
+                    'p99_ms': pick(0.99),
+                    'max_ms': round(ordered[-1], 3),
+                }
+            return routes
+
+
+class RenderServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, base_dir, allow_origin=DEFAULT_ALLOW_ORIGIN):
+        super().__init__(address, RenderHandler)
+        self.base_dir = Path(base_dir)
+        self.allow_origin = allow_origin
+        self.inputs = InputCache()
+        self.stats = LatencyStats()
+        self.started = time.time()
+
+    def generator(self, mode, drafts=None):
+        if mode not in ('online', 'print'):
+            raise ValueError(f"Unknown mode '{mode}' (use online or print)")
+        return WarmGenerator(self.base_dir, print_mode=mode == 'print', inputs=self.inputs, drafts=drafts)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = 'BanksRender/1.0'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type='text/plain; charset=utf-8'):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        # Draft pages on the website dev server fetch from a different port; nothing else may
+        if self.server.allow_origin and self.headers.get('Origin') == self.server.allow_origin:
+            self.send_header('Access-Control-Allow-Origin', self.server.allow_origin)
+            self.send_header('Vary', 'Origin')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def handle_request(self, method):
+        start = time.perf_counter()
+        url = urlparse(self.path)
+        parts = [unquote(p) for p in url.path.strip('/').split('/') if p]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        route = f"{method} /{parts[0] if parts else ''}"
+        status = 500
+        try:
+            status, body, content_type = self.dispatch(method, parts, query)
+        except (FileNotFoundError, KeyError) as e:
+            status, body, content_type = 404, f'Not found: {e}\n', 'text/plain; charset=utf-8'
+        except ValueError as e:
+            status, body, content_type = 400, f'{e}\n', 'text/plain; charset=utf-8'
+        except Exception as e:
+            body, content_type = f'Render failed: {type(e).__name__}: {e}\n', 'text/plain; charset=utf-8'
+        self.send_body(status, body, content_type)
+        if route != 'GET /metrics':
+            self.server.stats.record(route, time.perf_counter() - start, status < 400)
+
+    def dispatch(self, method, parts, query):
+        """Return (status, body, content type) for a request"""
+        mode = query.get('mode', 'online')
+        text = 'text/plain; charset=utf-8'
+
+        if method == 'GET' and parts == ['health']:
+            return 200, 'ok\n', text
+
+        if method == 'GET' and parts == ['metrics']:
+            metrics = {
+                'uptime_s': round(time.time() - self.server.started, 1),
+                'input_cache': {'files': len(self.server.inputs.entries),
+                                'hits': self.server.inputs.hits,
+                                'reloads': self.server.inputs.reloads},
+                'routes': self.server.stats.snapshot(),
+            }
+            return 200, json.dumps(metrics, indent=2) + '\n', 'application/json'
+
+        if method == 'GET' and len(parts) == 2 and parts[0] == 'article':
+            generator = self.server.generator(mode)
+            # Parts are URL-decoded, so '..%2F' would otherwise reach the filesystem
+            name = check_name(parts[1])
+            if name not in [generator.config.get('letter_from_the_chair')] + generator.config.get('article_order', []):
+                raise KeyError(f"article '{name}' is not in config.yaml")
+            generator.load_article(name)
+            tex = generator.render_article_tex(parts[1])
+            if tex is None:
+                raise ValueError(f"Article '{parts[1]}' is empty")
+            return 200, tex, text
+
+        if method == 'GET' and len(parts) == 2 and parts[0] == 'section':
+            if parts[1] not in SECTION_METHODS:
+                raise KeyError(f"section '{parts[1]}' (available: {', '.join(SECTION_METHODS)})")
+            generator = self.server.generator(mode)
+            return 200, getattr(generator, SECTION_METHODS[parts[1]])(), text
+
+        if method == 'POST' and parts == ['markdown']:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError('Bad Content-Length')
+            if length > MAX_MARKDOWN_BYTES:
+                self.close_connection = True
+                return 413, f'Article larger than {MAX_MARKDOWN_BYTES} bytes\n', text
+            markdown = self.rfile.read(length).decode('utf-8')
+            name = check_name(query.get('name', 'draft'))
+            article = yaml.safe_load(convert_to_yaml(parse_markdown_article(markdown)))
+            generator = self.server.generator(mode, drafts={name: article})
+            return 200, generator.render_article_tex(name) or '', text
+
+        raise KeyError(self.path)
+
+
+def main():
+    """Main function to run the render server."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Serve live LaTeX renders of a Banks of the Boneyard issue')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1")')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--allow-origin', default=DEFAULT_ALLOW_ORIGIN,
+                        help=f'Origin allowed to fetch renders cross-origin, "" for none (default: {DEFAULT_ALLOW_ORIGIN})')
+
+    args = parser.parse_args()
+
+    if not (Path(args.base_dir) / 'config.yaml').exists():
+        print(f"Error: {Path(args.base_dir) / 'config.yaml'} not found")
+        sys.exit(1)
+
+    server = RenderServer((args.host, args.port), args.base_dir, allow_origin=args.allow_origin)
+    print(f"Serving renders of {args.base_dir} on http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Typeset an issue as independent page ranges in parallel and merge the PDFs.
+
+main.tex is cut at the \\newpage before the horoscope and before the directory
+into three documents that share its preamble: front matter and articles,
+horoscope, and directory. Each round runs pdflatex on all three at once.
+Every part starts at \\setcounter{page}{N} from the page counts of the parts
+before it and reads the other parts' labels from the previous round, so the
+page numbers and the TOC's \\pageref{horoscope} / \\pageref{directory} come out
+as in a single-job build. Rounds repeat, like the passes of a normal build,
+until the page counts and labels stop changing (two rounds when the page
+counts of the last build still hold, three otherwise). The parts are then
+merged with pikepdf, keeping links, bookmarks and page labels working across
+them.
+
+Each part embeds its own font subsets, so the merged PDF is somewhat larger
+than a single-job build; make optimize merges what it can before publishing.
+
+Scratch files go to {base_dir}/content/split/ (kept only on failure), along
+with the page counts of the last build.
+
+Usage: python3 split_compile.py vol43is1 [--jobname main-print]
+       python3 split_compile.py vol43is1 --jobname split --compare vol43is1/main.pdf
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+
+import pikepdf
+
+SPLIT_DIR = Path('content') / 'split'
+
+# Sections that start a new part, in document order; everything before the first is the front part
+SPLIT_SECTIONS = ('horoscope', 'directory')
+FRONT_PART = 'front'
+
+MAX_ROUNDS = 4
+AUX_EXTENSIONS = ('.aux', '.log', '.out', '.toc')
+
+PAGE_BREAK_PATTERN = re.compile(r'^[ \t]*\\(?:newpage|clearpage)\b.*$', re.MULTILINE)
+COMMENT_PATTERN = re.compile(r'(?<!\\)%.*$', re.MULTILINE)
+ENVIRONMENT_PATTERN = re.compile(r'\\(begin|end)\{[^}]*\}')
+NEWLABEL_PATTERN = re.compile(r'^\\newlabel\{(.*?)\}\{(.*)\}\s*$')
+
+
+def can_split(base_dir):
+    """Whether the issue's main.tex has the page breaks compile_split cuts at"""
+    main_tex = Path(base_dir) / 'main.tex'
+    return main_tex.exists() and split_document(main_tex.read_text(encoding='utf-8')) is not None
+
+
+def section_input_pattern(section):
+    return re.compile(rf'^[ \t]*\\input\{{(?:\./)?content/{section}(?:\.tex)?\}}', re.MULTILINE)
+
+
+def environment_depth(tex):
+    """How many environments are still open at the end of tex"""
+    depth = 0
+    for kind in ENVIRONMENT_PATTERN.findall(COMMENT_PATTERN.sub('', tex)):
+        depth += 1 if kind == 'begin' else -1
+    return depth
+
+
+def split_document(main_tex):
+    """Cut main.tex into (preamble, [(part, body), ...]), or None if it has no usable page breaks
+
+    Each later part starts after the last top-level \\newpage before its
+    section's \\input; that page break is dropped since every part starts on
+    a fresh page anyway.
+    """
+    begin = main_tex.find('\\begin{document}')
+    end = main_tex.rfind('\\end{document}')
+    if begin < 0 or end < begin:
+        return None
+    preamble = main_tex[:begin]
+    body = main_tex[begin + len('\\begin{document}'):end]
+
+    parts, part, start = [], FRONT_PART, 0
+    for section in SPLIT_SECTIONS:
+        match = section_input_pattern(section).search(body, start)
+        if not match:
+            return None
+        breaks = [m for m in PAGE_BREAK_PATTERN.finditer(body, start, match.start())
+                  if environment_depth(body[:m.start()]) == 0]
+        if not breaks:
+            return None
+        parts.append((part, body[start:breaks[-1].start()]))
+        part, start = section, breaks[-1].end()
+    parts.append((part, body[start:]))
+    return preamble, parts
+
+
+def part_document(preamble, body, first_page, refs_path):
+    """A standalone document for one part, numbered from first_page, with the other parts' labels"""
+    return (f'{preamble}\\begin{{document}}\n'
+            f'\\setcounter{{page}}{{{first_page}}}\n'
+            f'\\makeatletter\\input{{./{refs_path.as_posix()}}}\\makeatother\n'
+            f'{body}\n'
+            f'\\end{{document}}\n')
+
+
+def split_groups(text):
+    """The top-level {...} groups of text, e.g. '{a}{{b}c}' -> ['a', '{b}c']"""
+    groups, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch == '{':
+            if depth == 0:
+                start = i + 1
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                groups.append(text[start:i])
+    return groups
+
+
+def read_labels(aux_path, prefix):
+    """\\newlabel lines from a part's .aux, with hyperref anchors renamed as in the merged PDF"""
+    if not aux_path.exists():
+        return []
+    labels = []
+    for line in aux_path.read_text(encoding='utf-8', errors='replace').splitlines():
+        match = NEWLABEL_PATTERN.match(line)
+        if not match:
+            continue
+        name, value = match.groups()
+        fields = split_groups(value)
+        # hyperref labels are {number}{page}{title}{anchor}{extra}
+        if len(fields) == 5 and fields[3]:
+            fields[3] = prefix + fields[3]
+            value = ''.join(f'{{{field}}}' for field in fields)
+        labels.append(f'\\newlabel{{{name}}}{{{value}}}')
+    return labels
+
+
+def first_pages(page_counts):
+    """Starting page number of each part"""
+    pages, next_page = [], 1
+    for count in page_counts:
+        pages.append(next_page)
+        next_page += count
+    return pages
+
+
+def anchor_prefix(part):
+    return f'{part}:'
+
+
+def compile_part(base_dir, job, env):
+    """Run pdflatex on one part; returns the PDF path, or None if pdflatex reported errors"""
+    split_dir = base_dir / SPLIT_DIR
+    pdf_path = split_dir / f'{job}.pdf'
+    pdf_path.unlink(missing_ok=True)
+    result = subprocess.run(['pdflatex', '-interaction=nonstopmode', f'-output-directory={SPLIT_DIR.as_posix()}',
+                             f'-jobname={job}', (SPLIT_DIR / f'{job}.tex').as_posix()],
+                            cwd=base_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # nonstopmode still writes a PDF after errors; it must not be merged into the issue
+    if result.returncode != 0:
+        pdf_path.unlink(missing_ok=True)
+        return None
+    return pdf_path if pdf_path.exists() else None
+
+
+def page_count(pdf_path):
+    with pikepdf.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def named_destinations(pdf):
+    """{name: destination} from the document's /Dests name tree"""
+    names = pdf.Root.get('/Names')
+    if names is None or '/Dests' not in names:
+        return {}
+    return dict(pikepdf.NameTree(names.Dests).items())
+
+
+def goto_target(action):
+    """The destination of a GoTo action, or None"""
+    if isinstance(action, pikepdf.Dictionary) and action.get('/S') == pikepdf.Name.GoTo:
+        return action.get('/D')
+    return None
+
+
+def rename_link_targets(pdf, own_names, prefix):
+    """Prefix named destinations that links in pdf point at within pdf itself"""
+    for page in pdf.pages:
+        for annot in page.obj.get('/Annots', []):
+            for holder, key in ((annot, '/Dest'), (annot.get('/A'), '/D')):
+                if holder is None or (holder is not annot and goto_target(holder) is None):
+                    continue
+                target = holder.get(key)
+                if isinstance(target, pikepdf.String) and str(target) in own_names:
+                    holder[key] = pikepdf.String(prefix + str(target))
+
+
+def copy_outline(items, own_names, prefix):
+    """Copies of outline items whose named destinations are renamed with prefix"""
+    copies = []
+    for item in items:
+        target = item.destination if item.destination is not None else goto_target(item.action)
+        destination = None
+        if isinstance(target, pikepdf.String) and str(target) in own_names:
+            destination = pikepdf.String(prefix + str(target))
+        copy = pikepdf.OutlineItem(item.title, destination)
+        copy.is_closed = item.is_closed
+        copy.children.extend(copy_outline(item.children, own_names, prefix))
+        copies.append(copy)
+    return copies
+
+
+def merge_parts(part_pdfs, out_path):
+    """Concatenate the part PDFs, keeping named destinations, bookmarks and page labels
+
+    part_pdfs is a list of (part, path). Destination names are prefixed with
+    the part name, matching the anchors read_labels hands to the other parts.
+    A reference into another part already carries that part's prefix, and
+    pdfTeX writes a placeholder destination for it into the referring part;
+    those are left to the part they name, so the links reach its pages.
+    """
+    with ExitStack() as stack:
+        merged = stack.enter_context(pikepdf.new())
+        # Stream data is copied when merged is saved, so every part stays open until then
+        pdfs = [stack.enter_context(pikepdf.open(path)) for _, path in part_pdfs]
+        destinations, outline, page_labels = {}, [], []
+        prefixes = [anchor_prefix(part) for part, _ in part_pdfs]
+        for (part, _), pdf in zip(part_pdfs, pdfs):
+            prefix = anchor_prefix(part)
+            others = tuple(other for other in prefixes if other != prefix)
+            own = {name: dest for name, dest in named_destinations(pdf).items() if not name.startswith(others)}
+            rename_link_targets(pdf, set(own), prefix)
+
+            start = len(merged.pages)
+            page_index = {page.obj.objgen: i for i, page in enumerate(pdf.pages)}
+            with warnings.catch_warnings():
+                # pikepdf warns that named destinations are not copied; they are rebuilt below
+                warnings.simplefilter('ignore')
+                merged.pages.extend(pdf.pages)
+
+            for name, dest in own.items():
+                array = dest.get('/D') if isinstance(dest, pikepdf.Dictionary) else dest
+                index = page_index.get(array[0].objgen) if isinstance(array, pikepdf.Array) and len(array) else None
+                if index is not None:
+                    destinations[prefix + name] = pikepdf.Array([merged.pages[start + index].obj, *list(array)[1:]])
+
+            with pdf.open_outline() as part_outline:
+                outline.extend(copy_outline(part_outline.root, set(own), prefix))
+
+            labels = pdf.Root.get('/PageLabels')
+            nums = list(labels.get('/Nums', [])) if labels is not None else []
+            if nums:
+                page_labels.extend((start + int(nums[i]), pikepdf.Dictionary(nums[i + 1]))
+                                   for i in range(0, len(nums) - 1, 2))
+            else:
+                page_labels.append((start, pikepdf.Dictionary(S=pikepdf.Name.D, St=start + 1)))
+
+        first = pdfs[0]
+        if destinations:
+            tree = pikepdf.NameTree.new(merged)
+            for name in sorted(destinations):
+                tree[name] = destinations[name]
+            merged.Root.Names = pikepdf.Dictionary(Dests=tree.obj)
+        if outline:
+            with merged.open_outline() as merged_outline:
+                merged_outline.root.extend(outline)
+        if any('/PageLabels' in pdf.Root for pdf in pdfs):
+            merged.Root.PageLabels = pikepdf.Dictionary(Nums=pikepdf.Array(
+                [value for pair in page_labels for value in pair]))
+        for key in ('/PageMode', '/PageLayout'):
+            if key in first.Root:
+                merged.Root[key] = first.Root[key]
+        if '/Info' in first.trailer:
+            merged.trailer.Info = merged.copy_foreign(first.trailer.Info)
+
+        tmp = out_path.with_name(f'.{out_path.name}.{os.getpid()}.tmp')
+        try:
+            merged.save(tmp, min_version=first.pdf_version, compress_streams=True,
+                        object_stream_mode=pikepdf.ObjectStreamMode.generate, deterministic_id=True)
+            os.replace(tmp, out_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    return out_path
+
+
+def destination_page(pdf, target, names, pages):
+    """Index of the page a destination (name or explicit array) points at, or None"""
+    if isinstance(target, (pikepdf.String, pikepdf.Name)):
+        target = names.get(str(target))
+    if isinstance(target, pikepdf.Dictionary):
+        target = target.get('/D')
+    if isinstance(target, pikepdf.Array) and len(target) and isinstance(target[0], pikepdf.Dictionary):
+        return pages.get(target[0].objgen)
+    return None
+
+
+def navigation(pdf_path):
+    """(page labels, [(outline title, page)], [(page, link target)]) of a PDF, to compare builds
+
+    Link targets are the page an internal link lands on or the URI of an
+    external one, so two builds compare equal when every label, bookmark and
+    link leads to the same page, however their destinations are named.
+    """
+    with pikepdf.open(pdf_path) as pdf:
+        pages = {page.obj.objgen: index for index, page in enumerate(pdf.pages)}
+        names = named_destinations(pdf)
+        labels = [page.label for page in pdf.pages]
+        outline = []
+        with pdf.open_outline() as tree:
+            pending = list(reversed(tree.root))
+            while pending:
+                item = pending.pop()
+                target = item.destination if item.destination is not None else goto_target(item.action)
+                outline.append((item.title, destination_page(pdf, target, names, pages)))
+                pending.extend(reversed(item.children))
+        links = []
+        for index, page in enumerate(pdf.pages):
+            for annot in page.obj.get('/Annots', []):
+                if annot.get('/Subtype') != pikepdf.Name.Link:
+                    continue
+                action = annot.get('/A')
+                if isinstance(action, pikepdf.Dictionary) and action.get('/S') == pikepdf.Name.URI:
+                    links.append((index, str(action.URI)))
+                else:
+                    target = annot.get('/Dest', goto_target(action))
+                    links.append((index, destination_page(pdf, target, names, pages)))
+        return labels, outline, links
+
+
+def compare_navigation(expected_pdf, actual_pdf):
+    """Differences in page labels, bookmarks and links between two builds (empty if none)"""
+    expected, actual = navigation(expected_pdf), navigation(actual_pdf)
+    differences = []
+    for what, a, b in zip(('page labels', 'bookmarks', 'links'), expected, actual):
+        if len(a) != len(b):
+            differences.append(f"{what}: {len(a)} in {Path(expected_pdf).name}, {len(b)} in {Path(actual_pdf).name}")
+            continue
+        for i, (x, y) in enumerate(zip(a, b)):
+            if x != y:
+                differences.append(f"{what} #{i + 1}: {x!r} != {y!r}")
+    return differences
+
+
+def compile_split(base_dir, jobname, epoch=0, metrics=None, max_rounds=MAX_ROUNDS):
+    """Compile main.tex as parallel parts merged into {jobname}.pdf; returns the PDF path or None
+
+    main.tex must be splittable (see can_split).
+    """
+    base_dir = Path(base_dir)
+    preamble, parts = split_document((base_dir / 'main.tex').read_text(encoding='utf-8'))
+    names = [part for part, _ in parts]
+    jobs = [f'{jobname}-{part}' for part in names]
+
+    split_dir = base_dir / SPLIT_DIR
+    split_dir.mkdir(parents=True, exist_ok=True)
+    pdf_path = base_dir / f'{jobname}.pdf'
+    pdf_path.unlink(missing_ok=True)
+
+    # Page counts of the last build, so the first round usually numbers pages right
+    counts_path = split_dir / f'{jobname}-pages.json'
+    try:
+        previous = json.loads(counts_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        previous = {}
+    counts = [previous.get(part, 0) for part in names]
+    for job in jobs:
+        (split_dir / f'{job}.aux').unlink(missing_ok=True)
+
+    env = dict(os.environ, SOURCE_DATE_EPOCH=str(epoch), FORCE_SOURCE_DATE='1')
+    pages_used = None
+    with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+        for round_number in range(1, max_rounds + 1):
+            pages = first_pages(counts)
+            labels = [read_labels(split_dir / f'{job}.aux', anchor_prefix(part)) for part, job in zip(names, jobs)]
+            for i, ((part, body), job) in enumerate(zip(parts, jobs)):
+                refs_path = SPLIT_DIR / f'{job}-refs.tex'
+                others = [line for j, part_labels in enumerate(labels) if j != i for line in part_labels]
+                (base_dir / refs_path).write_text(''.join(f'{line}\n' for line in others), encoding='utf-8')
+                (split_dir / f'{job}.tex').write_text(part_document(preamble, body, pages[i], refs_path),
+                                                      encoding='utf-8')
+
+            print(f"Compiling {jobname}.pdf as {len(parts)} parts (round {round_number})...")
+            start = time.perf_counter()
+            part_pdfs = list(executor.map(lambda job: compile_part(base_dir, job, env), jobs))
+            if metrics:
+                metrics.record_pdflatex_pass(time.perf_counter() - start)
+            if not all(part_pdfs):
+                failed = ', '.join(part for part, path in zip(names, part_pdfs) if path is None)
+                print(f"✗ pdflatex failed for {failed} (logs in {split_dir})")
+                return None
+
+            new_counts = [page_count(path) for path in part_pdfs]
+            # Labels from the last round are right once the first pages they were typeset with still hold
+            settled = round_number >= 2 and pages_used == pages and new_counts == counts
+            pages_used, counts = pages, new_counts
+            if settled:
+                break
+        else:
+            print(f"Warning: page numbers of {jobname}.pdf did not settle after {max_rounds} rounds")
+
+    merge_parts(list(zip(names, part_pdfs)), pdf_path)
+    counts_path.write_text(json.dumps(dict(zip(names, counts))), encoding='utf-8')
+    for job in jobs:
+        for suffix in ('.tex', '-refs.tex', '.pdf', *AUX_EXTENSIONS):
+            (split_dir / f'{job}{suffix}').unlink(missing_ok=True)
+    return pdf_path
+
+
+def main():
+    """Main function to compile an already generated issue in parallel parts."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compile an issue as parallel page ranges merged into one PDF')
+    parser.add_argument('base_dir', help='Issue directory (e.g., "vol43is1"), already generated')
+    parser.add_argument('--jobname', default='main', help='Output name (default: main)')
+    parser.add_argument('--compare', metavar='PDF',
+                        help='Single-job build of the same issue to check page labels, bookmarks and links against')
+    args = parser.parse_args()
+
+    if not can_split(args.base_dir):
+        print(f"✗ {args.base_dir}/main.tex has no \\newpage before the {' and '.join(SPLIT_SECTIONS)} to split at")
+        sys.exit(1)
+    start = time.perf_counter()
+    pdf_path = compile_split(args.base_dir, args.jobname)
+    if pdf_path is None:
+        print(f"✗ Split compilation failed for {args.base_dir}")
+        sys.exit(1)
+    print(f"✓ Compiled {pdf_path} in {time.perf_counter() - start:.1f}s")
+    if args.compare:
+        differences = compare_navigation(args.compare, pdf_path)
+        for difference in differences:
+            print(f"✗ {difference}")
+        if differences:
+            sys.exit(1)
+        print(f"✓ Page labels, bookmarks and links match {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
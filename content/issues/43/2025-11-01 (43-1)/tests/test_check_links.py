@@ -0,0 +1,186 @@
+"""check_links.py against a local aiohttp stub server"""
+
+import asyncio
+import json
+import time
+from collections import Counter
+
+import yaml
+from aiohttp import web
+
+from check_links import check_urls, run_link_check
+
+
+class StubServer:
+    """Serves the responses the checker has to classify and records concurrency per Host header"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.total_in_flight = 0
+        self.max_total_in_flight = 0
+        self.requests = []
+        self.retry_times = {}
+
+    async def track(self, request):
+        host = request.headers['Host']
+        self.requests.append((request.method, request.path))
+        self.in_flight[host] += 1
+        self.total_in_flight += 1
+        self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+        self.max_total_in_flight = max(self.max_total_in_flight, self.total_in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight[host] -= 1
+            self.total_in_flight -= 1
+
+    def app(self):
+        async def ok(request):
+            await self.track(request)
+            return web.Response(text='ok')
+
+        async def moved(request):
+            await self.track(request)
+            raise web.HTTPMovedPermanently('/ok')
+
+        async def missing(request):
+            await self.track(request)
+            return web.Response(status=404)
+
+        async def no_head(request):
+            await self.track(request)
+            return web.Response(status=405 if request.method == 'HEAD' else 200)
+
+        async def slow(request):
+            await self.track(request)
+            await asyncio.sleep(5)
+            return web.Response(text='too late')
+
+        async def limited_once(request):
+            # 429 the first time, then fine
+            await self.track(request)
+            self.retry_times.setdefault('once', []).append(time.monotonic())
+            if len(self.retry_times['once']) == 1:
+                return web.Response(status=429, headers={'Retry-After': '1'})
+            return web.Response(text='ok')
+
+        async def limited_always(request):
+            await self.track(request)
+            return web.Response(status=429, headers={'Retry-After': '3600'})
+
+        app = web.Application()
+        app.router.add_route('*', '/ok', ok)
+        app.router.add_route('*', '/moved', moved)
+        app.router.add_route('*', '/missing', missing)
+        app.router.add_route('*', '/no-head', no_head)
+        app.router.add_route('*', '/slow', slow)
+        app.router.add_route('*', '/limited-once', limited_once)
+        app.router.add_route('*', '/limited-always', limited_always)
+        app.router.add_route('*', '/page/{n}', ok)
+        return app
+
+
+async def serve(stub, check):
+    """Run check(base_url) with the stub listening on an ephemeral localhost port"""
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return await check(port)
+    finally:
+        await runner.cleanup()
+
+
+def run_checks(stub, paths, **kwargs):
+    async def check(port):
+        return await check_urls([f'http://127.0.0.1:{port}{path}' for path in paths], **kwargs)
+    results = asyncio.run(serve(stub, check))
+    return {url.split(':', 2)[2].split('/', 1)[1]: result for url, result in results.items()}
+
+
+def test_classifies_responses():
+    results = run_checks(StubServer(), ['/ok', '/moved', '/missing', '/no-head', '/slow'], timeout=1.0)
+
+    assert results['ok']['ok'] and results['ok']['method'] == 'HEAD' and results['ok']['status'] == 200
+    # Redirects are followed to the final status
+    assert results['moved']['ok'] and results['moved']['status'] == 200
+    # HEAD 404 is retried with GET, which confirms it
+    assert not results['missing']['ok'] and results['missing']['status'] == 404
+    assert results['missing']['method'] == 'GET'
+    # Servers that refuse HEAD are checked with GET
+    assert results['no-head']['ok'] and results['no-head']['method'] == 'GET'
+    # Timeouts are broken, with the error recorded instead of a status
+    assert not results['slow']['ok'] and results['slow']['status'] is None
+    assert 'Timeout' in results['slow']['error']
+
+
+def test_retry_after_is_honoured_once():
+    stub = StubServer()
+    results = run_checks(stub, ['/limited-once', '/limited-always'], timeout=5.0, max_retry_after=2.0)
+
+    assert results['limited-once']['ok'] and results['limited-once']['status'] == 200
+    first, second = stub.retry_times['once'][:2]
+    assert second - first >= 0.9
+    # A Retry-After longer than max_retry_after is not waited for: the link is reported with its 429
+    assert not results['limited-always']['ok'] and results['limited-always']['status'] == 429
+
+
+def test_per_host_limit():
+    stub = StubServer(delay=0.2)
+    paths = [f'/page/{n}' for n in range(12)]
+    start = time.monotonic()
+    results = run_checks(stub, paths, per_host=3, total=32)
+    elapsed = time.monotonic() - start
+
+    assert all(result['ok'] for result in results.values())
+    assert max(stub.max_in_flight.values()) == 3
+    # 12 requests, 3 at a time, 0.2s each: concurrent, but not all at once
+    assert 0.75 < elapsed < 12 * 0.2
+
+
+def test_total_limit_across_hosts():
+    stub = StubServer(delay=0.2)
+
+    async def check(port):
+        # 127.0.0.1 and localhost are separate hosts to the connection pool
+        urls = [f'http://{host}:{port}/page/{n}' for host in ('127.0.0.1', 'localhost') for n in range(6)]
+        return await check_urls(urls, per_host=10, total=4)
+    results = asyncio.run(serve(stub, check))
+
+    assert all(result['ok'] for result in results.values())
+    assert stub.max_total_in_flight == 4
+    assert len(stub.max_in_flight) == 2
+
+
+def test_issue_links_are_collected_and_cached(tmp_path):
+    stub = StubServer()
+
+    async def check(port):
+        base = f'http://127.0.0.1:{port}'
+        articles = tmp_path / 'content' / 'articles'
+        blurbs = tmp_path / 'content' / 'blurb'
+        articles.mkdir(parents=True)
+        blurbs.mkdir(parents=True)
+        (articles / 'news.yaml').write_text(yaml.safe_dump(
+            {'content': f'See [the site]({base}/ok) and {base}/missing.'}))
+        (blurbs / 'sig.json').write_text(json.dumps(
+            {'website': f'{base}/moved', 'links': {'discord': f'{base}/ok'}, 'blurb': ''}))
+
+        loop = asyncio.get_running_loop()
+        first = await loop.run_in_executor(None, run_link_check, tmp_path)
+        second = await loop.run_in_executor(None, run_link_check, tmp_path)
+        return base, first, second
+    base, (results, sources, cached), (_, _, cached_again) = asyncio.run(serve(stub, check))
+
+    # Markdown and bare URLs are both found; the article URL and the directory link share one check
+    assert sorted(sources) == [f'{base}/missing', f'{base}/moved', f'{base}/ok']
+    assert sources[f'{base}/ok'] == ['articles/news', 'blurb/sig']
+    assert not results[f'{base}/missing']['ok']
+    assert cached == 0
+    # Working links come from the cache on the next run; the broken one is checked again
+    assert cached_again == 2
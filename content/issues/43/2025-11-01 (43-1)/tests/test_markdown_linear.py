@@ -0,0 +1,78 @@
+"""markdown_to_latex stays linear on adversarial input and matches the regexes it replaced"""
+
+import random
+import re
+import time
+
+import pytest
+
+from generate_newspaper import NewspaperGenerator, sub_bracket_links
+from markdown_corpus import ADVERSARIAL_MARKDOWN, MAX_GROWTH, SAMPLE_ARTICLES, SAMPLE_ISSUE, adversarial_markdown
+
+# The patterns markdown_to_latex used before sub_bracket_links
+ORIGINAL_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+ORIGINAL_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+SIZES = [64 * 1024, 128 * 1024, 256 * 1024]
+
+
+def sample_texts():
+    texts = [adversarial_markdown(unit, 4096) for unit in ADVERSARIAL_MARKDOWN.values()]
+    for path in sorted((SAMPLE_ISSUE / 'articles').glob('*.md')) + sorted(SAMPLE_ARTICLES.rglob('*.md')):
+        texts.append(path.read_text(encoding='utf-8'))
+    # Short random strings over the characters the patterns care about hit the edge cases
+    rng = random.Random(0)
+    texts += [''.join(rng.choice('![]()a \n') for _ in range(rng.randint(0, 40))) for _ in range(5000)]
+    return texts
+
+
+def best_time(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def tagged(label, target):
+    return f'<{label}|{target}>'
+
+
+@pytest.fixture(scope='module')
+def generator():
+    return NewspaperGenerator(SAMPLE_ISSUE)
+
+
+def test_images_match_original_regex():
+    for text in sample_texts():
+        expected = ORIGINAL_IMAGE_PATTERN.sub(lambda m: tagged(m.group(1), m.group(2)), text)
+        assert sub_bracket_links(text, tagged, prefix='!', allow_empty_label=True) == expected, repr(text)
+
+
+def test_links_match_original_regex():
+    for text in sample_texts():
+        expected = ORIGINAL_LINK_PATTERN.sub(lambda m: tagged(m.group(1), m.group(2)), text)
+        assert sub_bracket_links(text, tagged) == expected, repr(text)
+
+
+def test_images_then_links_match_original_regexes():
+    # markdown_to_latex takes images out first, then links
+    for text in sample_texts():
+        expected = ORIGINAL_IMAGE_PATTERN.sub(lambda m: tagged('!' + m.group(1), m.group(2)), text)
+        expected = ORIGINAL_LINK_PATTERN.sub(lambda m: tagged(m.group(1), m.group(2)), expected)
+        actual = sub_bracket_links(text, lambda label, target: tagged('!' + label, target),
+                                   prefix='!', allow_empty_label=True)
+        assert sub_bracket_links(actual, tagged) == expected, repr(text)
+
+
+@pytest.mark.parametrize('name', list(ADVERSARIAL_MARKDOWN))
+def test_adversarial_input_is_linear(generator, name):
+    times = []
+    for size in SIZES:
+        text = adversarial_markdown(ADVERSARIAL_MARKDOWN[name], size)
+        times.append(best_time(lambda: generator.markdown_to_latex(text, is_article=True), 5))
+    # Growth per doubling over the whole range (timings floored at 1ms as in benchmark.py):
+    # small inputs are noisy, so a single doubling is too jumpy for a test that must not flake
+    growth = (max(times[-1], 1e-3) / max(times[0], 1e-3)) ** (1 / (len(times) - 1))
+    assert growth < MAX_GROWTH, f'{name}: {[f"{t * 1000:.1f}ms" for t in times]}'
@@ -29,6 +29,7 @@ export default function Navbar() {
         <a href="/articles?tag=deep-dives">Deep Dives</a>
         <a href="/articles?tag=life">Campus + Life</a>
         <a href="/articles?tag=fun">Fun</a>
+        <a href="/search">Search</a>
         <a href="/about">About</a>
       </nav>
       <span className="w-full">
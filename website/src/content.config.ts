@@ -11,7 +11,9 @@ const ImageObject = (image: ImageFunction) => (
 
 export const collections = {
   articles: defineCollection({
-    loader: glob({ pattern: '**/*.md', base: '../content/articles' }),
+    // .json entries are pre-rendered by the issue pipeline (export_website.py) and skip markdown parsing;
+    // they live in their own tree so their ids never collide with a same-named .md article
+    loader: glob({ pattern: '{articles/**/*.md,articles-json/**/*.json}', base: '../content' }),
     schema: ({ image }) => z.object({
       // optional volume, issue for online-only articles or articles that are not yet published in an issue
       volume: z.optional(z.coerce.number().int().positive()).describe("Volume number where the article was first published"),
@@ -24,6 +26,7 @@ export const collections = {
       image: z.optional(ImageObject(image)).describe("Cover image for the article"),
       tags: z.optional(z.array(z.coerce.string())).describe("Tags or categories for the article"),
       slug: z.optional(z.coerce.string().regex(/^[a-z0-9]+(?:-[a-z0-9]+)*$/)).describe("Custom URL slug for the article (lowercase letters, numbers, hyphens only)"),
+      html: z.optional(z.string()).describe("Pre-rendered article body (set by the issue export pipeline for .json entries)"),
     }),
   }),
 
@@ -0,0 +1,105 @@
+// Client for the sharded search index built by the issue pipeline
+// (content/issues/43/2025-11-01 (43-1)/build_search_index.py) into public/search/.
+// Only index.json, the shards for the query's term prefixes and the document
+// chunks holding the results are fetched.
+
+export interface SearchDocument {
+  title: string;
+  url: string;
+  kind: "article" | "issue" | "issue-article";
+  date: string | null;
+  volume: number | null;
+  issue: string | null;
+  snippet: string;
+}
+
+interface SearchIndex {
+  version: number;
+  prefix_length: number;
+  stopwords: string[];
+  document_count: number;
+  doc_chunk_size: number;
+  doc_chunks: string[];
+  shards: Record<string, string>;
+}
+
+type Shard = Record<string, number[]>;
+type DocChunk = (SearchDocument | null)[];
+
+const BASE_URL = "/search";
+
+let indexPromise: Promise<SearchIndex> | null = null;
+const filePromises = new Map<string, Promise<unknown>>();
+
+function loadIndex(): Promise<SearchIndex> {
+  indexPromise ??= fetch(`${BASE_URL}/index.json`).then((response) => response.json());
+  return indexPromise;
+}
+
+async function gunzipJson(response: Response): Promise<unknown> {
+  const bytes = new Uint8Array(await response.arrayBuffer());
+  // Some hosts already decode .gz files (Content-Encoding: gzip); only inflate real gzip data
+  if (bytes[0] !== 0x1f || bytes[1] !== 0x8b) {
+    return JSON.parse(new TextDecoder().decode(bytes));
+  }
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+  return JSON.parse(await new Response(stream).text());
+}
+
+// Shards and document chunks are content-hashed, so each name is fetched at most once
+function loadFile<T>(name: string): Promise<T> {
+  let file = filePromises.get(name);
+  if (!file) {
+    file = fetch(`${BASE_URL}/${name}`).then(gunzipJson);
+    filePromises.set(name, file);
+  }
+  return file as Promise<T>;
+}
+
+export function tokenize(text: string, stopwords: Set<string>): string[] {
+  const folded = text.normalize("NFKD").replace(/[^\x00-\x7f]/g, "").toLowerCase();
+  return (folded.match(/[a-z0-9]+/g) ?? []).filter((term) => term.length > 1 && !stopwords.has(term));
+}
+
+function decodePostings(flat: number[]): [number, number][] {
+  const postings: [number, number][] = [];
+  let docId = 0;
+  for (let i = 0; i < flat.length; i += 2) {
+    docId += flat[i];
+    postings.push([docId, flat[i + 1]]);
+  }
+  return postings;
+}
+
+// Same ranking as search() in build_search_index.py; the last term also matches as a prefix
+export async function search(query: string, limit = 10): Promise<{ score: number; document: SearchDocument }[]> {
+  const index = await loadIndex();
+  const terms = tokenize(query, new Set(index.stopwords));
+  const total = index.document_count || 1;
+
+  const shardNames = terms.map((term) => index.shards[term.slice(0, index.prefix_length)]);
+  const shards = await Promise.all(shardNames.map((name) => (name ? loadFile<Shard>(name) : Promise.resolve({} as Shard))));
+
+  const scores = new Map<number, number>();
+  terms.forEach((term, position) => {
+    const shard = shards[position];
+    const isLast = position === terms.length - 1;
+    const matches = isLast ? Object.keys(shard).filter((t) => t.startsWith(term)) : [term];
+    for (const match of matches) {
+      const postings = decodePostings(shard[match] ?? []);
+      if (postings.length === 0) continue;
+      const idf = Math.log(1 + total / postings.length);
+      for (const [docId, tf] of postings) {
+        scores.set(docId, (scores.get(docId) ?? 0) + (1 + Math.log(tf)) * idf);
+      }
+    }
+  });
+
+  const top = [...scores.entries()].sort((a, b) => b[1] - a[1] || a[0] - b[0]).slice(0, limit);
+  return Promise.all(
+    top.map(async ([docId, score]) => {
+      const chunk = await loadFile<DocChunk>(index.doc_chunks[Math.floor(docId / index.doc_chunk_size)]);
+      return { score, document: chunk[docId % index.doc_chunk_size] as SearchDocument };
+    }),
+  );
+}